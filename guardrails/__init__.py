@@ -1,17 +1,56 @@
 # Set up __init__.py so that users can do from guardrails import Response, Schema, etc.
+from typing import TYPE_CHECKING
 
-from guardrails.guard import Guard
-from guardrails.async_guard import AsyncGuard
-from guardrails.llm_providers import PromptCallableBase
-from guardrails.logging_utils import configure_logging
-from guardrails.prompt import Instructions, Prompt, Messages
-from guardrails.utils import constants, docs_utils
-from guardrails.types.on_fail import OnFailAction
-from guardrails.validator_base import Validator, register_validator
+# These exports share their names with submodules of this package,
+#   so they are bound eagerly to keep the submodule import from
+#   shadowing them later. Both are cheap to import.
+import guardrails.constants  # noqa: F401
 from guardrails.settings import settings
-from guardrails.hub.install import install
-from guardrails.classes.validation_outcome import ValidationOutcome
-from guardrails.utils.prompt_utils import messages_to_prompt_string
+from guardrails.utils import constants
+from guardrails.utils.lazy_import_utils import LazyImports
+
+if TYPE_CHECKING:
+    from guardrails.guard import Guard
+    from guardrails.async_guard import AsyncGuard
+    from guardrails.llm_providers import PromptCallableBase
+    from guardrails.logging_utils import configure_logging
+    from guardrails.prompt import Instructions, Prompt, Messages
+    from guardrails.utils import docs_utils
+    from guardrails.types.on_fail import OnFailAction
+    from guardrails.validator_base import Validator, register_validator
+    from guardrails.hub.install import install
+    from guardrails.classes.validation_outcome import ValidationOutcome
+    from guardrails.utils.prompt_utils import messages_to_prompt_string
+
+# Everything else is imported on first access so that `import guardrails`
+#   (and importing submodules like `guardrails.validator_base`) does not
+#   pay for litellm, langchain_core, the OpenTelemetry SDK, etc.
+_lazy = LazyImports(
+    globals(),
+    {
+        "Guard": ("guardrails.guard", "Guard"),
+        "AsyncGuard": ("guardrails.async_guard", "AsyncGuard"),
+        "PromptCallableBase": ("guardrails.llm_providers", "PromptCallableBase"),
+        "configure_logging": ("guardrails.logging_utils", "configure_logging"),
+        "Instructions": ("guardrails.prompt", "Instructions"),
+        "Prompt": ("guardrails.prompt", "Prompt"),
+        "Messages": ("guardrails.prompt", "Messages"),
+        "docs_utils": ("guardrails.utils.docs_utils", None),
+        "OnFailAction": ("guardrails.types.on_fail", "OnFailAction"),
+        "Validator": ("guardrails.validator_base", "Validator"),
+        "register_validator": ("guardrails.validator_base", "register_validator"),
+        "install": ("guardrails.hub.install", "install"),
+        "ValidationOutcome": (
+            "guardrails.classes.validation_outcome",
+            "ValidationOutcome",
+        ),
+        "messages_to_prompt_string": (
+            "guardrails.utils.prompt_utils",
+            "messages_to_prompt_string",
+        ),
+    },
+)
+__getattr__ = _lazy.module_getattr
 
 __all__ = [
     "Guard",
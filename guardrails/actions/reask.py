@@ -1,6 +1,20 @@
+from collections import OrderedDict
 from copy import deepcopy
 import json
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from guardrails_api_client import Reask as IReask
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
@@ -13,6 +27,10 @@ from guardrails.schema.generator import generate_example
 from guardrails.schema.rail_schema import json_schema_to_rail_output
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.constants import constants
+from guardrails.utils.fingerprint_utils import (
+    json_fingerprint,
+    validator_map_fingerprint,
+)
 from guardrails.utils.prompt_utils import prompt_content_for_schema, prompt_uses_xml
 
 
@@ -101,6 +119,78 @@ class NonParseableReAsk(ReAsk):
     pass
 
 
+class ReaskSchema(NamedTuple):
+    """The parts of a reask prompt that only depend on the output schema,
+    the validators and the fields being reasked for.
+
+    These are shared between calls, so they must not be modified.
+    """
+
+    schema: Dict[str, Any]
+    stringified_schema: str
+    xml_output_schema: str
+    json_example: Optional[str] = None
+
+
+REASK_SCHEMA_CACHE_SIZE = 128
+
+
+class ReaskSchemaCache:
+    """A least recently used cache of `ReaskSchema`s.
+
+    Rendering a large schema, as JSON, as RAIL and as an example, costs
+    far more than the rest of a reask prompt; and a Guard renders the
+    same schema again on every reask of every call.
+    """
+
+    def __init__(self, maxsize: int = REASK_SCHEMA_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Hashable, ReaskSchema]" = OrderedDict()
+
+    @staticmethod
+    def key(
+        output_type: OutputTypes,
+        output_schema: Dict[str, Any],
+        validation_map: ValidatorMap,
+        field_paths: Optional[FrozenSet[Tuple[Any, ...]]] = None,
+    ) -> Hashable:
+        """Identify a reask schema by the output schema and validators it
+        is rendered from, and the paths of the fields being reasked for
+        (None for the whole schema)."""
+        return (
+            output_type,
+            json_fingerprint(output_schema),
+            validator_map_fingerprint(validation_map),
+            field_paths,
+        )
+
+    def get(self, key: Hashable, render: Callable[[], ReaskSchema]) -> ReaskSchema:
+        """Get the reask schema for `key`, rendering it on a miss."""
+        with self._lock:
+            reask_schema = self._cache.get(key)
+            if reask_schema is not None:
+                self._cache.move_to_end(key)
+                return reask_schema
+
+        # Render outside of the lock; two threads racing on a miss render
+        #   the same thing.
+        reask_schema = render()
+        with self._lock:
+            self._cache[key] = reask_schema
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return reask_schema
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+reask_schema_cache = ReaskSchemaCache()
+
+
 ### Internal Helper Methods ###
 def get_reask_subschema(
     json_schema: Dict[str, Any],
@@ -251,12 +341,20 @@ def get_reask_setup_for_string(
     prompt_params = prompt_params or {}
     exec_options = exec_options or GuardExecutionOptions()
 
-    schema_prompt_content = prompt_content_for_schema(
-        output_type, output_schema, validation_map
-    )
-    xml_output_schema = json_schema_to_rail_output(
-        json_schema=output_schema, validator_map=validation_map
+    reask_schema = reask_schema_cache.get(
+        reask_schema_cache.key(output_type, output_schema, validation_map),
+        lambda: ReaskSchema(
+            schema=output_schema,
+            stringified_schema=prompt_content_for_schema(
+                output_type, output_schema, validation_map
+            ),
+            xml_output_schema=json_schema_to_rail_output(
+                json_schema=output_schema, validator_map=validation_map
+            ),
+        ),
     )
+    schema_prompt_content = reask_schema.stringified_schema
+    xml_output_schema = reask_schema.xml_output_schema
 
     reask_prompt_template = None
 
@@ -338,7 +436,8 @@ def get_reask_setup_for_json(
     prompt_params: Optional[Dict[str, Any]] = None,
     exec_options: Optional[GuardExecutionOptions] = None,
 ) -> Tuple[Dict[str, Any], Messages]:
-    reask_schema = output_schema
+    field_reasks: List[FieldReAsk] = []
+    field_paths = None
     is_skeleton_reask = not any(isinstance(reask, FieldReAsk) for reask in reasks)
     is_nonparseable_reask = any(
         isinstance(reask, NonParseableReAsk) for reask in reasks
@@ -404,7 +503,7 @@ def get_reask_setup_for_json(
 
             # Generate a subschema that matches the specific fields we're reasking for.
             field_reasks = [r for r in reasks if isinstance(r, FieldReAsk)]
-            reask_schema = get_reask_subschema(output_schema, field_reasks)
+            field_paths = frozenset(tuple(r.path or ()) for r in field_reasks)
 
         if reask_prompt_template is None:
             suffix = (
@@ -424,16 +523,28 @@ def get_reask_setup_for_json(
             if isinstance(r, FieldReAsk)
         }
 
-    stringified_schema = prompt_content_for_schema(
-        output_type, reask_schema, validation_map
-    )
-    xml_output_schema = json_schema_to_rail_output(
-        json_schema=output_schema, validator_map=validation_map
-    )
+    def render_reask_schema() -> ReaskSchema:
+        reask_schema = output_schema
+        if field_paths is not None:
+            reask_schema = get_reask_subschema(output_schema, field_reasks)
+        return ReaskSchema(
+            schema=reask_schema,
+            stringified_schema=prompt_content_for_schema(
+                output_type, reask_schema, validation_map
+            ),
+            xml_output_schema=json_schema_to_rail_output(
+                json_schema=output_schema, validator_map=validation_map
+            ),
+            json_example=json.dumps(generate_example(reask_schema), indent=2),
+        )
 
-    json_example = json.dumps(
-        generate_example(reask_schema),
-        indent=2,
+    reask_schema, stringified_schema, xml_output_schema, json_example = (
+        reask_schema_cache.get(
+            reask_schema_cache.key(
+                output_type, output_schema, validation_map, field_paths
+            ),
+            render_reask_schema,
+        )
     )
 
     def reask_decoder(obj: ReAsk):
@@ -668,3 +779,69 @@ def merge_reask_output(previous_response, reask_response) -> Dict:
     update_reasked_elements(pruned_reask_json, reask_response)
 
     return merged_json
+
+
+def group_field_reasks(reasks: Sequence[ReAsk]) -> List[List[FieldReAsk]]:
+    """Group field reasks by the top level key they are under.
+
+    Fields under different keys are independent of each other, so each
+    group can be reasked for on its own. Returns no groups unless every
+    reask is a FieldReAsk.
+    """
+    groups: Dict[Any, List[FieldReAsk]] = {}
+    for reask in reasks:
+        if not isinstance(reask, FieldReAsk) or not reask.path:
+            return []
+        groups.setdefault(reask.path[0], []).append(reask)
+    return list(groups.values())
+
+
+def get_reask_group_subschema(
+    json_schema: Dict[str, Any], reask_group: Sequence[FieldReAsk]
+) -> Optional[Dict[str, Any]]:
+    """Prune an object schema to the top level keys of a group of field
+    reasks.
+
+    Returns None if the schema does not describe an object with those keys.
+    """
+    properties = json_schema.get("properties")
+    keys = {reask.path[0] for reask in reask_group if reask.path}
+    if not isinstance(properties, dict) or not keys.issubset(properties):
+        return None
+    return {
+        **json_schema,
+        "properties": {
+            key: subschema for key, subschema in properties.items() if key in keys
+        },
+        "required": [key for key in json_schema.get("required", []) if key in keys],
+    }
+
+
+def merge_reask_group_output(
+    previous_response: Dict, reask_group: Sequence[FieldReAsk], reask_response: Any
+) -> Dict:
+    """Merge the reask output for one group of field reasks into the
+    original output.
+
+    Only the keys the group is under are merged, as the reask was only
+    for their fields. If the reask output could not be parsed or did not
+    match the schema, the group's fields are left as they were.
+
+    Args:
+        previous_response: validation output object from the previous iteration.
+        reask_group: the field reasks that were reasked for.
+        reask_response: validation output object from the group's reask.
+
+    Returns:
+        The merged output.
+    """
+    if not isinstance(reask_response, dict):
+        return previous_response
+
+    keys = {reask.path[0] for reask in reask_group if reask.path}
+    keys = [key for key in keys if key in previous_response and key in reask_response]
+    merged_json = merge_reask_output(
+        {key: previous_response[key] for key in keys},
+        {key: reask_response[key] for key in keys},
+    )
+    return {**previous_response, **merged_json}
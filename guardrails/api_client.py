@@ -1,6 +1,10 @@
+import asyncio
 import json
 import os
-from typing import Any, Iterator, Optional
+import threading
+from contextlib import suppress
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
 
 import requests
 from guardrails_api_client.configuration import Configuration
@@ -18,6 +22,32 @@ from guardrails.errors import ValidationError
 
 from guardrails.logger import logger
 
+_lock = threading.Lock()
+# Clients for the same server share their connection pools,
+#   instead of each Guard opening its own connections.
+_shared_api_clients: Dict[Tuple[str, str], ApiClient] = {}
+_shared_sessions: Dict[str, requests.Session] = {}
+
+
+def get_shared_api_client(base_url: str, api_key: str) -> ApiClient:
+    with _lock:
+        api_client = _shared_api_clients.get((base_url, api_key))
+        if api_client is None:
+            api_client = ApiClient(
+                configuration=Configuration(api_key=api_key, host=base_url)
+            )
+            _shared_api_clients[(base_url, api_key)] = api_client
+        return api_client
+
+
+def get_shared_session(base_url: str) -> requests.Session:
+    with _lock:
+        session = _shared_sessions.get(base_url)
+        if session is None:
+            session = requests.Session()
+            _shared_sessions[base_url] = session
+        return session
+
 
 class GuardrailsApiClient:
     _api_client: ApiClient
@@ -37,9 +67,7 @@ class GuardrailsApiClient:
             api_key if api_key is not None else os.environ.get("GUARDRAILS_API_KEY", "")
         )
         self.timeout = 300
-        self._api_client = ApiClient(
-            configuration=Configuration(api_key=self.api_key, host=self.base_url)
-        )
+        self._api_client = get_shared_api_client(self.base_url, self.api_key)
         self._guard_api = GuardApi(self._api_client)
         self._validate_api = ValidateApi(self._api_client)
 
@@ -93,7 +121,7 @@ class GuardrailsApiClient:
             "x-openai-api-key": _openai_api_key,
         }
 
-        s = requests.Session()
+        s = get_shared_session(self.base_url)
 
         with s.post(url, json=payload.to_dict(), headers=headers, stream=True) as resp:
             for line in resp.iter_lines():
@@ -110,3 +138,37 @@ class GuardrailsApiClient:
 
     def get_history(self, guard_name: str, call_id: str):
         return self._guard_api.get_guard_history(guard_name, call_id)
+
+    # The async methods run the pooled requests on the event loop's executor,
+    #   so that waiting on the server does not block the loop.
+    async def async_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.validate, guard, payload, openai_api_key)
+        )
+
+    async def async_stream_validate(
+        self,
+        guard: Guard,
+        payload: ValidatePayload,
+        openai_api_key: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        fragments = self.stream_validate(guard, payload, openai_api_key)
+        done = object()
+        try:
+            while True:
+                fragment = await loop.run_in_executor(None, next, fragments, done)
+                if fragment is done:
+                    break
+                yield fragment
+        finally:
+            # Release the connection back to the pool
+            #   if the stream is not consumed to the end.
+            with suppress(ValueError):  # Still being read on the executor
+                fragments.close()
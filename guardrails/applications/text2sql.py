@@ -2,8 +2,9 @@ import asyncio
 import json
 import os
 import openai
+from collections import OrderedDict
 from string import Template
-from typing import Callable, Dict, Optional, Type, cast
+from typing import Callable, Dict, List, Optional, Type, cast
 
 from guardrails.classes import ValidationOutcome
 from guardrails.document_store import DocumentStoreBase, EphemeralDocumentStore
@@ -58,6 +59,12 @@ def example_formatter(
     return example
 
 
+def normalize_question(question: str) -> str:
+    """Normalize a question so that trivially different phrasings (case,
+    surrounding and repeated whitespace) share one cache entry."""
+    return " ".join(question.split()).casefold()
+
+
 class Text2Sql:
     def __init__(
         self,
@@ -79,6 +86,7 @@ class Text2Sql:
         llm_api: Optional[Callable] = None,
         llm_api_kwargs: Optional[Dict] = None,
         num_relevant_examples: int = 2,
+        example_cache_size: int = 128,
     ):
         """Initialize the text2sql application.
 
@@ -92,6 +100,11 @@ class Text2Sql:
             rail_spec: Path to the rail specification. Defaults to "text2sql.rail".
             example_formatter: Fn to format examples. Defaults to example_formatter.
             reask_prompt: Prompt to use for reasking. Defaults to REASK_PROMPT.
+            num_relevant_examples: Number of examples to retrieve per question.
+                Defaults to 2.
+            example_cache_size: Maximum number of retrieved example blocks to
+                keep, keyed by normalized question. Set to 0 to disable the
+                cache. Defaults to 128.
         """
         if llm_api is None:
             llm_api = openai.completions.create
@@ -103,10 +116,17 @@ class Text2Sql:
         # Initialize the SQL driver.
         self.sql_driver = create_sql_driver(conn=conn_str, schema_file=schema_file)
         self.sql_schema = self.sql_driver.get_schema()
+        # The schema never changes for the lifetime of the application,
+        # so render the prompt block once instead of on every call.
+        self._db_info = str(self.sql_schema)
 
         # Number of relevant examples to use for the LLM.
         self.num_relevant_examples = num_relevant_examples
 
+        # LRU cache of formatted example blocks, keyed by normalized question.
+        self.example_cache_size = example_cache_size
+        self._example_cache: OrderedDict[str, str] = OrderedDict()
+
         # Initialize the Guard class.
         self.guard = self._init_guard(
             conn_str,
@@ -180,18 +200,53 @@ class Text2Sql:
     def output_schema_formatter(output) -> str:
         return json.dumps({"generated_sql": output}, indent=4)
 
-    def __call__(self, text: str) -> Optional[str]:
-        """Run text2sql on a text query and return the SQL query."""
+    def _format_examples(self, pages) -> str:
+        return "\n".join(
+            self.example_formatter(example.text, example.metadata["ctx"])
+            for example in pages
+        )
+
+    def _cache_examples(self, key: str, examples_prompt: str) -> None:
+        if self.example_cache_size <= 0:
+            return
+        self._example_cache[key] = examples_prompt
+        self._example_cache.move_to_end(key)
+        while len(self._example_cache) > self.example_cache_size:
+            self._example_cache.popitem(last=False)
 
-        if self.store is not None:
-            similar_examples = self.store.search(text, self.num_relevant_examples)
-            similar_examples_prompt = "\n".join(
-                self.example_formatter(example.text, example.metadata["ctx"])
-                for example in similar_examples
+    def _get_examples_prompts(self, texts: List[str]) -> List[str]:
+        """Get the formatted examples block for each text.
+
+        Cached blocks are reused; all cache misses are embedded and
+        searched together in a single vector db call.
+        """
+        if self.store is None:
+            return ["" for _ in texts]
+
+        keys = [normalize_question(text) for text in texts]
+        prompts: Dict[str, str] = {}
+        for key in keys:
+            if key in self._example_cache:
+                self._example_cache.move_to_end(key)
+                prompts[key] = self._example_cache[key]
+
+        # Search with the first question for each key, not the normalized key
+        #   itself, so that the embeddings are those of the questions asked.
+        misses: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in prompts:
+                misses.setdefault(key, text)
+        if misses:
+            results = self.store.search_batch(
+                list(misses.values()), self.num_relevant_examples
             )
-        else:
-            similar_examples_prompt = ""
+            for key, pages in zip(misses, results):
+                prompts[key] = self._format_examples(pages)
+                self._cache_examples(key, prompts[key])
+
+        return [prompts[key] for key in keys]
 
+    def _generate(self, text: str, similar_examples_prompt: str) -> Optional[str]:
         if asyncio.iscoroutinefunction(self.llm_api):
             raise ValueError(
                 "Async API is not supported in Text2SQL application. "
@@ -206,7 +261,7 @@ class Text2Sql:
                     prompt_params={
                         "nl_instruction": text,
                         "examples": similar_examples_prompt,
-                        "db_info": str(self.sql_schema),
+                        "db_info": self._db_info,
                     },
                     **self.llm_api_kwargs,
                 )
@@ -217,3 +272,21 @@ class Text2Sql:
                 output = None
 
             return output
+
+    def __call__(self, text: str) -> Optional[str]:
+        """Run text2sql on a text query and return the SQL query."""
+        [similar_examples_prompt] = self._get_examples_prompts([text])
+        return self._generate(text, similar_examples_prompt)
+
+    def batch(self, questions: List[str]) -> List[Optional[str]]:
+        """Run text2sql on a list of text queries and return the SQL queries.
+
+        Example retrieval for all questions is done up front, with one
+        embedding request and one vector db search for the uncached
+        questions.
+        """
+        examples_prompts = self._get_examples_prompts(questions)
+        return [
+            self._generate(question, examples_prompt)
+            for question, examples_prompt in zip(questions, examples_prompts)
+        ]
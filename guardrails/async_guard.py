@@ -41,7 +41,6 @@ from guardrails.hub_telemetry.hub_tracing import async_trace
 from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import UseManyValidatorSpec, UseValidatorSpec
 from guardrails.telemetry import trace_async_guard_execution, wrap_with_otel_context
-from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.validator_base import Validator
 
 
@@ -172,19 +171,19 @@ class AsyncGuard(Guard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict],
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> Union[
         ValidationOutcome[OT],
         Awaitable[ValidationOutcome[OT]],
         AsyncIterator[ValidationOutcome[OT]],
     ]:
-        self._fill_validator_map()
-        self._fill_validators()
+        execution_plan = self._get_execution_plan()
         metadata = metadata or {}
         if not llm_output and llm_api and not (messages):
             raise RuntimeError("'messages' must be provided in order to call an LLM!")
         # check if validator requirements are fulfilled
-        missing_keys = verify_metadata_requirements(metadata, self._validators)
+        missing_keys = execution_plan.missing_metadata_keys(metadata)
         if missing_keys:
             raise ValueError(
                 f"Missing required metadata keys: {', '.join(missing_keys)}"
@@ -200,6 +199,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages: Optional[List[Dict]] = None,
             metadata: Optional[Dict] = None,
             full_schema_reask: Optional[bool] = None,
+            validation_timeout: Optional[float] = None,
             **kwargs,
         ) -> Union[
             ValidationOutcome[OT],
@@ -262,6 +262,7 @@ class AsyncGuard(Guard, Generic[OT]):
                     messages=messages,
                     metadata=metadata,
                     full_schema_reask=full_schema_reask,
+                    validation_timeout=validation_timeout,
                     call_log=call_log,
                     *args,
                     **kwargs,
@@ -288,6 +289,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             *args,
             **kwargs,
         )
@@ -302,6 +304,7 @@ class AsyncGuard(Guard, Generic[OT]):
         num_reasks: int = 0,  # Should be defined at this point
         metadata: Dict,  # Should be defined at this point
         full_schema_reask: bool = False,  # Should be defined at this point
+        validation_timeout: Optional[float] = None,
         messages: Optional[List[Dict]],
         **kwargs,
     ) -> Union[
@@ -326,12 +329,15 @@ class AsyncGuard(Guard, Generic[OT]):
             The raw text output from the LLM and the validated output.
         """
         api = get_async_llm_ask(llm_api, *args, **kwargs)  # type: ignore
+        execution_plan = self._get_execution_plan()
+        validator_map = self._get_validator_map(execution_plan)
+        exec_options = self._get_exec_options(execution_plan, validation_timeout)
         if kwargs.get("stream", False):
             runner = AsyncStreamRunner(
-                output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_type=execution_plan.output_type,
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
-                validation_map=self._validator_map,
+                validation_map=validator_map,
                 messages=messages,
                 api=api,
                 metadata=metadata,
@@ -343,7 +349,8 @@ class AsyncGuard(Guard, Generic[OT]):
                     if isinstance(self._allow_metrics_collection, bool)
                     else None
                 ),
-                exec_options=self._exec_opts,
+                exec_options=exec_options,
+                validated_messages=self._validated_messages,
             )
             # Here we have an async generator
             async_generator = runner.async_run(
@@ -352,10 +359,10 @@ class AsyncGuard(Guard, Generic[OT]):
             return async_generator
         else:
             runner = AsyncRunner(
-                output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_type=execution_plan.output_type,
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
-                validation_map=self._validator_map,
+                validation_map=validator_map,
                 messages=messages,
                 api=api,
                 metadata=metadata,
@@ -367,12 +374,16 @@ class AsyncGuard(Guard, Generic[OT]):
                     if isinstance(self._allow_metrics_collection, bool)
                     else None
                 ),
-                exec_options=self._exec_opts,
+                exec_options=exec_options,
+                validated_messages=self._validated_messages,
             )
             # Why are we using a different method here instead of just overriding?
-            call = await runner.async_run(
-                call_log=call_log, prompt_params=prompt_params
-            )
+            try:
+                call = await runner.async_run(
+                    call_log=call_log, prompt_params=prompt_params
+                )
+            finally:
+                self._record_validator_stats(call_log)
             return ValidationOutcome[OT].from_guard_history(call)
 
     @async_trace(name="/guard_call", origin="AsyncGuard.__call__")
@@ -385,6 +396,7 @@ class AsyncGuard(Guard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> Union[
         ValidationOutcome[OT],
@@ -405,6 +417,10 @@ class AsyncGuard(Guard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            validation_timeout: The number of seconds from the start of the call
+                                by which all validation must have finished.
+                                Validators still running at the deadline are
+                                handled by their on timeout action.
 
         Returns:
             The raw text output from the LLM and the validated output.
@@ -425,7 +441,7 @@ class AsyncGuard(Guard, Generic[OT]):
 
         return await trace_async_guard_execution(
             self.name,
-            self.history,
+            self._current_history(),
             self._execute,
             self._tracer,
             *args,
@@ -435,6 +451,7 @@ class AsyncGuard(Guard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             **kwargs,
         )
 
@@ -448,6 +465,7 @@ class AsyncGuard(Guard, Generic[OT]):
         num_reasks: Optional[int] = None,
         prompt_params: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> Awaitable[ValidationOutcome[OT]]:
         """Alternate flow to using AsyncGuard where the llm_output is known.
@@ -461,6 +479,10 @@ class AsyncGuard(Guard, Generic[OT]):
             prompt_params: The parameters to pass to the prompt.format() method.
             full_schema_reask: When reasking, whether to regenerate the full schema
                                or just the incorrect values.
+            validation_timeout: The number of seconds from the start of the call
+                                by which all validation must have finished.
+                                Validators still running at the deadline are
+                                handled by their on timeout action.
 
         Returns:
             The validated response. This is either a string or a dictionary,
@@ -481,7 +503,7 @@ class AsyncGuard(Guard, Generic[OT]):
 
         return await trace_async_guard_execution(  # type: ignore
             self.name,
-            self.history,
+            self._current_history(),
             self._execute,
             self._tracer,
             *args,
@@ -492,22 +514,36 @@ class AsyncGuard(Guard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             **kwargs,
         )
 
+    async def _single_server_call(  # type: ignore
+        self, *, payload: Dict[str, Any]
+    ) -> ValidationOutcome[OT]:
+        if self._api_client:
+            validation_output: IValidationOutcome = (
+                await self._api_client.async_validate(
+                    guard=self,  # type: ignore
+                    payload=ValidatePayload.from_dict(payload),  # type: ignore
+                    openai_api_key=get_call_kwarg("api_key"),
+                )
+            )
+            return self._server_validation_outcome(validation_output)
+        else:
+            raise ValueError("AsyncGuard does not have an api client!")
+
     async def _stream_server_call(
         self, *, payload: Dict[str, Any]
     ) -> AsyncIterator[ValidationOutcome[OT]]:
-        # TODO: Once server side supports async streaming, this function will need to
-        # yield async generators, not generators
         if self._api_client:
             validation_output: Optional[IValidationOutcome] = None
-            response = self._api_client.stream_validate(
+            response = self._api_client.async_stream_validate(
                 guard=self,  # type: ignore
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            for fragment in response:
+            async for fragment in response:
                 validation_output = fragment
                 if validation_output is None:
                     yield ValidationOutcome[OT](
@@ -532,12 +568,7 @@ class AsyncGuard(Guard, Generic[OT]):
             # TODO re-enable this once we have a way to get history
             # from a multi-node server
             # if validation_output:
-            #     guard_history = self._api_client.get_history(
-            #         self.name, validation_output.call_id
-            #     )
-            #     self.history.extend(
-            #         [Call.from_interface(call) for call in guard_history]
-            #     )
+            #     self._defer_history(validation_output.call_id)
         else:
             raise ValueError("AsyncGuard does not have an api client!")
 
@@ -1,14 +1,34 @@
+from typing import TYPE_CHECKING
+
 from guardrails.classes.credentials import Credentials  # type: ignore
 from guardrails.classes.rc import RC
-from guardrails.classes.input_type import InputType
 from guardrails.classes.output_type import OT
 from guardrails.classes.validation.validation_result import (
     ValidationResult,
     PassResult,
     FailResult,
     ErrorSpan,
+    StreamRetraction,
+)
+from guardrails.utils.lazy_import_utils import LazyImports
+
+if TYPE_CHECKING:
+    from guardrails.classes.input_type import InputType
+    from guardrails.classes.validation_outcome import ValidationOutcome
+
+# InputType pulls in langchain_core and ValidationOutcome pulls in the
+#   history classes, neither of which validators need at import time.
+_lazy = LazyImports(
+    globals(),
+    {
+        "InputType": ("guardrails.classes.input_type", "InputType"),
+        "ValidationOutcome": (
+            "guardrails.classes.validation_outcome",
+            "ValidationOutcome",
+        ),
+    },
 )
-from guardrails.classes.validation_outcome import ValidationOutcome
+__getattr__ = _lazy.module_getattr
 
 __all__ = [
     "Credentials",  # type: ignore
@@ -19,5 +39,6 @@ __all__ = [
     "ValidationResult",
     "PassResult",
     "FailResult",
+    "StreamRetraction",
     "ValidationOutcome",
 ]
@@ -1,3 +1,11 @@
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
+from guardrails.classes.execution.guard_execution_plan import GuardExecutionPlan
+from guardrails.classes.execution.validated_messages import ValidatedMessages
+from guardrails.classes.execution.validation_timeouts import ValidationTimeouts
 
-__all__ = ["GuardExecutionOptions"]
+__all__ = [
+    "GuardExecutionOptions",
+    "GuardExecutionPlan",
+    "ValidatedMessages",
+    "ValidationTimeouts",
+]
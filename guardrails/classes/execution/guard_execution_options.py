@@ -1,9 +1,20 @@
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from guardrails.classes.execution.validation_timeouts import ValidationTimeouts
+
 
 @dataclass
 class GuardExecutionOptions:
     messages: Optional[List[Dict]] = None
     reask_messages: Optional[List[Dict]] = None
     num_reasks: Optional[int] = None
+    short_circuit: bool = False
+    reorder_validators: bool = False
+    speculative_streaming: bool = False
+    stream_deltas: bool = False
+    materialize_stream_deltas: bool = False
+    overlap_input_validation: bool = False
+    reissue_on_input_fix: bool = False
+    parallel_field_reasks: bool = False
+    timeouts: ValidationTimeouts = ValidationTimeouts()
@@ -0,0 +1,91 @@
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
+from guardrails.classes.output_type import OutputTypes
+
+if TYPE_CHECKING:
+    from guardrails.types.validator import ValidatorMap
+    from guardrails.validator_base import Validator
+
+
+@dataclass(frozen=True)
+class GuardExecutionPlan:
+    """Everything a Guard call needs that only changes when the Guard is
+    reconfigured.
+
+    A plan is built the first time a Guard is executed and reused by
+    every call after that until `use`, `use_many` or `configure`
+    invalidates it, or the Guard's output schema or validators are
+    replaced or changed. Nothing in a plan should be mutated; calls that need
+    their own execution options should copy them.
+    """
+
+    output_type: OutputTypes
+    output_schema: Dict[str, Any]
+    validator_map: "ValidatorMap"
+    validators: Tuple["Validator", ...]
+    required_metadata_keys: FrozenSet[str]
+    exec_options: GuardExecutionOptions
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        output_type: OutputTypes,
+        output_schema: Dict[str, Any],
+        validator_map: "ValidatorMap",
+        exec_options: GuardExecutionOptions,
+    ) -> "GuardExecutionPlan":
+        # Snapshot the map so in-flight calls are unaffected
+        #   if validators are added to the Guard.
+        frozen_map = {
+            path: list(validators) for path, validators in validator_map.items()
+        }
+        validators = tuple(v for v_list in frozen_map.values() for v in v_list)
+        required_metadata_keys = frozenset(
+            key for validator in validators for key in validator.required_metadata_keys
+        )
+        return cls(
+            output_type=output_type,
+            output_schema=output_schema,
+            validator_map=frozen_map,
+            validators=validators,
+            required_metadata_keys=required_metadata_keys,
+            exec_options=cls.snapshot_exec_options(exec_options),
+        )
+
+    @staticmethod
+    def snapshot_exec_options(
+        exec_options: GuardExecutionOptions,
+    ) -> GuardExecutionOptions:
+        # Copy the options so configuring the Guard leaves the plan unchanged.
+        return replace(exec_options)
+
+    def with_exec_options(
+        self,
+        *,
+        num_reasks: Optional[int] = None,
+        messages: Optional[List[Dict]] = None,
+        reask_messages: Optional[List[Dict]] = None,
+    ) -> "GuardExecutionPlan":
+        """Get a plan with the given execution options backfilled, or this
+        plan if none of them change."""
+        changes: Dict[str, Any] = {}
+        if num_reasks is not None and num_reasks != self.exec_options.num_reasks:
+            changes["num_reasks"] = num_reasks
+        if messages is not None and messages is not self.exec_options.messages:
+            changes["messages"] = messages
+        if (
+            reask_messages is not None
+            and reask_messages is not self.exec_options.reask_messages
+        ):
+            changes["reask_messages"] = reask_messages
+        if not changes:
+            return self
+        return replace(self, exec_options=replace(self.exec_options, **changes))
+
+    def missing_metadata_keys(self, metadata: Dict[str, Any]) -> List[str]:
+        """Get the sorted metadata keys the validators require but are not
+        present in `metadata`."""
+        return sorted(key for key in self.required_metadata_keys if key not in metadata)
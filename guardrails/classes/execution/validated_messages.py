@@ -0,0 +1,75 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple
+
+from guardrails.utils.fingerprint_utils import validators_fingerprint
+
+if TYPE_CHECKING:
+    from guardrails.validator_base import Validator
+
+
+class ValidatedMessages:
+    """A cache of the messages that passed validation, by the hash of their
+    content and a fingerprint of the validators they passed.
+
+    Conversations resend their whole history on every turn, so with this
+    only the messages that are new or were edited since an earlier turn
+    are validated. A Guard's conversations share its cache, which holds
+    the `maxsize` most recently used messages.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], str]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def fingerprint(validators: Iterable["Validator"]) -> str:
+        """Identify a set of validators and how they are configured."""
+        return validators_fingerprint(validators)
+
+    @staticmethod
+    def _key(fingerprint: str, role: str, content: str) -> Tuple[str, str]:
+        content_hash = hashlib.sha256(f"{role}\0{content}".encode()).hexdigest()
+        return fingerprint, content_hash
+
+    @staticmethod
+    def _metadata_matches(cached: Dict[str, Any], metadata: Dict[str, Any]) -> bool:
+        try:
+            return bool(cached == metadata)
+        except Exception:
+            # Metadata values without a boolean equality, e.g. arrays.
+            return False
+
+    def get(
+        self, fingerprint: str, role: str, content: str, metadata: Dict[str, Any]
+    ) -> Optional[str]:
+        """Get the validated content of a message if it already passed the
+        validators with the same metadata."""
+        key = self._key(fingerprint, role, content)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or not self._metadata_matches(entry[0], metadata):
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def record(
+        self,
+        fingerprint: str,
+        messages: Iterable[Tuple[str, str, str]],
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Record the (role, content, validated content) of messages that
+        passed the validators."""
+        metadata = dict(metadata)
+        with self._lock:
+            for role, content, validated_content in messages:
+                key = self._key(fingerprint, role, content)
+                self._cache[key] = (metadata, validated_content)
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
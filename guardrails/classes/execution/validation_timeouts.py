@@ -0,0 +1,73 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+from guardrails.types.on_timeout import OnTimeoutAction
+
+if TYPE_CHECKING:
+    from guardrails.validator_base import Validator
+
+
+@dataclass(frozen=True)
+class ValidationTimeouts:
+    """Bounds on how long validators may run.
+
+    Attributes:
+        timeout (Optional[float]): The default number of seconds each
+            validator may run for. Validators constructed with a `timeout`
+            use their own instead.
+        on_timeout (OnTimeoutAction): The default outcome of a validator
+            that times out. Validators constructed with an `on_timeout`
+            use their own instead.
+        deadline (Optional[float]): The `time.monotonic()` time by which
+            every validator in the call must have finished.
+    """
+
+    timeout: Optional[float] = None
+    on_timeout: OnTimeoutAction = OnTimeoutAction.EXCEPTION
+    deadline: Optional[float] = None
+
+    def with_deadline(self, seconds: float) -> "ValidationTimeouts":
+        """Get these timeouts with a deadline `seconds` from now."""
+        return replace(self, deadline=time.monotonic() + seconds)
+
+    def timeout_for(self, validator: "Validator") -> Optional[float]:
+        """Get the number of seconds a validator may run for if started now,
+        or None if it is unbounded."""
+        timeout = getattr(validator, "timeout", None)
+        if timeout is None:
+            timeout = self.timeout
+        if self.deadline is None:
+            return timeout
+        remaining = max(self.deadline - time.monotonic(), 0)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def on_timeout_for(self, validator: "Validator") -> OnTimeoutAction:
+        on_timeout: Union[str, OnTimeoutAction] = (
+            getattr(validator, "on_timeout", None) or self.on_timeout
+        )
+        return OnTimeoutAction(on_timeout)
+
+
+# The timeouts of the validator service running validators in this context.
+_current_timeouts: ContextVar[Optional[ValidationTimeouts]] = ContextVar(
+    "validation_timeouts", default=None
+)
+
+
+def get_current_timeouts() -> ValidationTimeouts:
+    """Get the timeouts validators in this context are being run with."""
+    return _current_timeouts.get() or ValidationTimeouts()
+
+
+@contextmanager
+def use_timeouts(timeouts: ValidationTimeouts) -> Iterator[None]:
+    """Run validators in this block with the given timeouts, so that they
+    can bound their own work, such as requests, by them."""
+    token = _current_timeouts.set(timeouts)
+    try:
+        yield
+    finally:
+        _current_timeouts.reset(token)
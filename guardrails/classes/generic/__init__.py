@@ -1,5 +1,6 @@
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
+from guardrails.classes.generic.deferred_stack import DeferredStack
 from guardrails.classes.generic.serializeable import Serializeable
 from guardrails.classes.generic.stack import Stack
 
-__all__ = ["ArbitraryModel", "Stack", "Serializeable"]
+__all__ = ["ArbitraryModel", "DeferredStack", "Stack", "Serializeable"]
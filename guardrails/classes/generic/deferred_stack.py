@@ -0,0 +1,97 @@
+import threading
+from copy import deepcopy
+from typing import Callable, Iterable, List, TypeVar
+
+from guardrails.classes.generic.stack import Stack
+
+T = TypeVar("T")
+
+
+class DeferredStack(Stack[T]):
+    """A Stack that items can be deferred onto by key, to be fetched, in
+    the order they were deferred, the next time the stack is accessed.
+
+    Every method that reads or changes the items fetches the deferred ones
+    first; `loaded` returns the items fetched so far without fetching.
+    """
+
+    def __init__(self, *args, fetch: Callable[[str], Iterable[T]]):
+        super().__init__(*args)
+        self._fetch = fetch
+        self._deferred: List[str] = []
+        self._lock = threading.Lock()
+
+    def defer(self, key: str) -> None:
+        """Fetch the items for a key the next time the stack is accessed."""
+        with self._lock:
+            self._deferred.append(key)
+
+    def fetch_deferred(self) -> None:
+        """Fetch the items for every deferred key."""
+        # Fetch under the lock, so that concurrent readers wait for the
+        #   items instead of seeing the stack without them.
+        with self._lock:
+            while self._deferred:
+                items = self._fetch(self._deferred[0])
+                # Only drop a key once its items are fetched, so that a
+                #   failed fetch is retried on the next access.
+                self._deferred.pop(0)
+                list.extend(self, items)
+
+    def loaded(self) -> Stack[T]:
+        """A copy of the items fetched so far, without fetching the deferred
+        ones."""
+        return Stack(*list.copy(self))
+
+    def __deepcopy__(self, memo) -> "DeferredStack[T]":
+        self.fetch_deferred()
+        return DeferredStack(*deepcopy(list.copy(self), memo), fetch=self._fetch)
+
+    def __reduce__(self):
+        self.fetch_deferred()
+        return (Stack, tuple(list.copy(self)))
+
+
+def _fetching_deferred(method: Callable) -> Callable:
+    def wrapper(self: DeferredStack, *args, **kwargs):
+        self.fetch_deferred()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in [
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__getitem__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__iter__",
+    "__le__",
+    "__len__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__rmul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+]:
+    setattr(DeferredStack, _name, _fetching_deferred(getattr(Stack, _name)))
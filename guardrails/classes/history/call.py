@@ -1,19 +1,14 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from builtins import id as object_id
-from pydantic import Field
-from rich.panel import Panel
-from rich.pretty import pretty_repr
-from rich.tree import Tree
+from pydantic import Field, PrivateAttr
 
 from guardrails_api_client import Call as ICall
-from guardrails.actions.filter import Filter
-from guardrails.actions.refrain import Refrain
 from guardrails.actions.reask import merge_reask_output
 from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history.call_aggregates import CallAggregates
 from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.classes.history.iteration import Iteration
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
-from guardrails.classes.validation.validation_result import ValidationResult
 from guardrails.constants import error_status, fail_status, not_run_status, pass_status
 from guardrails.prompt.messages import Messages
 from guardrails.prompt import Prompt, Instructions
@@ -23,7 +18,9 @@ from guardrails.actions.reask import (
     gather_reasks,
     sub_reasks_with_fixed_values,
 )
-from guardrails.schema.parser import get_value_from_path
+
+if TYPE_CHECKING:
+    from rich.tree import Tree
 
 
 # We can't inherit from Iteration because python
@@ -54,6 +51,7 @@ class Call(ICall, ArbitraryModel):
         description="The exception that interrupted the run.",
         default=None,
     )
+    _aggregates: CallAggregates = PrivateAttr(default_factory=CallAggregates)
 
     # Prevent Pydantic from changing our types
     # Without this, Pydantic casts iterations to a list
@@ -327,38 +325,14 @@ class Call(ICall, ArbitraryModel):
     def failed_validations(self) -> Stack[ValidatorLogs]:
         """The validator logs for any validations that failed during the
         entirety of the run."""
-        return Stack(
-            *[
-                log
-                for log in self.validator_logs
-                if log.validation_result is not None
-                and isinstance(log.validation_result, ValidationResult)
-                and log.validation_result.outcome == "fail"
-            ]
-        )
+        # Failures are aggregated as iterations and logs are added,
+        #   so reading them does not walk the iterations.
+        return self._aggregates.update(self).failed_validations
 
     def _has_unresolved_failures(self) -> bool:
-        # Check for unresolved ReAsks
-        if len(self.reasks) > 0:
-            return True
-
-        # Check for scenario where no specified on-fail's produced an unfixed ReAsk,
-        #   but valdiation still failed (i.e. Refrain or NoOp).
-        output = self.fixed_output
-        for failure in self.failed_validations:
-            value = get_value_from_path(output, failure.property_path)
-            if (
-                # NOTE: this means on_fail="fix" was applied
-                #       to a Validator without a programmatic fix.
-                (value is None and failure.value_before_validation is not None)
-                or value == failure.value_before_validation
-                or isinstance(failure.value_after_validation, Refrain)
-                or isinstance(failure.value_after_validation, Filter)
-            ):
-                return True
-
-        # No ReAsks and no unresolved failed validations
-        return False
+        # Unresolved ReAsks, or failures that no on-fail action resolved
+        #   (i.e. Refrain or NoOp), checked against the merged fixed output.
+        return self._aggregates.update(self).has_unresolved_failures
 
     @property
     def status(self) -> str:
@@ -373,8 +347,12 @@ class Call(ICall, ArbitraryModel):
         return pass_status
 
     @property
-    def tree(self) -> Tree:
+    def tree(self) -> "Tree":
         """Returns the tree."""
+        from rich.panel import Panel
+        from rich.pretty import pretty_repr
+        from rich.tree import Tree
+
         tree = Tree("Logs")
         for i, iteration in enumerate(self.iterations):
             tree.add(Panel(iteration.rich_group, title=f"Step {i}"))
@@ -398,6 +376,8 @@ class Call(ICall, ArbitraryModel):
         return tree
 
     def __str__(self) -> str:
+        from rich.pretty import pretty_repr
+
         return pretty_repr(self)
 
     def to_interface(self) -> ICall:
@@ -0,0 +1,161 @@
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from guardrails.actions.filter import Filter
+from guardrails.actions.reask import ReAsk, gather_reasks, sub_reasks_with_fixed_values
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.generic.stack import Stack
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.history.validator_log_aggregates import (
+    ValidatorLogAggregates,
+)
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.schema.parser import get_value_from_path
+
+if TYPE_CHECKING:
+    from guardrails.classes.history.call import Call
+
+
+class CallAggregates:
+    """Aggregates over the iterations of a call that are maintained
+    incrementally.
+
+    Iterations are pushed onto a call and validator logs are appended to
+    them, so each read only visits the failures since the previous read.
+    The output that failures are checked against only changes when the
+    validation response of an iteration does, which happens once per
+    iteration, and is the only time every failure is checked again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    # The aggregates are a cache derived from the iterations, so they should
+    #   not affect equality, copying or pickling of the call holding them.
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CallAggregates)
+
+    __hash__ = None  # type: ignore
+
+    def __deepcopy__(self, memo) -> "CallAggregates":
+        return CallAggregates()
+
+    def __reduce__(self):
+        return (CallAggregates, ())
+
+    def _reset(self):
+        self._iterations: List[Iteration] = []
+        # For each iteration, its log aggregates, their generation and how
+        #   many of their failures have been aggregated.
+        self._aggregated: List[Tuple[ValidatorLogAggregates, int, int]] = []
+        self._responses: Optional[Tuple[Any, ...]] = None
+        self._full_schema_reask: Optional[bool] = None
+        self._unresolved = 0
+        self.fixed_output: Any = None
+        self.reasks: List[ReAsk] = []
+        self.failed_validations: Stack[ValidatorLogs] = Stack()
+
+    @property
+    def has_unresolved_failures(self) -> bool:
+        return len(self.reasks) > 0 or self._unresolved > 0
+
+    def _is_unresolved(self, failure: ValidatorLogs) -> bool:
+        # Input validation failures are either fixed or raised
+        #   before the LLM is called, so they are not in the output.
+        if not failure.property_path.startswith("$"):
+            return False
+        value = get_value_from_path(self.fixed_output, failure.property_path)
+        return (
+            # NOTE: this means on_fail="fix" was applied
+            #       to a Validator without a programmatic fix.
+            (value is None and failure.value_before_validation is not None)
+            or value == failure.value_before_validation
+            or isinstance(failure.value_after_validation, Refrain)
+            or isinstance(failure.value_after_validation, Filter)
+        )
+
+    def _count_unresolved(self, failures: List[ValidatorLogs]) -> int:
+        return sum(1 for failure in failures if self._is_unresolved(failure))
+
+    def update(self, call: "Call") -> "CallAggregates":
+        """Aggregate the iterations and failures added since the last
+        update."""
+        with self._lock:
+            iterations = list(call.iterations)
+            # Iterations were replaced or inserted rather than pushed.
+            if len(iterations) < len(self._iterations) or any(
+                seen is not iteration
+                for seen, iteration in zip(self._iterations, iterations)
+            ):
+                self._reset()
+            self._iterations = iterations
+
+            check_all = False
+            responses = tuple(i.outputs.validation_response for i in iterations)
+            full_schema_reask = call.inputs.full_schema_reask
+            if (
+                self._responses is None
+                or len(responses) != len(self._responses)
+                or any(a is not b for a, b in zip(responses, self._responses))
+                or full_schema_reask != self._full_schema_reask
+            ):
+                self._responses = responses
+                self._full_schema_reask = full_schema_reask
+                self.fixed_output = sub_reasks_with_fixed_values(
+                    call.validation_response
+                )
+                self.reasks, _ = gather_reasks(self.fixed_output)
+                check_all = True
+
+            new_failures: List[ValidatorLogs] = []
+            rebuild = False
+            for index, iteration in enumerate(iterations):
+                aggregates = iteration.outputs._aggregated_logs()
+                failures = (
+                    aggregates.failed_chunk_validations
+                    if iteration.inputs.stream
+                    else aggregates.failed_validations
+                )
+                if index < len(self._aggregated):
+                    seen, generation, count = self._aggregated[index]
+                    if (
+                        seen is not aggregates
+                        or generation != aggregates.generation
+                        or count > len(failures)
+                        # Only failures of the last aggregated iteration
+                        #   can be appended without reordering.
+                        or (
+                            count < len(failures) and index != len(self._aggregated) - 1
+                        )
+                    ):
+                        rebuild = True
+                    new_failures.extend(failures[count:])
+                    self._aggregated[index] = (
+                        aggregates,
+                        aggregates.generation,
+                        len(failures),
+                    )
+                else:
+                    new_failures.extend(failures)
+                    self._aggregated.append(
+                        (aggregates, aggregates.generation, len(failures))
+                    )
+
+            if rebuild:
+                self.failed_validations = Stack()
+                for iteration, (aggregates, _, _) in zip(iterations, self._aggregated):
+                    self.failed_validations.extend(
+                        aggregates.failed_chunk_validations
+                        if iteration.inputs.stream
+                        else aggregates.failed_validations
+                    )
+                check_all = True
+            else:
+                self.failed_validations.extend(new_failures)
+
+            if check_all:
+                self._unresolved = self._count_unresolved(self.failed_validations)
+            else:
+                self._unresolved += self._count_unresolved(new_failures)
+        return self
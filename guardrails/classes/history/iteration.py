@@ -1,10 +1,6 @@
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 from builtins import id as object_id
 from pydantic import Field
-from rich.console import Group
-from rich.panel import Panel
-from rich.pretty import pretty_repr
-from rich.table import Table
 
 from guardrails_api_client import Iteration as IIteration
 from guardrails.classes.generic.stack import Stack
@@ -17,6 +13,10 @@ from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import ReAsk
 from guardrails.classes.validation.validation_result import ErrorSpan
 
+if TYPE_CHECKING:
+    from rich.console import Group
+    from rich.table import Table
+
 
 class Iteration(IIteration, ArbitraryModel):
     """An Iteration represents a single iteration of the validation loop
@@ -187,10 +187,15 @@ class Iteration(IIteration, ArbitraryModel):
         return self.outputs.status
 
     @property
-    def rich_group(self) -> Group:
+    def rich_group(self) -> "Group":
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.pretty import pretty_repr
+        from rich.table import Table
+
         def create_messages_table(
             messages: Optional[List[Dict[str, Union[str, Prompt, Instructions]]]],
-        ) -> Union[str, Table]:
+        ) -> Union[str, "Table"]:
             if messages is None:
                 return "No messages."
             table = Table(show_lines=True)
@@ -220,6 +225,8 @@ class Iteration(IIteration, ArbitraryModel):
         )
 
     def __str__(self) -> str:
+        from rich.pretty import pretty_repr
+
         return pretty_repr(self)
 
     def to_interface(self) -> IIteration:
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from guardrails_api_client import (
     Outputs as IOutputs,
@@ -10,12 +10,14 @@ from guardrails_api_client import (
 from guardrails.constants import error_status, fail_status, not_run_status, pass_status
 from guardrails.classes.llm.llm_response import LLMResponse
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
+from guardrails.classes.history.validator_log_aggregates import (
+    ValidatorLogAggregates,
+)
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import ReAsk
 from guardrails.classes.validation.validation_result import (
     ErrorSpan,
     FailResult,
-    ValidationResult,
 )
 
 
@@ -40,6 +42,11 @@ class Outputs(IOutputs, ArbitraryModel):
         error (Optional[str]): The error message from any exception that raised
             and interrupted the process.
         exception (Optional[Exception]): The exception that interrupted the process.
+        stream_aborted (bool): Whether the LLM stream was closed before it was
+            exhausted because validation reached a terminal outcome. Default False.
+        tokens_saved (Optional[int]): An estimate of the completion tokens that
+            were not generated because the stream was aborted.
+            Only available when `max_tokens` was passed to the LLM.
     """
 
     llm_response_info: Optional[LLMResponse] = Field(
@@ -80,6 +87,19 @@ class Outputs(IOutputs, ArbitraryModel):
     exception: Optional[Exception] = Field(
         description="The exception that interrupted the process.", default=None
     )
+    stream_aborted: bool = Field(
+        description="Whether the LLM stream was closed before it was exhausted"
+        " because validation reached a terminal outcome.",
+        default=False,
+    )
+    tokens_saved: Optional[int] = Field(
+        description="An estimate of the completion tokens that were not generated"
+        " because the stream was aborted.",
+        default=None,
+    )
+    _log_aggregates: ValidatorLogAggregates = PrivateAttr(
+        default_factory=ValidatorLogAggregates
+    )
 
     def _all_empty(self) -> bool:
         return (
@@ -92,18 +112,13 @@ class Outputs(IOutputs, ArbitraryModel):
             and self.error is None
         )
 
+    def _aggregated_logs(self) -> ValidatorLogAggregates:
+        return self._log_aggregates.update(self.validator_logs)
+
     @property
     def failed_validations(self) -> List[ValidatorLogs]:
         """Returns the validator logs for any validation that failed."""
-        return list(
-            [
-                log
-                for log in self.validator_logs
-                if log.validation_result is not None
-                and isinstance(log.validation_result, ValidationResult)
-                and log.validation_result.outcome == "fail"
-            ]
-        )
+        return list(self._aggregated_logs().failed_validations)
 
     @property
     def error_spans_in_output(self) -> List[ErrorSpan]:
@@ -111,32 +126,7 @@ class Outputs(IOutputs, ArbitraryModel):
 
         These indices are relative to the complete LLM output.
         """
-        # map of total length to validator
-        total_len_by_validator = {}
-        spans_in_output = []
-        for log in self.validator_logs:
-            validator_name = log.validator_name
-            if total_len_by_validator.get(validator_name) is None:
-                total_len_by_validator[validator_name] = 0
-            result = log.validation_result
-            if isinstance(result, FailResult):
-                if result.error_spans is not None:
-                    for error_span in result.error_spans:
-                        spans_in_output.append(
-                            ErrorSpan(
-                                start=error_span.start
-                                + total_len_by_validator[validator_name],
-                                end=error_span.end
-                                + total_len_by_validator[validator_name],
-                                reason=error_span.reason,
-                            )
-                        )
-            if isinstance(result, ValidationResult):
-                if result and result.validated_chunk is not None:
-                    total_len_by_validator[validator_name] += len(
-                        result.validated_chunk
-                    )
-        return spans_in_output
+        return list(self._aggregated_logs().error_spans_in_output)
 
     @property
     def status(self) -> str:
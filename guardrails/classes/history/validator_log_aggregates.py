@@ -0,0 +1,131 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from guardrails.classes.validation.validation_result import (
+    ErrorSpan,
+    FailResult,
+    ValidationResult,
+)
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+
+
+class ValidatorLogAggregates:
+    """Aggregates over a list of validator logs that are maintained
+    incrementally.
+
+    Validator logs are only ever appended to, and do not change once their
+    validator has finished running, so each read only has to visit the
+    logs that finished since the previous one. Logs that are still running
+    are aggregated once they finish, in their place among the others.
+
+    A validator runs on a path once at a time, so a log still running when
+    the next log of the same validator and path arrives ended abnormally,
+    e.g. because its validator raised, and is never aggregated.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Changes whenever the aggregated lists change other than by
+        #   appending to them, so that aggregates built on them know to
+        #   start over.
+        self.generation = 0
+        self._reset(None)
+
+    # The aggregates are a cache derived from the logs, so they should not
+    #   affect equality, copying or pickling of the models holding them.
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ValidatorLogAggregates)
+
+    __hash__ = None  # type: ignore
+
+    def __deepcopy__(self, memo) -> "ValidatorLogAggregates":
+        return ValidatorLogAggregates()
+
+    def __reduce__(self):
+        return (ValidatorLogAggregates, ())
+
+    def _reset(self, logs: Optional[List[ValidatorLogs]]):
+        self.generation += 1
+        self._logs = logs
+        self._aggregated = 0
+        # The index of the log still running for each validator and path.
+        self._running: Dict[Tuple[str, Optional[int], str], int] = {}
+        self._total_len_by_validator: Dict[str, int] = {}
+        # The index of the log each failed validation and error span is from,
+        #   to keep them in the order of the logs.
+        self._failed_indices: List[int] = []
+        self._failed_chunk_indices: List[int] = []
+        self._error_span_indices: List[int] = []
+        self.failed_validations: List[ValidatorLogs] = []
+        # The failed validations of a stream that had a full chunk to validate.
+        self.failed_chunk_validations: List[ValidatorLogs] = []
+        self.error_spans_in_output: List[ErrorSpan] = []
+
+    def _insert(
+        self, indices: List[int], items: List, index: int, log: ValidatorLogs
+    ) -> None:
+        position = bisect.bisect(indices, index)
+        if position < len(indices):
+            self.generation += 1
+        indices.insert(position, index)
+        items.insert(position, log)
+
+    def _aggregate(self, index: int, log: ValidatorLogs):
+        result = log.validation_result
+        if isinstance(result, ValidationResult) and result.outcome == "fail":
+            self._insert(self._failed_indices, self.failed_validations, index, log)
+            if result.validated_chunk:
+                self._insert(
+                    self._failed_chunk_indices,
+                    self.failed_chunk_validations,
+                    index,
+                    log,
+                )
+
+        # Error spans are relative to the validator's own chunks, so offset
+        #   them by everything that validator has validated before.
+        offset = self._total_len_by_validator.get(log.validator_name, 0)
+        if isinstance(result, FailResult) and result.error_spans:
+            error_spans = [
+                ErrorSpan(
+                    start=error_span.start + offset,
+                    end=error_span.end + offset,
+                    reason=error_span.reason,
+                )
+                for error_span in result.error_spans
+            ]
+            position = bisect.bisect(self._error_span_indices, index)
+            self._error_span_indices[position:position] = [index] * len(error_spans)
+            self.error_spans_in_output[position:position] = error_spans
+        if isinstance(result, ValidationResult) and result.validated_chunk is not None:
+            offset += len(result.validated_chunk)
+        self._total_len_by_validator[log.validator_name] = offset
+
+    def update(self, logs: List[ValidatorLogs]) -> "ValidatorLogAggregates":
+        """Aggregate the logs that finished since the last update."""
+        with self._lock:
+            # The logs were replaced rather than appended to.
+            if logs is not self._logs or len(logs) < self._aggregated:
+                self._reset(logs)
+            for key, index in list(self._running.items()):
+                if not _is_running(logs[index]):
+                    del self._running[key]
+                    self._aggregate(index, logs[index])
+            while self._aggregated < len(logs):
+                index = self._aggregated
+                log = logs[index]
+                key = (log.validator_name, log.instance_id, log.property_path)
+                # Drop the previous log of this validator and path if it is
+                #   still running, as it ended abnormally.
+                self._running.pop(key, None)
+                if _is_running(log):
+                    self._running[key] = index
+                else:
+                    self._aggregate(index, log)
+                self._aggregated += 1
+        return self
+
+
+def _is_running(log: ValidatorLogs) -> bool:
+    return log.start_time is not None and log.end_time is None
@@ -0,0 +1,141 @@
+import re
+from functools import cached_property, lru_cache
+from string import Template
+from typing import FrozenSet, Optional, Tuple
+
+import regex
+
+from guardrails.classes.templating.namespace_template import NamespaceTemplate
+from guardrails.utils.constants import constants
+from guardrails.utils.templating_utils import get_template_variables
+
+CONSTANT_PATTERN = re.compile(r"\${gr\.(\w+)}")
+CONSTANT_MARKER = "${gr."
+
+# Prompt and message templates are small and reused across calls and reasks;
+#   formatted prompts are not looked up here unless they still hold constants.
+TEMPLATE_CACHE_SIZE = 256
+
+
+class CompiledTemplate:
+    """A prompt template whose scans are done once.
+
+    Constant substitution, template variable names, the format
+    instructions offset and the escaped form are each computed on first
+    use and then reused by every prompt built from the same source.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+
+        constant_names = []
+        format_instructions_start = None
+        for match in CONSTANT_PATTERN.finditer(source):
+            name = match.group(1)
+            if name not in constant_names:
+                constant_names.append(name)
+            if format_instructions_start is None and name in constants:
+                format_instructions_start = match.start()
+
+        self.constant_names: Tuple[str, ...] = tuple(constant_names)
+        # Everything from the first constant on is a format instruction.
+        self.format_instructions_start: Optional[int] = format_instructions_start or 0
+
+    @cached_property
+    def substituted(self) -> str:
+        """The source with every `${gr.<constant_name>}` replaced in a
+        single pass.
+
+        Constants that themselves reference constants are expanded
+        recursively.
+        """
+        if not self.constant_names:
+            return self.source
+        mapping = {}
+        for name in self.constant_names:
+            value = constants[name]
+            if isinstance(value, str) and CONSTANT_MARKER in value:
+                value = compile_template(value).substituted
+            mapping[f"gr.{name}"] = value
+        return NamespaceTemplate(self.source).safe_substitute(**mapping)
+
+    @cached_property
+    def variable_names(self) -> Tuple[str, ...]:
+        return tuple(get_template_variables(self.source))
+
+    @cached_property
+    def _variable_name_set(self) -> FrozenSet[str]:
+        return frozenset(self.variable_names)
+
+    @cached_property
+    def escaped(self) -> str:
+        """The source with single curly braces escaped into double curly
+        braces."""
+        start_replaced = regex.sub(r"(?<!\$){", "{{", self.source)
+        # This variable length negative lookbehind is why we need `regex` over `re`
+        return regex.sub(r"(?<!\${.*)}", "}}", start_replaced)
+
+    def format(self, **kwargs) -> str:
+        """Substitute the template variables that are present in the
+        source."""
+        # Only use the keyword arguments that are present in the template.
+        filtered_kwargs = {
+            k: v for k, v in kwargs.items() if k in self._variable_name_set
+        }
+        return Template(self.source).safe_substitute(**filtered_kwargs)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_template(source: str, constants_version: int) -> CompiledTemplate:
+    return CompiledTemplate(source)
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """Get the compiled form of a template, reusing it across calls."""
+    return _compile_template(source, constants.version)
+
+
+def substitute_constants(text: str) -> str:
+    """Substitute constants in the text.
+
+    Text without any `${gr.<constant_name>}` is returned as is without
+    touching the template cache.
+    """
+    if CONSTANT_MARKER not in text:
+        return text
+    return compile_template(text).substituted
+
+
+def format_template(text: str, **kwargs) -> str:
+    """Substitute the template variables that are present in the text.
+
+    Text without a `$` has nothing to substitute and is returned as is
+    without touching the template cache.
+    """
+    if "$" not in text:
+        return text
+    return compile_template(text).format(**kwargs)
+
+
+def get_variable_names(text: str) -> Tuple[str, ...]:
+    """Get the names of the template variables in the text.
+
+    Text without a `$` has no variables and does not touch the template
+    cache.
+    """
+    if "$" not in text:
+        return ()
+    return compile_template(text).variable_names
+
+
+def escape_template(text: str) -> str:
+    """Escape single curly braces in the text into double curly braces.
+
+    Text without a `$` has every brace escaped, and text without braces
+    is returned as is, without touching the template cache.
+    """
+    if "{" not in text and "}" not in text:
+        return text
+    if "$" not in text:
+        return text.replace("{", "{{").replace("}", "}}")
+    return compile_template(text).escaped
@@ -1,13 +1,32 @@
 import os
-from lxml import etree as ET
+from typing import Any, Dict, Optional
 
 
 class ConstantsContainer:
     def __init__(self):
-        self._constants = {}
-        self.fill_constants()
+        self._loaded_constants: Optional[Dict[str, Any]] = None
+        self._version = 0
+
+    @property
+    def _constants(self) -> Dict[str, Any]:
+        # constants.xml is parsed on first use instead of at import time.
+        if self._loaded_constants is None:
+            self._loaded_constants = {}
+            self.fill_constants()
+        return self._loaded_constants
+
+    @property
+    def version(self) -> int:
+        """Incremented whenever a constant is added, changed or removed.
+
+        Caches of text with substituted constants include it in their
+        keys.
+        """
+        return self._version
 
     def fill_constants(self) -> None:
+        from lxml import etree as ET
+
         self_file_path = os.path.dirname(__file__)
         self_dirname = os.path.dirname(self_file_path)
         constants_file = os.path.abspath(
@@ -35,9 +54,11 @@ class ConstantsContainer:
 
     def __setitem__(self, key, value):
         self._constants[key] = value
+        self._version += 1
 
     def __delitem__(self, key):
         del self._constants[key]
+        self._version += 1
 
     def __iter__(self):
         return iter(self._constants)
@@ -192,3 +192,27 @@ class StreamValidationResult(BaseModel):
     chunk: Any
     original_text: str
     metadata: Dict[str, Any]
+
+
+class StreamRetraction(ArbitraryModel):
+    """A StreamRetraction replaces text that was streamed speculatively,
+    before validation finished, with its validated counterpart.
+
+    Clients should replace the characters from `start` to `end` of the text
+    they have rendered so far with `replacement`.
+
+    Attributes:
+        start (int): Starting index of the retracted span in the rendered
+            text, i.e. the streamed text with every earlier retraction
+            applied.
+        end (int): Ending index of the retracted span in the rendered text.
+        replacement (str): The validated text to render in place of the
+            retracted span. Empty if the span should be removed.
+        error_spans (List[ErrorSpan]): The spans that failed validation,
+            relative to the retracted text.
+    """
+
+    start: int
+    end: int
+    replacement: str = ""
+    error_spans: List[ErrorSpan] = Field(default_factory=list)
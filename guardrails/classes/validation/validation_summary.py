@@ -19,6 +19,9 @@ class ValidationSummary(IValidationSummary, ArbitraryModel):
         formats.
         """
         for log in validator_logs:
+            # Cancelled validations never produced a result to summarize.
+            if log.cancelled:
+                continue
             validation_result = log.validation_result
             is_fail_result = isinstance(validation_result, FailResult)
             failure_reason = validation_result.error_message if is_fail_result else None
@@ -25,6 +25,11 @@ class ValidatorLogs(IValidatorLog, ArbitraryModel):
         start_time (Optional[datetime]): The time the validation started
         end_time (Optional[datetime]): The time the validation ended
         instance_id (Optional[int]): The unique id of this instance of the validator
+        cancelled (bool): Whether the validation was cancelled before it finished
+            because another validator had a terminal outcome
+        timed_out (bool): Whether the validation did not finish before the
+            validator's timeout or the call's deadline; the validation result
+            is then determined by the validator's on timeout action
     """
 
     validator_name: str
@@ -36,6 +41,8 @@ class ValidatorLogs(IValidatorLog, ArbitraryModel):
     end_time: Optional[datetime] = None
     instance_id: Optional[int] = None
     property_path: str
+    cancelled: bool = False
+    timed_out: bool = False
 
     def to_interface(self) -> IValidatorLog:
         start_time = self.start_time.isoformat() if self.start_time else None
@@ -0,0 +1,154 @@
+import math
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from guardrails.classes.validation.validation_result import FailResult
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.types.on_fail import OnFailAction
+
+if TYPE_CHECKING:
+    from guardrails.types.validator import ValidatorMap
+    from guardrails.validator_base import Validator
+
+# On fail actions that hand a different value to the validators after them.
+VALUE_CHANGING_ACTIONS = (OnFailAction.FIX, OnFailAction.FIX_REASK, OnFailAction.CUSTOM)
+
+
+@dataclass
+class ValidatorStats:
+    """Observed latency and failure rate of a single validator instance.
+
+    Attributes:
+        runs (int): The number of completed validations
+        failures (int): The number of validations that returned a FailResult
+        total_latency (float): The total time spent validating, in seconds
+    """
+
+    runs: int = 0
+    failures: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.runs if self.runs else 0.0
+
+    @property
+    def fail_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+    @property
+    def cost(self) -> float:
+        """The expected time spent per rejection.
+
+        Running validators in ascending order of this cost minimizes the
+        expected time until a value is rejected.
+        """
+        if not self.fail_rate:
+            return math.inf
+        return self.avg_latency / self.fail_rate
+
+
+class ValidatorOrdering:
+    """Collects per-validator statistics from ValidatorLogs and orders the
+    validators on each path so that cheap, frequently failing validators
+    run first.
+
+    Paths are only reordered once every validator on them has been
+    observed `min_samples` times, and never when a validator on the path
+    could change the value seen by the validators after it (fixes,
+    custom on fail methods or value overrides).
+
+    Statistics are only kept for the validators in the map last ordered,
+    so that those of validators removed from the Guard are dropped.
+    """
+
+    def __init__(self, min_samples: int = 5):
+        self.min_samples = min_samples
+        # Keyed by the id of the validator instance, as in ValidatorLogs.
+        self._stats: Dict[int, ValidatorStats] = {}
+        self._order: Dict[str, List["Validator"]] = {}
+        # Calls of the same Guard may record their logs concurrently.
+        self._lock = threading.Lock()
+
+    def record(self, validator_logs: Iterable[ValidatorLogs]) -> None:
+        """Update the statistics from the logs of a run."""
+        with self._lock:
+            for log in validator_logs:
+                if (
+                    log.cancelled
+                    or log.instance_id is None
+                    or log.validation_result is None
+                    or log.start_time is None
+                    or log.end_time is None
+                ):
+                    continue
+                stats = self._stats.setdefault(log.instance_id, ValidatorStats())
+                stats.runs += 1
+                stats.total_latency += (log.end_time - log.start_time).total_seconds()
+                if isinstance(log.validation_result, FailResult):
+                    stats.failures += 1
+
+    def get_stats(self, validator: "Validator") -> ValidatorStats:
+        """Get the statistics observed for a validator instance."""
+        return self._stats.get(id(validator), ValidatorStats())
+
+    @property
+    def chosen_order(self) -> Dict[str, List["Validator"]]:
+        """The order the validators on each path were last run in."""
+        return {path: list(validators) for path, validators in self._order.items()}
+
+    def can_reorder(self, validators: List["Validator"]) -> bool:
+        if len(validators) < 2:
+            return False
+        for validator in validators:
+            if validator.on_fail_descriptor in VALUE_CHANGING_ACTIONS:
+                return False
+            if validator.override_value_on_pass:
+                return False
+            if self.get_stats(validator).runs < self.min_samples:
+                return False
+        return True
+
+    def order(self, validator_map: "ValidatorMap") -> "ValidatorMap":
+        """Get the validator map with the validators on each path in the
+        order they should run.
+
+        Returns the given map unchanged if no path is reordered.
+        """
+        self._prune(validator_map)
+        ordered_map = validator_map
+        for path, validators in validator_map.items():
+            ordered = validators
+            if self.can_reorder(validators):
+                ordered = sorted(validators, key=self._sort_key)
+            self._order[path] = ordered
+            if ordered != validators or any(
+                a is not b for a, b in zip(ordered, validators)
+            ):
+                if ordered_map is validator_map:
+                    ordered_map = dict(validator_map)
+                ordered_map[path] = ordered
+        return ordered_map
+
+    def _prune(self, validator_map: "ValidatorMap") -> None:
+        """Drop the statistics and order of validators not in the map."""
+        validator_ids = {
+            id(validator)
+            for validators in validator_map.values()
+            for validator in validators
+        }
+        with self._lock:
+            if any(key not in validator_ids for key in self._stats):
+                self._stats = {
+                    key: stats
+                    for key, stats in self._stats.items()
+                    if key in validator_ids
+                }
+            for path in list(self._order):
+                if path not in validator_map:
+                    del self._order[path]
+
+    def _sort_key(self, validator: "Validator") -> Tuple[float, float]:
+        stats = self.get_stats(validator)
+        return stats.cost, stats.avg_latency
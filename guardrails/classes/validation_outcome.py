@@ -1,7 +1,6 @@
-from typing import Generic, Iterator, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, Union, cast
 
 from pydantic import Field
-from rich.pretty import pretty_repr
 
 from guardrails_api_client import (
     ValidationOutcome as IValidationOutcome,
@@ -10,6 +9,7 @@ from guardrails_api_client import (
 from guardrails.actions.reask import ReAsk
 from guardrails.classes.history import Call, Iteration
 from guardrails.classes.output_type import OT
+from guardrails.classes.validation.validation_result import StreamRetraction
 from guardrails.classes.generic.arbitrary_model import ArbitraryModel
 from guardrails.classes.validation.validation_summary import ValidationSummary
 from guardrails.constants import pass_status
@@ -30,6 +30,13 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
         validation_passed: A boolean to indicate whether or not the LLM output
             passed validation. If this is False, the validated_output may be invalid.
         error: If the validation failed, this field will contain the error message
+        speculative: When streaming speculatively, whether the validated_output
+            is the raw LLM output forwarded before validation finished.
+        retraction: When streaming speculatively, the previously streamed
+            text that validation has replaced.
+        patch: When streaming deltas of structured output, the JSON Patch
+            operations that turn the previously validated output into the
+            current one.
     """
 
     validation_summaries: Optional[List["ValidationSummary"]] = Field(
@@ -73,6 +80,39 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
     error: Optional[str] = Field(default=None)
     """If the validation failed, this field will contain the error message."""
 
+    speculative: bool = Field(
+        description="When streaming speculatively, whether the validated_output"
+        " is the raw LLM output forwarded before validation finished.",
+        default=False,
+    )
+    """When streaming speculatively, whether the validated_output is the raw
+    LLM output forwarded before validation finished.
+
+    Speculative output may later be replaced by a retraction.
+    """
+
+    retraction: Optional[StreamRetraction] = Field(
+        description="When streaming speculatively, the previously streamed"
+        " text that validation has replaced.",
+        default=None,
+    )
+    """When streaming speculatively, the previously streamed text that
+    validation has replaced."""
+
+    patch: Optional[List[Dict[str, Any]]] = Field(
+        description="When streaming deltas of structured output, the JSON Patch"
+        " operations that turn the previously validated output into the"
+        " current one.",
+        default=None,
+    )
+    """When streaming deltas of structured output, the JSON Patch (RFC 6902)
+    operations that turn the previously validated output into the current
+    one.
+
+    The raw_llm_output of a delta only holds the text received since the
+    previous delta, and its validated_output is None.
+    """
+
     @classmethod
     def from_guard_history(cls, call: Call):
         """Create a ValidationOutcome from a history Call object."""
@@ -120,6 +160,8 @@ class ValidationOutcome(IValidationOutcome, ArbitraryModel, Generic[OT]):
         return iter(getattr(self, k) for k in keys)
 
     def __str__(self) -> str:
+        from rich.pretty import pretty_repr
+
         return pretty_repr(self)
 
     def to_dict(self):
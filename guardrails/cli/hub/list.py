@@ -10,18 +10,29 @@ from .console import console
 @trace(name="guardrails-cli/hub/list")
 def list():
     """List all installed validators."""
+    from guardrails.hub.hub_index import get_hub_index_path, read_hub_index
     from guardrails.hub.validator_package_service import ValidatorPackageService
 
     site_packages = ValidatorPackageService.get_site_packages_location()
-    hub_init_file = os.path.join(site_packages, "guardrails", "hub", "__init__.py")
+    hub_dir = os.path.join(site_packages, "guardrails", "hub")
+    hub_index_file = get_hub_index_path(hub_dir)
+    hub_init_file = os.path.join(hub_dir, "__init__.py")
 
     installed_validators = []
 
+    if os.path.isfile(hub_index_file):
+        installed_validators.extend(read_hub_index(hub_index_file)["exports"])
+
+    # Older versions added an import line to the main __init__.py instead
     if os.path.isfile(hub_init_file):
         with open(hub_init_file, "r") as file:
             content = file.read()
-            matches = re.findall(r"from .* import (\w+)", content)
-            installed_validators.extend(matches)
+            matches = re.findall(
+                r"from (?!guardrails\.hub\.hub_index\b).* import (\w+)", content
+            )
+            installed_validators.extend(
+                match for match in matches if match not in installed_validators
+            )
 
     if installed_validators:
         console.print("Installed Validators:")
@@ -29,6 +29,7 @@ def remove_line(file_path: str, line_content: str):
 
 
 def remove_from_hub_inits(manifest: Manifest, site_packages: str):
+    from guardrails.hub.hub_index import get_hub_index_path, remove_from_hub_index
     from guardrails.hub.validator_package_service import ValidatorPackageService
 
     exports: List[str] = manifest.exports or []
@@ -40,8 +41,11 @@ def remove_from_hub_inits(manifest: Manifest, site_packages: str):
     )
     import_line = f"from {import_path} import {', '.join(sorted_exports)}"
 
-    # Remove import line from main __init__.py
-    hub_init_location = os.path.join(site_packages, "guardrails", "hub", "__init__.py")
+    hub_dir = os.path.join(site_packages, "guardrails", "hub")
+    remove_from_hub_index(get_hub_index_path(hub_dir), validator_id)
+
+    # Remove the import line older versions added to the main __init__.py
+    hub_init_location = os.path.join(hub_dir, "__init__.py")
     remove_line(hub_init_location, import_line)
 
 
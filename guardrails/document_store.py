@@ -79,6 +79,18 @@ class DocumentStoreBase(ABC):
         """
         ...
 
+    def search_batch(self, queries: List[str], k: int = 4) -> List[List[Page]]:
+        """Searches for pages similar to each of the queries.
+
+        Args:
+            queries: Texts to search for.
+            k: Number of similar pages to return per query.
+
+        Returns:
+            List[List[Page]] List of pages for each query, in query order.
+        """
+        return [self.search(query, k) for query in queries]
+
     @abstractmethod
     def add_text(self, text: str, meta: Dict[Any, Any]) -> str:
         """Adds a text to the store.
@@ -163,6 +175,15 @@ try:
             filtered_ids = list(filter(lambda x: x != -1, vector_db_indexes))
             return self._storage.get_pages_for_for_indexes(filtered_ids)
 
+        def search_batch(self, queries: List[str], k: int = 4) -> List[List[Page]]:
+            batch_indexes = self._vector_db.similarity_search_batch(queries, k)
+            return [
+                self._storage.get_pages_for_for_indexes(
+                    list(filter(lambda x: x != -1, vector_db_indexes))
+                )
+                for vector_db_indexes in batch_indexes
+            ]
+
         def search_with_threshold(
             self, query: str, threshold: float, k: int = 4
         ) -> List[Page]:
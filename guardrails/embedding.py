@@ -37,6 +37,14 @@ class EmbeddingBase(ABC):
         """Embeds a single query and returns a vector of floats."""
         ...
 
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embeds a list of queries and returns a list of vectors of floats.
+
+        Subclasses backed by an API that accepts multiple inputs should
+        override this to embed all queries in a single request.
+        """
+        return [self.embed_query(query) for query in queries]
+
     def _len_safe_get_embedding(
         self, text, embedder: Callable[[str], List[float]], average=True
     ) -> List[float]:
@@ -135,6 +143,11 @@ class OpenAIEmbedding(EmbeddingBase):
         resp = self._get_embedding([query])
         return resp[0]
 
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        if not queries:
+            return []
+        return self._get_embedding(queries)
+
     def _get_embedding(self, texts: List[str]) -> List[List[float]]:
         client = OpenAIClient(
             api_key=self.api_key,
@@ -208,6 +221,11 @@ class ManifestEmbedding(EmbeddingBase):
         resp = self._get_embedding([query])
         return resp[0]
 
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        if not queries:
+            return []
+        return self._get_embedding(queries)
+
     def _get_embedding(self, texts: List[str]) -> List[List[float]]:
         embeddings = self._manifest.run(texts)
         return embeddings  # type: ignore
@@ -8,6 +8,15 @@ class ValidationError(Exception):
     """
 
 
+class ValidatorTimeoutError(ValidationError):
+    """Thrown from the validation engine when a Validator does not finish
+    before its timeout or the call's deadline, and its on_timeout action
+    is OnTimeoutAction.EXCEPTION.
+
+    Inherits from ValidationError.
+    """
+
+
 class UserFacingException(Exception):
     """Wraps an exception to denote it as user-facing.
 
@@ -19,4 +28,4 @@ class UserFacingException(Exception):
         self.original_exception = original_exception
 
 
-__all__ = ["ValidationError", "UserFacingException"]
+__all__ = ["ValidationError", "ValidatorTimeoutError", "UserFacingException"]
@@ -1,8 +1,11 @@
 import contextvars
 import json
+from dataclasses import replace
 import os
+import threading
 from builtins import id as object_id
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -11,6 +14,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -18,7 +22,6 @@ from typing import (
 )
 from typing_extensions import deprecated
 import warnings
-from langchain_core.runnables import Runnable
 
 from guardrails_api_client import (
     Guard as IGuard,
@@ -27,7 +30,7 @@ from guardrails_api_client import (
     ValidationOutcome as IValidationOutcome,
 )
 from opentelemetry import context as otel_context
-from pydantic import field_validator
+from pydantic import field_serializer, field_validator
 from pydantic.config import ConfigDict
 
 from guardrails.api_client import GuardrailsApiClient
@@ -36,9 +39,14 @@ from guardrails.classes.rc import RC
 from guardrails.classes.validation.validation_result import ErrorSpan
 from guardrails.classes.validation.validation_summary import ValidationSummary
 from guardrails.classes.validation.validator_reference import ValidatorReference
+from guardrails.classes.validation.validator_stats import ValidatorOrdering
 from guardrails.classes.validation_outcome import ValidationOutcome
-from guardrails.classes.execution import GuardExecutionOptions
-from guardrails.classes.generic import Stack
+from guardrails.classes.execution import (
+    GuardExecutionOptions,
+    GuardExecutionPlan,
+    ValidatedMessages,
+)
+from guardrails.classes.generic import DeferredStack, Stack
 from guardrails.classes.history import Call
 from guardrails.classes.history.call_inputs import CallInputs
 from guardrails.classes.output_type import OutputTypes
@@ -53,8 +61,7 @@ from guardrails.llm_providers import (
 from guardrails.logger import logger, set_scope
 from guardrails.run import Runner, StreamRunner
 from guardrails.schema.primitive_schema import primitive_to_schema
-from guardrails.schema.pydantic_schema import pydantic_model_to_schema
-from guardrails.schema.rail_schema import rail_file_to_schema, rail_string_to_schema
+from guardrails.schema.schema_cache import schema_cache
 from guardrails.schema.validator import SchemaValidationError, validate_json_schema
 from guardrails.stores.context import (
     Tracer,
@@ -68,6 +75,7 @@ from guardrails.stores.context import (
 )
 from guardrails.hub_telemetry.hub_tracing import trace
 from guardrails.types.on_fail import OnFailAction
+from guardrails.types.on_timeout import OnTimeoutAction
 from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.utils.naming_utils import random_id
 from guardrails.utils.api_utils import extract_serializeable_metadata
@@ -79,7 +87,6 @@ from guardrails.telemetry import (
 from guardrails.utils.validator_utils import (
     get_validator,
     parse_validator_reference,
-    verify_metadata_requirements,
 )
 from guardrails.validator_base import Validator
 from guardrails.types import (
@@ -98,6 +105,9 @@ from guardrails.utils.structured_data_utils import (
 from guardrails.settings import settings
 from guardrails.decorators.experimental import experimental
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 
 class Guard(IGuard, Generic[OT]):
     """The Guard class.
@@ -159,7 +169,8 @@ class Guard(IGuard, Generic[OT]):
         model_schema = ModelSchema.from_dict(output_schema)
 
         # TODO: Support a sink for history so that it is not solely held in memory
-        history: Stack[Call] = Stack()
+        # The history of server calls is fetched on first access.
+        history: Stack[Call] = DeferredStack(fetch=self._fetch_history)
 
         # Super Init
         super().__init__(
@@ -193,11 +204,18 @@ class Guard(IGuard, Generic[OT]):
         self._validators: List[Validator] = []
         self._output_type: OutputTypes = OutputTypes.__from_json_schema__(output_schema)
         self._exec_opts: GuardExecutionOptions = GuardExecutionOptions()
+        self._execution_plan: Optional[GuardExecutionPlan] = None
+        # What the plan was built from that can be changed without `use`,
+        #   `use_many` or `configure`, as it is public.
+        self._execution_plan_inputs: Tuple[Any, ...] = ()
+        self._validator_ordering = ValidatorOrdering()
+        self._validated_messages = ValidatedMessages()
         self._tracer: Optional[Tracer] = None
         self._tracer_context: Optional[Context] = None
         self._hub_telemetry: HubTelemetry
         self._user_id: Optional[str] = None
         self._api_client: Optional[GuardrailsApiClient] = None
+        self._history_lock = threading.Lock()
         self._allow_metrics_collection: Optional[bool] = None
         self._output_formatter: Optional[BaseFormatter] = None
 
@@ -247,12 +265,28 @@ class Guard(IGuard, Generic[OT]):
                 raise ValueError(f"{str(e)}\n{json.dumps(e.fields, indent=2)}")
         return output_schema
 
+    @field_serializer("history", mode="wrap")
+    def _serialize_history(self, history: Stack[Call], handler) -> Any:
+        # Serializers read lists directly rather than iterating them,
+        #   so copy the history to fetch any deferred calls first.
+        return handler(Stack(*history))
+
     def configure(
         self,
         *,
         num_reasks: Optional[int] = None,
         tracer: Optional[Tracer] = None,
         allow_metrics_collection: Optional[bool] = None,
+        short_circuit: Optional[bool] = None,
+        reorder_validators: Optional[bool] = None,
+        speculative_streaming: Optional[bool] = None,
+        stream_deltas: Optional[bool] = None,
+        materialize_stream_deltas: Optional[bool] = None,
+        overlap_input_validation: Optional[bool] = None,
+        reissue_on_input_fix: Optional[bool] = None,
+        parallel_field_reasks: Optional[bool] = None,
+        validator_timeout: Optional[float] = None,
+        on_timeout: Optional[Union[str, OnTimeoutAction]] = None,
     ):
         """Configure the Guard.
 
@@ -265,9 +299,100 @@ class Guard(IGuard, Generic[OT]):
                 Guardrails to collect anonymous metrics.
                 Defaults to None, and falls back to waht is
                     set via the `guardrails configure` command.
+            short_circuit (bool, optional): Whether to stop validating a value
+                as soon as one validator has a terminal outcome
+                (an exception, filter or refrain), cancelling or skipping
+                the validators that are still pending. When False, every
+                validator runs and all failures are collected.
+                Defaults to None, which leaves the current setting (False
+                unless configured otherwise) unchanged.
+            reorder_validators (bool, optional): Whether to run the validators
+                on each path in order of their observed cost, so that cheap
+                validators which fail often run first. Paths with fixes,
+                custom on fail methods or value overrides keep their order.
+                See `validator_ordering` for the statistics collected.
+                Defaults to None, which leaves the current setting (False
+                unless configured otherwise) unchanged.
+            speculative_streaming (bool, optional): Whether streamed string
+                output should be forwarded as soon as it is read from the LLM,
+                before validation finishes. Validation then runs alongside,
+                and a ValidationOutcome with a `retraction` follows whenever
+                it changes or fails text that was already streamed.
+                Defaults to None, which leaves the current setting (False
+                unless configured otherwise) unchanged.
+            stream_deltas (bool, optional): Whether streamed structured output
+                should be yielded as deltas: the raw text received since the
+                previous ValidationOutcome, and a JSON Patch `patch` of the
+                validated output, instead of the whole of both every time.
+                Defaults to None, which leaves the current setting (False
+                unless configured otherwise) unchanged.
+            materialize_stream_deltas (bool, optional): Whether a stream of
+                deltas should end with a ValidationOutcome holding the complete
+                raw and validated output. Defaults to None, which leaves the
+                current setting (False unless configured otherwise) unchanged.
+            overlap_input_validation (bool, optional): Whether the LLM call
+                should start while the messages are still being validated,
+                instead of after. The call is cancelled, or its response
+                discarded, if the messages fail validation. This only applies
+                when every validator on the messages fails with "exception"
+                or "noop", as those cannot change the messages, unless
+                `reissue_on_input_fix` is set. Defaults to None, which leaves
+                the current setting (False unless configured otherwise)
+                unchanged.
+            reissue_on_input_fix (bool, optional): Whether
+                `overlap_input_validation` should also apply to validators that
+                can change the messages. When they do, the LLM call that was
+                started is discarded and issued again with the validated
+                messages. Defaults to None, which leaves the current setting
+                (False unless configured otherwise) unchanged.
+            parallel_field_reasks (bool, optional): Whether fields that fail
+                validation in different top level keys of structured output
+                should be reasked for in separate, concurrent LLM calls, each
+                only for the fields under its key. Does not apply to full
+                schema reasks. Defaults to None, which leaves the current
+                setting (False unless configured otherwise) unchanged.
+            validator_timeout (float, optional): The number of seconds each
+                validator may run for. Validators constructed with their own
+                `timeout` use it instead. Defaults to None, which leaves the
+                current setting (unbounded unless configured otherwise)
+                unchanged.
+            on_timeout (OnTimeoutAction, optional): How to treat a validator
+                that does not finish in time: as a pass, as a failure handled
+                by its on_fail action, or by raising a ValidatorTimeoutError.
+                Validators constructed with their own `on_timeout` use it
+                instead. Defaults to None, which leaves the current setting
+                ("exception" unless configured otherwise) unchanged.
         """
+        self._invalidate_execution_plan()
         if num_reasks:
             self._set_num_reasks(num_reasks)
+        if short_circuit is not None:
+            self._exec_opts.short_circuit = short_circuit
+        if reorder_validators is not None:
+            self._exec_opts.reorder_validators = reorder_validators
+        if speculative_streaming is not None:
+            self._exec_opts.speculative_streaming = speculative_streaming
+        if stream_deltas is not None:
+            self._exec_opts.stream_deltas = stream_deltas
+        if materialize_stream_deltas is not None:
+            self._exec_opts.materialize_stream_deltas = materialize_stream_deltas
+        if overlap_input_validation is not None:
+            self._exec_opts.overlap_input_validation = overlap_input_validation
+        if reissue_on_input_fix is not None:
+            self._exec_opts.reissue_on_input_fix = reissue_on_input_fix
+        if parallel_field_reasks is not None:
+            self._exec_opts.parallel_field_reasks = parallel_field_reasks
+        if validator_timeout is not None or on_timeout is not None:
+            timeouts = self._exec_opts.timeouts
+            self._exec_opts.timeouts = replace(
+                timeouts,
+                timeout=(
+                    validator_timeout
+                    if validator_timeout is not None
+                    else timeouts.timeout
+                ),
+                on_timeout=OnTimeoutAction(on_timeout or timeouts.on_timeout),
+            )
         if tracer:
             self._set_tracer(tracer)
         self._load_rc()
@@ -368,6 +493,67 @@ class Guard(IGuard, Generic[OT]):
             self._exec_opts.messages = messages
         if reask_messages is not None:
             self._exec_opts.reask_messages = reask_messages
+        if self._execution_plan is not None:
+            self._execution_plan = self._execution_plan.with_exec_options(
+                num_reasks=num_reasks,
+                messages=messages,
+                reask_messages=reask_messages,
+            )
+
+    def _get_execution_plan(self) -> GuardExecutionPlan:
+        """Get the cached execution plan, building it if the Guard has been
+        reconfigured since the last call."""
+        # output_schema and validators can be reassigned or changed in place,
+        #   so the plan is only reused while they are the same objects.
+        plan_inputs = (self.output_schema, self.validators, *self.validators)
+        if self._execution_plan is not None and (
+            len(plan_inputs) != len(self._execution_plan_inputs)
+            or any(a is not b for a, b in zip(plan_inputs, self._execution_plan_inputs))
+        ):
+            self._invalidate_execution_plan()
+        if self._execution_plan is None:
+            self._fill_validator_map()
+            self._fill_validators()
+            self._execution_plan = GuardExecutionPlan.build(
+                output_type=self._output_type,
+                output_schema=self.output_schema.to_dict(),
+                validator_map=self._validator_map,
+                exec_options=self._exec_opts,
+            )
+            self._execution_plan_inputs = plan_inputs
+        return self._execution_plan
+
+    def _invalidate_execution_plan(self) -> None:
+        self._execution_plan = None
+
+    @property
+    def validator_ordering(self) -> ValidatorOrdering:
+        """The latency and failure statistics observed for this Guard's
+        validators, and the order they were last run in when
+        `reorder_validators` is configured."""
+        return self._validator_ordering
+
+    def _get_validator_map(self, execution_plan: GuardExecutionPlan) -> ValidatorMap:
+        if execution_plan.exec_options.reorder_validators:
+            return self._validator_ordering.order(execution_plan.validator_map)
+        return execution_plan.validator_map
+
+    def _get_exec_options(
+        self,
+        execution_plan: GuardExecutionPlan,
+        validation_timeout: Optional[float] = None,
+    ) -> GuardExecutionOptions:
+        exec_options = execution_plan.exec_options
+        if validation_timeout is not None:
+            exec_options = replace(
+                exec_options,
+                timeouts=exec_options.timeouts.with_deadline(validation_timeout),
+            )
+        return exec_options
+
+    def _record_validator_stats(self, call: Call) -> None:
+        if self._exec_opts.reorder_validators:
+            self._validator_ordering.record(call.validator_logs)
 
     @classmethod
     def _for_rail_schema(
@@ -446,7 +632,7 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = rail_file_to_schema(rail_file)
+        schema = schema_cache.rail_file_to_schema(rail_file)
         return cls._for_rail_schema(
             schema,
             rail=rail_file,
@@ -508,7 +694,7 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = rail_string_to_schema(rail_string)
+        schema = schema_cache.rail_string_to_schema(rail_string)
         return cls._for_rail_schema(
             schema,
             rail=rail_string,
@@ -569,7 +755,7 @@ class Guard(IGuard, Generic[OT]):
         #   and therefore the Validators, are initialized
         cls._set_tracer(cls, tracer)  # type: ignore
 
-        schema = pydantic_model_to_schema(output_class)
+        schema = schema_cache.pydantic_model_to_schema(output_class)
         exec_opts = GuardExecutionOptions(
             reask_messages=reask_messages,
             messages=messages,
@@ -689,21 +875,21 @@ class Guard(IGuard, Generic[OT]):
         reask_messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict],
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
-        self._fill_validator_map()
-        self._fill_validators()
         self._fill_exec_opts(
             num_reasks=num_reasks,
             messages=messages,
             reask_messages=reask_messages,
         )
+        execution_plan = self._get_execution_plan()
         metadata = metadata or {}
         # if not llm_output and llm_api and not (messages):
         #     raise RuntimeError("'messages' must be provided in order to call an LLM!")
 
         # check if validator requirements are fulfilled
-        missing_keys = verify_metadata_requirements(metadata, self._validators)
+        missing_keys = execution_plan.missing_metadata_keys(metadata)
         if missing_keys:
             raise ValueError(
                 f"Missing required metadata keys: {', '.join(missing_keys)}"
@@ -719,6 +905,7 @@ class Guard(IGuard, Generic[OT]):
             messages: Optional[List[Dict]] = None,
             metadata: Optional[Dict] = None,
             full_schema_reask: Optional[bool] = None,
+            validation_timeout: Optional[float] = None,
             **kwargs,
         ):
             prompt_params = prompt_params or {}
@@ -776,6 +963,7 @@ class Guard(IGuard, Generic[OT]):
                 messages=messages,
                 metadata=metadata,
                 full_schema_reask=full_schema_reask,
+                validation_timeout=validation_timeout,
                 call_log=call_log,
                 *args,
                 **kwargs,
@@ -799,6 +987,7 @@ class Guard(IGuard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             *args,
             **kwargs,
         )
@@ -813,10 +1002,14 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: int = 0,  # Should be defined at this point
         metadata: Dict,  # Should be defined at this point
         full_schema_reask: bool = False,  # Should be defined at this point
+        validation_timeout: Optional[float] = None,
         messages: Optional[List[Dict]] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
         api = None
+        execution_plan = self._get_execution_plan()
+        validator_map = self._get_validator_map(execution_plan)
+        exec_options = self._get_exec_options(execution_plan, validation_timeout)
 
         if llm_api is not None or kwargs.get("model") is not None:
             api = get_llm_ask(llm_api, *args, **kwargs)
@@ -829,10 +1022,10 @@ class Guard(IGuard, Generic[OT]):
         if kwargs.get("stream", False):
             # If stream is True, use StreamRunner
             runner = StreamRunner(
-                output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_type=execution_plan.output_type,
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
-                validation_map=self._validator_map,
+                validation_map=validator_map,
                 messages=messages,
                 api=api,
                 metadata=metadata,
@@ -844,16 +1037,17 @@ class Guard(IGuard, Generic[OT]):
                     if isinstance(self._allow_metrics_collection, bool)
                     else None
                 ),
-                exec_options=self._exec_opts,
+                exec_options=exec_options,
+                validated_messages=self._validated_messages,
             )
             return runner(call_log=call_log, prompt_params=prompt_params)
         else:
             # Otherwise, use Runner
             runner = Runner(
-                output_type=self._output_type,
-                output_schema=self.output_schema.to_dict(),
+                output_type=execution_plan.output_type,
+                output_schema=execution_plan.output_schema,
                 num_reasks=num_reasks,
-                validation_map=self._validator_map,
+                validation_map=validator_map,
                 messages=messages,
                 api=api,
                 metadata=metadata,
@@ -865,9 +1059,13 @@ class Guard(IGuard, Generic[OT]):
                     if isinstance(self._allow_metrics_collection, bool)
                     else None
                 ),
-                exec_options=self._exec_opts,
+                exec_options=exec_options,
+                validated_messages=self._validated_messages,
             )
-            call = runner(call_log=call_log, prompt_params=prompt_params)
+            try:
+                call = runner(call_log=call_log, prompt_params=prompt_params)
+            finally:
+                self._record_validator_stats(call_log)
             return ValidationOutcome[OT].from_guard_history(call)
 
     @trace(name="/guard_call", origin="Guard.__call__")
@@ -880,6 +1078,7 @@ class Guard(IGuard, Generic[OT]):
         messages: Optional[List[Dict]] = None,
         metadata: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> Union[ValidationOutcome[OT], Iterator[ValidationOutcome[OT]]]:
         """Call the LLM and validate the output.
@@ -895,6 +1094,10 @@ class Guard(IGuard, Generic[OT]):
                                or just the incorrect values.
                                Defaults to `True` if a base model is provided,
                                `False` otherwise.
+            validation_timeout: The number of seconds from the start of the call
+                                by which all validation must have finished.
+                                Validators still running at the deadline are
+                                handled by their on timeout action.
 
         Returns:
             ValidationOutcome
@@ -910,7 +1113,7 @@ class Guard(IGuard, Generic[OT]):
 
         return trace_guard_execution(
             self.name,
-            self.history,
+            self._current_history(),
             self._execute,
             self._tracer,
             *args,
@@ -920,6 +1123,7 @@ class Guard(IGuard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             **kwargs,
         )
 
@@ -933,6 +1137,7 @@ class Guard(IGuard, Generic[OT]):
         num_reasks: Optional[int] = None,
         prompt_params: Optional[Dict] = None,
         full_schema_reask: Optional[bool] = None,
+        validation_timeout: Optional[float] = None,
         **kwargs,
     ) -> ValidationOutcome[OT]:
         """Alternate flow to using Guard where the llm_output is known.
@@ -946,6 +1151,10 @@ class Guard(IGuard, Generic[OT]):
             prompt_params: The parameters to pass to the prompt.format() method.
             full_schema_reask: When reasking, whether to regenerate the full schema
                                or just the incorrect values.
+            validation_timeout: The number of seconds from the start of the call
+                                by which all validation must have finished.
+                                Validators still running at the deadline are
+                                handled by their on timeout action.
 
         Returns:
             ValidationOutcome
@@ -965,7 +1174,7 @@ class Guard(IGuard, Generic[OT]):
 
         return trace_guard_execution(
             self.name,
-            self.history,
+            self._current_history(),
             self._execute,  # type: ignore # streams are supported for parse
             self._tracer,
             *args,
@@ -976,6 +1185,7 @@ class Guard(IGuard, Generic[OT]):
             messages=messages,
             metadata=metadata,
             full_schema_reask=full_schema_reask,
+            validation_timeout=validation_timeout,
             **kwargs,
         )
 
@@ -1018,6 +1228,7 @@ class Guard(IGuard, Generic[OT]):
         self._validator_map[on] = self._validator_map.get(on, [])
         self._validator_map[on].append(validator)
         self._validators.append(validator)
+        self._invalidate_execution_plan()
 
     @overload
     def use(self, validator: Validator, *, on: str = "output") -> "Guard": ...
@@ -1104,6 +1315,76 @@ class Guard(IGuard, Generic[OT]):
         else:
             raise ValueError("Using the Guardrails server is not enabled!")
 
+    def _defer_history(self, call_id: Optional[str]):
+        """Fetch the history of a server call the next time `history` is
+        accessed, instead of after every call."""
+        if not call_id:
+            return
+        if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() != "true":
+            return
+        with self._history_lock:
+            history = self.history
+            if not isinstance(history, DeferredStack):
+                # The history was replaced, e.g. by from_interface.
+                history = DeferredStack(*history, fetch=self._fetch_history)
+                self.history = history
+        history.defer(call_id)
+
+    def _fetch_history(self, call_id: str) -> List[Call]:
+        if not self._api_client:
+            return []
+        guard_history = self._api_client.get_history(self.name, call_id)
+        return [Call.from_interface(call) for call in guard_history]
+
+    def _current_history(self) -> Stack[Call]:
+        """The history to trace a call with, which must not fetch the calls
+        deferred by `_defer_history`."""
+        history = self.history
+        if isinstance(history, DeferredStack) and settings.use_server:
+            # Server calls are not pushed to the history, so a copy of the
+            #   calls fetched so far is as current.
+            return history.loaded()
+        return history
+
+    def _server_validation_outcome(
+        self, validation_output: Optional[IValidationOutcome]
+    ) -> ValidationOutcome[OT]:
+        if not validation_output:
+            return ValidationOutcome[OT](
+                call_id="0",  # type: ignore
+                raw_llm_output=None,
+                validated_output=None,
+                validation_passed=False,
+                error="The response from the server was empty!",
+            )
+        self._defer_history(validation_output.call_id)
+
+        # Summarize the failures from the server's summaries, as
+        #   the history they were read from before is fetched lazily.
+        validation_summaries = [
+            ValidationSummary.from_dict(summary.to_dict())
+            for summary in validation_output.validation_summaries or []
+            if summary.failure_reason
+        ]
+
+        # TODO: See if the below statement is still true
+        # Our interfaces are too different for this to work right now.
+        # Once we move towards shared interfaces for both the open source
+        # and the api we can re-enable this.
+        # return ValidationOutcome[OT].from_guard_history(call_log)
+        validated_output = (
+            cast(OT, validation_output.validated_output.actual_instance)
+            if validation_output.validated_output
+            else None
+        )
+        return ValidationOutcome[OT](
+            call_id=validation_output.call_id,  # type: ignore
+            raw_llm_output=validation_output.raw_llm_output,
+            validated_output=validated_output,
+            validation_passed=(validation_output.validation_passed is True),
+            validation_summaries=validation_summaries,
+        )
+
     def _single_server_call(self, *, payload: Dict[str, Any]) -> ValidationOutcome[OT]:
         if settings.use_server and self._api_client:
             validation_output: IValidationOutcome = self._api_client.validate(
@@ -1111,46 +1392,7 @@ class Guard(IGuard, Generic[OT]):
                 payload=ValidatePayload.from_dict(payload),  # type: ignore
                 openai_api_key=get_call_kwarg("api_key"),
             )
-            if not validation_output:
-                return ValidationOutcome[OT](
-                    call_id="0",  # type: ignore
-                    raw_llm_output=None,
-                    validated_output=None,
-                    validation_passed=False,
-                    error="The response from the server was empty!",
-                )
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                guard_history = self._api_client.get_history(
-                    self.name, validation_output.call_id
-                )
-                self.history.extend(
-                    [Call.from_interface(call) for call in guard_history]
-                )
-
-            validation_summaries = []
-            if self.history.last and self.history.last.iterations.last:
-                validator_logs = self.history.last.iterations.last.validator_logs
-                validation_summaries = ValidationSummary.from_validator_logs_only_fails(
-                    validator_logs
-                )
-
-            # TODO: See if the below statement is still true
-            # Our interfaces are too different for this to work right now.
-            # Once we move towards shared interfaces for both the open source
-            # and the api we can re-enable this.
-            # return ValidationOutcome[OT].from_guard_history(call_log)
-            validated_output = (
-                cast(OT, validation_output.validated_output.actual_instance)
-                if validation_output.validated_output
-                else None
-            )
-            return ValidationOutcome[OT](
-                call_id=validation_output.call_id,  # type: ignore
-                raw_llm_output=validation_output.raw_llm_output,
-                validated_output=validated_output,
-                validation_passed=(validation_output.validation_passed is True),
-                validation_summaries=validation_summaries,
-            )
+            return self._server_validation_outcome(validation_output)
         else:
             raise ValueError("Guard does not have an api client!")
 
@@ -1189,14 +1431,8 @@ class Guard(IGuard, Generic[OT]):
                         validation_passed=(validation_output.validation_passed is True),
                     )
 
-            if os.environ.get("GUARD_HISTORY_ENABLED", "true").lower() == "true":
-                if validation_output:
-                    guard_history = self._api_client.get_history(
-                        self.name, validation_output.call_id
-                    )
-                    self.history.extend(
-                        [Call.from_interface(call) for call in guard_history]
-                    )
+            if validation_output:
+                self._defer_history(validation_output.call_id)
         else:
             raise ValueError("Guard does not have an api client!")
 
@@ -1258,7 +1494,7 @@ class Guard(IGuard, Generic[OT]):
                 self._api_client = GuardrailsApiClient(api_key=api_key)
             self.upsert_guard()
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         """Convert a Guard to a LangChain Runnable."""
         from guardrails.integrations.langchain.guard_runnable import GuardRunnable
 
@@ -1322,7 +1558,7 @@ class Guard(IGuard, Generic[OT]):
             if i_guard.history
             else []
         )
-        guard.history = Stack(*history)
+        guard.history = DeferredStack(*history, fetch=guard._fetch_history)
         return guard
 
     # attempts to get a guard from the server
@@ -1,2 +1,8 @@
-# Should contain imports for all validators
-# Will be auto-populated by the installation script
+# Exports the validators installed from the hub.
+# Each one is imported from its package the first time it is used,
+# as recorded in hub_index.json by the installation script.
+from guardrails.hub.hub_index import HubNamespace as _HubNamespace
+
+_namespace = _HubNamespace(globals())
+__getattr__ = _namespace.module_getattr
+__dir__ = _namespace.module_dir
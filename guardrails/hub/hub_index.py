@@ -0,0 +1,214 @@
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from guardrails.logger import logger
+
+HUB_INDEX_FILE = "hub_index.json"
+
+# An index of the installed validator packages:
+#   "exports" maps each name a package exports to the package's module,
+#   and "validators" maps each validator id to its package's module.
+HubIndex = Dict[str, Dict[str, str]]
+
+_lock = threading.Lock()
+_cached_index: Dict[str, Tuple[Optional[Tuple[int, int]], HubIndex]] = {}
+_imported_unindexed_modules = False
+
+
+def get_hub_index_path(hub_dir: Optional[str] = None) -> str:
+    return os.path.join(hub_dir or os.path.dirname(__file__), HUB_INDEX_FILE)
+
+
+def read_hub_index(index_path: str) -> HubIndex:
+    try:
+        with open(index_path, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+    except FileNotFoundError:
+        index = {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read the hub index at {index_path}: {e}")
+        index = {}
+    return {
+        "exports": dict(index.get("exports", {})),
+        "validators": dict(index.get("validators", {})),
+    }
+
+
+def load_hub_index(index_path: Optional[str] = None) -> HubIndex:
+    """Get the hub index, only reading it again once it has changed."""
+    index_path = index_path or get_hub_index_path()
+    try:
+        stat = os.stat(index_path)
+        version = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        version = None
+    with _lock:
+        cached = _cached_index.get(index_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    index = read_hub_index(index_path)
+    with _lock:
+        _cached_index[index_path] = (version, index)
+    return index
+
+
+def add_to_hub_index(
+    index_path: str, validator_id: str, module_name: str, exports: Iterable[str]
+) -> bool:
+    """Index a validator package and the names it exports.
+
+    Returns:
+        Whether the index changed.
+    """
+    index = read_hub_index(index_path)
+    exports = list(exports)
+    if index["validators"].get(validator_id) == module_name and all(
+        index["exports"].get(export) == module_name for export in exports
+    ):
+        return False
+
+    index["validators"][validator_id] = module_name
+    for export in exports:
+        index["exports"][export] = module_name
+    _write_hub_index(index_path, index)
+    return True
+
+
+def remove_from_hub_index(index_path: str, validator_id: str) -> bool:
+    """Remove a validator package and the names it exports from the index.
+
+    Returns:
+        Whether the index changed.
+    """
+    index = read_hub_index(index_path)
+    module_name = index["validators"].pop(validator_id, None)
+    if module_name is None:
+        return False
+
+    index["exports"] = {
+        export: export_module
+        for export, export_module in index["exports"].items()
+        if export_module != module_name
+    }
+    _write_hub_index(index_path, index)
+    return True
+
+
+def _write_hub_index(index_path: str, index: HubIndex) -> None:
+    index_dir = os.path.dirname(index_path)
+    os.makedirs(index_dir, exist_ok=True)
+    # Write to a temporary file first, so that other processes
+    #   never read a partially written index.
+    fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file, indent=2, sort_keys=True)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def import_unindexed_hub_modules(index_path: Optional[str] = None) -> None:
+    """Import every installed validator package that is not in the index.
+
+    Packages installed by older versions of guardrails were imported
+    eagerly instead of being indexed.
+    """
+    global _imported_unindexed_modules
+    if _imported_unindexed_modules:
+        return
+    _imported_unindexed_modules = True
+
+    indexed_modules: Set[str] = set(load_hub_index(index_path)["validators"].values())
+    for module_info in pkgutil.iter_modules():
+        module_name = module_info.name
+        if "_grhub_" in module_name and module_name not in indexed_modules:
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                logger.warning(f"Could not import {module_name}: {e}")
+
+
+def import_hub_validator(
+    validator_id: Optional[str] = None, index_path: Optional[str] = None
+) -> None:
+    """Import the package of an installed validator so it is registered,
+    or every installed validator package when there is no id."""
+    index = load_hub_index(index_path)
+    if validator_id is None:
+        for module_name in set(index["validators"].values()):
+            importlib.import_module(module_name)
+        import_unindexed_hub_modules(index_path)
+        return
+
+    module_name = index["validators"].get(validator_id)
+    if module_name is not None:
+        importlib.import_module(module_name)
+    else:
+        import_unindexed_hub_modules(index_path)
+
+
+class HubNamespace:
+    """Resolves the names exported by installed validator packages as
+    attributes of `guardrails.hub`, importing only the package they are
+    from on first access.
+
+    Usage:
+        _namespace = HubNamespace(globals())
+        __getattr__ = _namespace.module_getattr
+        __dir__ = _namespace.module_dir
+    """
+
+    def __init__(
+        self, module_globals: Dict[str, Any], index_path: Optional[str] = None
+    ):
+        self._module_globals = module_globals
+        self._index_path = index_path
+
+    def _exports(self) -> Dict[str, str]:
+        return load_hub_index(self._index_path)["exports"]
+
+    def module_getattr(self, name: str) -> Any:
+        """Module level `__getattr__` that imports exports on demand."""
+        if name == "__all__":
+            return sorted(self._exports())
+
+        module_name = self._exports().get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name), name)
+        elif not name.startswith("_") and not self._is_submodule(name):
+            value = self._find_unindexed(name)
+        else:
+            value = None
+
+        if value is None:
+            raise AttributeError(
+                f"module {self._module_globals.get('__name__')!r}"
+                f" has no attribute {name!r}"
+            )
+        self._module_globals[name] = value
+        return value
+
+    def module_dir(self) -> List[str]:
+        return sorted(set(self._module_globals) | set(self._exports()))
+
+    def _is_submodule(self, name: str) -> bool:
+        package_path = self._module_globals.get("__path__", [])
+        return any(module.name == name for module in pkgutil.iter_modules(package_path))
+
+    def _find_unindexed(self, name: str) -> Any:
+        import_unindexed_hub_modules(self._index_path)
+        indexed_modules = set(load_hub_index(self._index_path)["validators"].values())
+        for module_name, module in list(sys.modules.items()):
+            if "_grhub_" in module_name and module_name not in indexed_modules:
+                value = getattr(module, name, None)
+                if value is not None:
+                    return value
+        return None
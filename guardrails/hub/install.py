@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import contextlib
 from string import Template
 from typing import Callable, cast, List
 
 import pkg_resources
+from guardrails_hub_types import Manifest
 
 from guardrails.hub.validator_package_service import (
     ValidatorPackageService,
@@ -63,7 +65,6 @@ def install(
     """
 
     verbose_printer = console.print
-    quiet_printer = console.print if not quiet else lambda x: None
 
     # 1. Validation
     rc_file_exists = RC.exists()
@@ -85,7 +86,9 @@ def install(
     fetch_manifest_msg = "Fetching manifest"
     with loader(fetch_manifest_msg, spinner="bouncingBar"):
         (module_manifest, site_packages) = (
-            ValidatorPackageService.get_manifest_and_site_packages(validator_id)
+            ValidatorPackageService.get_manifest_and_site_packages(
+                validator_id, validator_version, refresh=upgrade
+            )
         )
 
     # 3. Install - Pip Installation of git module
@@ -99,6 +102,31 @@ def install(
             logger=cli_logger,
         )
 
+    # 4. Post Installation
+    if should_install_local_models(
+        module_manifest,
+        rc_file_exists,
+        install_local_models=install_local_models,
+        install_local_models_confirm=install_local_models_confirm,
+    ):
+        post_msg = "Running post-install setup"
+        with loader(post_msg, spinner="bouncingBar"):
+            ValidatorPackageService.run_post_install(
+                module_manifest, site_packages, logger=cli_logger
+            )
+
+    # 5. Get Validator Class for the installed module
+    return complete_install(package_uri, module_manifest, site_packages, quiet=quiet)
+
+
+def should_install_local_models(
+    module_manifest: Manifest,
+    rc_file_exists: bool,
+    install_local_models=None,
+    install_local_models_confirm: Callable = default_local_models_confirm,
+) -> bool:
+    """Whether to run a validator's post-install setup, which downloads the
+    models it needs for local inference."""
     use_remote_endpoint = False
     module_has_endpoint = (
         module_manifest.tags and module_manifest.tags.has_guardrails_endpoint
@@ -115,7 +143,6 @@ def install(
     except AttributeError:
         pass
 
-    # 4. Post Installation
     install_local_models = (
         install_local_models if install_local_models is not None else True
     )
@@ -124,20 +151,28 @@ def install(
             level=LEVELS.get("SPAM"),  # type: ignore
             msg="Installing models locally!",
         )
-        post_msg = "Running post-install setup"
-        with loader(post_msg, spinner="bouncingBar"):
-            ValidatorPackageService.run_post_install(
-                module_manifest, site_packages, logger=cli_logger
-            )
-    else:
-        cli_logger.log(
-            level=LEVELS.get("SPAM"),  # type: ignore
-            msg="Skipping post install, models will not be "
-            "downloaded for local inference.",
-        )
+        return True
+
+    cli_logger.log(
+        level=LEVELS.get("SPAM"),  # type: ignore
+        msg="Skipping post install, models will not be downloaded for local inference.",
+    )
+    return False
+
+
+def complete_install(
+    package_uri: str,
+    module_manifest: Manifest,
+    site_packages: str,
+    quiet: bool = True,
+) -> ValidatorModuleType:
+    """Add an installed validator to the hub index and import its module."""
+    verbose_printer = console.print
+    quiet_printer = console.print if not quiet else lambda x: None
+    validator_id = module_manifest.id
+
     ValidatorPackageService.add_to_hub_inits(module_manifest, site_packages)
 
-    # 5. Get Validator Class for the installed module
     installed_module = ValidatorPackageService.get_validator_from_manifest(
         module_manifest
     )
@@ -206,16 +241,79 @@ def install_multiple(
     Returns:
         List[ValidatorModuleType]: List of installed validator modules.
     """
-    installed_modules = []
+    if not package_uris:
+        return []
+
+    verbose_printer = console.print
+
+    # 1. Validation
+    rc_file_exists = RC.exists()
+    validators = [
+        ValidatorPackageService.get_validator_id(package_uri)
+        for package_uri in package_uris
+    ]
 
     for package_uri in package_uris:
-        installed_module = install(
-            package_uri,
+        installing_msg = f"Installing {package_uri}..."
+        cli_logger.log(
+            level=LEVELS.get("SPAM"),  # type: ignore
+            msg=installing_msg,
+        )
+        verbose_printer(installing_msg)
+
+    # Define Loader for UX purposes
+    loader = console.status if not quiet else do_nothing_context
+
+    # 2. Prep Installation - Fetch the manifests concurrently
+    fetch_manifest_msg = "Fetching manifests"
+    with loader(fetch_manifest_msg, spinner="bouncingBar"):
+        site_packages = ValidatorPackageService.get_site_packages_location()
+        with ThreadPoolExecutor() as executor:
+            manifests = list(
+                executor.map(
+                    lambda validator: ValidatorPackageService.get_manifest(
+                        *validator, refresh=upgrade
+                    ),
+                    validators,
+                )
+            )
+
+    # 3. Install - Resolve every package with a single pip invocation
+    dl_deps_msg = "Downloading dependencies"
+    with loader(dl_deps_msg, spinner="bouncingBar"):
+        ValidatorPackageService.install_hub_modules(
+            validators, quiet=quiet, upgrade=upgrade, logger=cli_logger
+        )
+
+    # 4. Post Installation - Confirmations are asked for one at a time,
+    #   then the post-install scripts are run concurrently.
+    post_install_manifests = [
+        module_manifest
+        for module_manifest in manifests
+        if should_install_local_models(
+            module_manifest,
+            rc_file_exists,
             install_local_models=install_local_models,
-            quiet=quiet,
-            upgrade=upgrade,  # Pass upgrade here
             install_local_models_confirm=install_local_models_confirm,
         )
-        installed_modules.append(installed_module)
-
-    return installed_modules
+    ]
+    if post_install_manifests:
+        post_msg = "Running post-install setup"
+        with loader(post_msg, spinner="bouncingBar"):
+            with ThreadPoolExecutor() as executor:
+                list(
+                    executor.map(
+                        lambda module_manifest: (
+                            ValidatorPackageService.run_post_install(
+                                module_manifest, site_packages, logger=cli_logger
+                            )
+                        ),
+                        post_install_manifests,
+                    )
+                )
+
+    # 5. Get Validator Classes for the installed modules
+    return [
+        complete_install(package_uri, module_manifest, site_packages, quiet=quiet)
+        for package_uri, module_manifest in zip(package_uris, manifests)
+    ]
@@ -1,11 +1,14 @@
+import hashlib
 import importlib
+import json
 import os
 from pathlib import Path
 import re
 import subprocess
 import sys
+import tempfile
 
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Sequence, Tuple
 from types import ModuleType
 from packaging.utils import canonicalize_name  # PEP 503
 
@@ -14,6 +17,7 @@ from guardrails.logger import logger as guardrails_logger
 
 from guardrails.cli.hub.utils import PipProcessError, pip_process_with_custom_exception
 from guardrails_hub_types import Manifest
+from guardrails.hub.hub_index import add_to_hub_index, get_hub_index_path
 from guardrails.cli.server.hub_client import get_validator_manifest
 from guardrails.settings import settings
 
@@ -22,6 +26,12 @@ json_format: Literal["json"] = "json"
 string_format: Literal["string"] = "string"
 
 
+def get_manifest_cache_dir() -> Optional[str]:
+    if settings.hub_manifest_cache_dir is not None:
+        return settings.hub_manifest_cache_dir
+    return os.environ.get("GUARDRAILS_HUB_MANIFEST_CACHE_DIR") or None
+
+
 class ValidatorModuleType(ModuleType):
     __validator_exports__: List[str]
 
@@ -48,11 +58,77 @@ class InvalidHubInstallURL(Exception):
 
 class ValidatorPackageService:
     @staticmethod
-    def get_manifest_and_site_packages(module_name: str) -> tuple[Manifest, str]:
-        module_manifest = get_validator_manifest(module_name)
+    def get_manifest_and_site_packages(
+        module_name: str, validator_version: Optional[str] = None, refresh: bool = False
+    ) -> tuple[Manifest, str]:
+        module_manifest = ValidatorPackageService.get_manifest(
+            module_name, validator_version, refresh=refresh
+        )
         site_packages = ValidatorPackageService.get_site_packages_location()
         return (module_manifest, site_packages)
 
+    @staticmethod
+    def get_manifest_cache_path(
+        cache_dir: str, validator_id: str, validator_version: Optional[str] = None
+    ) -> str:
+        key = hashlib.sha256(
+            f"{validator_id}\0{validator_version or ''}".encode()
+        ).hexdigest()
+        return os.path.join(cache_dir, f"{key}.json")
+
+    @staticmethod
+    def get_manifest(
+        validator_id: str,
+        validator_version: Optional[str] = None,
+        refresh: bool = False,
+    ) -> Manifest:
+        """Get a validator's manifest from the hub, or from the manifest cache
+        when `get_manifest_cache_dir()` is set.
+
+        Args:
+            validator_id (str): The id of the validator
+            validator_version (Optional[str]): The version specifier it is
+                installed with
+            refresh (bool): Whether to fetch the manifest even if it is cached
+
+        Returns:
+            Manifest: The validator's manifest
+        """
+        cache_dir = get_manifest_cache_dir()
+        if not cache_dir:
+            return get_validator_manifest(validator_id)
+
+        cache_path = ValidatorPackageService.get_manifest_cache_path(
+            cache_dir, validator_id, validator_version
+        )
+        if not refresh:
+            try:
+                with open(cache_path, encoding="utf-8") as cached_manifest:
+                    return Manifest.from_dict(json.load(cached_manifest))  # type: ignore
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                guardrails_logger.debug(
+                    f"Could not read cached manifest for {validator_id}: {e}"
+                )
+
+        module_manifest = get_validator_manifest(validator_id)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that other processes
+            #   never read a partially written manifest.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as cached_manifest:
+                    json.dump(module_manifest.to_dict(), cached_manifest)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            guardrails_logger.debug(f"Could not cache manifest for {validator_id}: {e}")
+        return module_manifest
+
     @staticmethod
     def get_site_packages_location():
         pip_package_location = Path(ValidatorPackageService.get_module_path("pip"))
@@ -64,10 +140,8 @@ class ValidatorPackageService:
     def reload_module(module_path) -> ModuleType:
         try:
             reloaded_module = None
-            # Dynamically import the module based on its path
-            if "guardrails.hub" in sys.modules:
-                # Reload the module if it's already imported
-                importlib.reload(sys.modules["guardrails.hub"])
+            # guardrails.hub reads its index on demand,
+            #   so it does not need to be reloaded to see new validators.
             if module_path not in sys.modules:
                 # Import the module if it has not been imported yet
                 reloaded_module = importlib.import_module(module_path)
@@ -105,29 +179,18 @@ class ValidatorPackageService:
 
     @staticmethod
     def add_to_hub_inits(manifest: Manifest, site_packages: str):
+        """Add a validator package's exports to the index `guardrails.hub`
+        imports them from on demand."""
         validator_id = manifest.id
         exports: List[str] = manifest.exports or []
-        sorted_exports = sorted(exports, reverse=True)
 
         import_path = ValidatorPackageService.get_import_path_from_validator_id(
             validator_id
         )
-        import_line = f"from {import_path} import {', '.join(sorted_exports)}"
-
-        hub_init_location = os.path.join(
-            site_packages, "guardrails", "hub", "__init__.py"
+        hub_index_location = get_hub_index_path(
+            os.path.join(site_packages, "guardrails", "hub")
         )
-        with open(hub_init_location, "a+") as hub_init:
-            hub_init.seek(0, 0)
-            content = hub_init.read()
-            if import_line in content:
-                hub_init.close()
-            else:
-                hub_init.seek(0, 2)
-                if len(content) > 0:
-                    hub_init.write("\n")
-                hub_init.write(import_line)
-                hub_init.close()
+        add_to_hub_index(hub_index_location, validator_id, import_path, exports)
 
     @staticmethod
     def get_module_path(package_name):
@@ -247,10 +310,38 @@ class ValidatorPackageService:
         upgrade: bool = False,
         logger=guardrails_logger,
     ):
-        pep_503_package_name = ValidatorPackageService.get_normalized_package_name(
-            validator_id
+        ValidatorPackageService.install_hub_modules(
+            [(validator_id, validator_version)],
+            quiet=quiet,
+            upgrade=upgrade,
+            logger=logger,
         )
-        validator_version = validator_version if validator_version else ""
+
+    @staticmethod
+    def install_hub_modules(
+        validators: Sequence[Tuple[str, Optional[str]]],
+        quiet: bool = False,
+        upgrade: bool = False,
+        logger=guardrails_logger,
+    ):
+        """Install validator packages with a single pip invocation, so that
+        their dependencies are resolved together.
+
+        If that fails, the packages are installed one at a time, and only
+        the ones that fail with their validators extra are installed
+        without it.
+
+        Args:
+            validators (Sequence[Tuple[str, Optional[str]]]): The id and
+                version specifier of each validator to install
+        """
+        package_names = [
+            (
+                ValidatorPackageService.get_normalized_package_name(validator_id),
+                validator_version if validator_version else "",
+            )
+            for validator_id, validator_version in validators
+        ]
 
         guardrails_token = settings.rc.token
 
@@ -267,21 +358,42 @@ class ValidatorPackageService:
 
         # Install from guardrails hub pypi server with public pypi index as fallback
 
+        full_package_names = [
+            f"{package_name}[validators]{validator_version}"
+            for package_name, validator_version in package_names
+        ]
         try:
-            full_package_name = f"{pep_503_package_name}[validators]{validator_version}"
-            download_output = pip_process_with_custom_exception(
-                "install", full_package_name, pip_flags, quiet=quiet
+            ValidatorPackageService._pip_install(
+                full_package_names, pip_flags, quiet=quiet, logger=logger
             )
-            if not quiet:
-                logger.info(download_output)
+            return
         except PipProcessError:
+            pass
+
+        # Install the packages one at a time, so that only the ones that
+        #   fail with their validators extra are installed without it.
+        for (package_name, validator_version), full_package_name in zip(
+            package_names, full_package_names
+        ):
+            if len(package_names) > 1:
+                try:
+                    ValidatorPackageService._pip_install(
+                        [full_package_name], pip_flags, quiet=quiet, logger=logger
+                    )
+                    continue
+                except PipProcessError:
+                    pass
+            logger.warning(
+                f"Could not install {full_package_name},"
+                f" installing {package_name} without its validators extra."
+            )
             try:
-                full_package_name = f"{pep_503_package_name}{validator_version}"
-                download_output = pip_process_with_custom_exception(
-                    "install", full_package_name, pip_flags, quiet=quiet
+                ValidatorPackageService._pip_install(
+                    [f"{package_name}{validator_version}"],
+                    pip_flags,
+                    quiet=quiet,
+                    logger=logger,
                 )
-                if not quiet:
-                    logger.info(download_output)
             except PipProcessError as e:
                 action = e.action
                 package = e.package
@@ -300,7 +412,20 @@ class ValidatorPackageService:
             except Exception as e:
                 logger.error(
                     "An unexpected exception occurred while "
-                    f"installing {validator_id}: ",
+                    f"installing {package_name}: ",
                     e,
                 )
                 raise
+
+    @staticmethod
+    def _pip_install(
+        full_package_names: List[str],
+        pip_flags: List[str],
+        quiet: bool = False,
+        logger=guardrails_logger,
+    ):
+        download_output = pip_process_with_custom_exception(
+            "install", full_package_names, pip_flags, quiet=quiet
+        )
+        if not quiet:
+            logger.info(download_output)
@@ -1,5 +1,6 @@
 import logging
 import logging.config
+from contextvars import ContextVar
 from logging import Handler, LogRecord
 from typing import Dict, List, Optional
 
@@ -11,21 +12,36 @@ all_scopes = "all"
 
 
 class ScopeHandler(Handler):
-    scope: str
     scoped_logs: Dict[str, List[LogRecord]]
 
     def __init__(self, level=logging.NOTSET, scope=base_scope):
         super().__init__(level)
-        self.scope = scope
+        # The scope last set anywhere, for threads that do not inherit the
+        #   context it was set in.
+        self._scope = scope
+        # The scope set in the current context, so that steps running
+        #   concurrently each log to their own scope.
+        self._context_scope: ContextVar[Optional[str]] = ContextVar(
+            f"guardrails_log_scope_{id(self)}", default=None
+        )
         self.scoped_logs = {}
 
+    @property
+    def scope(self) -> str:
+        return self._context_scope.get() or self._scope
+
+    @scope.setter
+    def scope(self, scope: str):
+        self.set_scope(scope)
+
     def emit(self, record: LogRecord) -> None:
         logs = self.scoped_logs.get(self.scope, [])
         logs.append(record)
         self.scoped_logs[self.scope] = logs
 
     def set_scope(self, scope: str = base_scope):
-        self.scope = scope
+        self._scope = scope
+        self._context_scope.set(scope)
 
     def get_all_logs(self) -> List[LogRecord]:
         all_logs = []
@@ -1,22 +1,34 @@
 # SOURCE: https://github.com/spyder-ide/three-merge/blob/master/three_merge/merge.py
-from typing import Optional
-from diff_match_patch import diff_match_patch
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from diff_match_patch import diff_match_patch
 
 # Constants
-DIFFER = diff_match_patch()
-DIFFER.Diff_Timeout = 0.1
-DIFFER.Diff_EditCost = 4
 PRESERVED = 0
 DELETION = -1
 ADDITION = 1
 
 
+@lru_cache(maxsize=None)
+def get_differ() -> "diff_match_patch":
+    # diff_match_patch is only imported once a merge is actually needed.
+    from diff_match_patch import diff_match_patch
+
+    differ = diff_match_patch()
+    differ.Diff_Timeout = 0.1
+    differ.Diff_EditCost = 4
+    return differ
+
+
 def merge(
     source: Optional[str], target: Optional[str], base: Optional[str]
 ) -> Optional[str]:
     if source is None or target is None or base is None:
         return None
 
+    DIFFER = get_differ()
     diff1_l = DIFFER.diff_main(base, source)
     diff2_l = DIFFER.diff_main(base, target)
 
@@ -1,14 +1,15 @@
 """Class for representing a prompt entry."""
 
-import re
 from string import Template
 from typing import List, Optional
 
-import regex
-
-from guardrails.classes.templating.namespace_template import NamespaceTemplate
-from guardrails.utils.constants import constants
-from guardrails.utils.templating_utils import get_template_variables
+from guardrails.classes.templating.compiled_template import (
+    CONSTANT_MARKER,
+    compile_template,
+    escape_template,
+    get_variable_names,
+    substitute_constants,
+)
 
 
 class BasePrompt:
@@ -23,15 +24,25 @@ class BasePrompt:
     ):
         """Initialize and substitute constants in the prompt."""
         self._source = source
-        self.format_instructions_start = self.get_format_instructions_idx(source)
 
         # FIXME: Why is this happening on init instead of on format?
         # Substitute constants in the prompt.
-        source = self.substitute_constants(source)
+        # Only templates that hold constants go through the template cache;
+        #   formatted prompts are usually unique and don't need it.
+        if CONSTANT_MARKER in source:
+            compiled = compile_template(source)
+            self.format_instructions_start = compiled.format_instructions_start
+            source = compiled.substituted
+        else:
+            self.format_instructions_start = 0
 
         # FIXME: Why is this happening on init instead of on format?
         # If an output schema is provided, substitute it in the prompt.
-        if output_schema or xml_output_schema:
+        #   The source is kept as is when substituting would not change it,
+        #   i.e. it has neither a schema placeholder nor an escaped `$$`.
+        if (output_schema or xml_output_schema) and (
+            "output_schema" in source or "$$" in source
+        ):
             self.source = Template(source).safe_substitute(
                 output_schema=output_schema, xml_output_schema=xml_output_schema
             )
@@ -49,8 +60,8 @@ class BasePrompt:
         return self.source
 
     @property
-    def variable_names(self):
-        return get_template_variables(self.source)
+    def variable_names(self) -> List[str]:
+        return list(get_variable_names(self.source))
 
     @property
     def format_instructions(self):
@@ -58,18 +69,7 @@ class BasePrompt:
 
     def substitute_constants(self, text: str) -> str:
         """Substitute constants in the prompt."""
-        # Substitute constants by reading the constants file.
-        # Regex to extract all occurrences of ${gr.<constant_name>}
-        matches = re.findall(r"\${gr\.(\w+)}", text)
-
-        # Substitute all occurrences of ${gr.<constant_name>}
-        #   with the value of the constant.
-        for match in matches:
-            template = NamespaceTemplate(text)
-            mapping = {f"gr.{match}": constants[match]}
-            text = template.safe_substitute(**mapping)
-
-        return text
+        return substitute_constants(text)
 
     def get_prompt_variables(self) -> List[str]:
         return self.variable_names
@@ -92,33 +92,11 @@ class BasePrompt:
             The index of the first format instruction in the prompt.
         """
         # TODO(shreya): Optionally add support for special character demarcation.
-
-        # Regex to extract first occurrence of ${gr.<constant_name>}
-
-        matches = re.finditer(r"\${gr\.(\w+)}", text)
-
-        earliest_match_idx = None
-        earliest_match = None
-
-        # Find the earliest match where the match belongs to a constant.
-        for match in matches:
-            if match.group(1) in constants:
-                if earliest_match_idx is None or earliest_match_idx > match.start():
-                    earliest_match_idx = match.start()
-                    earliest_match = match
-
-        if earliest_match_idx is None:
-            return 0
-
-        if earliest_match is None:
-            return None
-        return earliest_match.start()
+        return compile_template(text).format_instructions_start
 
     def escape(self) -> str:
         """Escape single curly braces into double curly braces."""
-        start_replaced = regex.sub(r"(?<!\$){", "{{", self.source)
-        # This variable length negative lookbehind is why we need `regex` over `re`
-        return regex.sub(r"(?<!\${.*)}", "}}", start_replaced)
+        return escape_template(self.source)
 
     def _to_request(self) -> str:
         return self.source
@@ -1,16 +1,16 @@
-import copy
+import asyncio
 from functools import partial
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple
 
 
 from guardrails import validator_service
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
+from guardrails.classes.execution.validated_messages import ValidatedMessages
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
 from guardrails.classes.output_type import OutputTypes
-from guardrails.errors import ValidationError
 from guardrails.llm_providers import AsyncPromptCallableBase
 from guardrails.logger import set_scope
-from guardrails.run.runner import Runner
+from guardrails.run.runner import ReaskGroupSetup, Runner
 from guardrails.run.utils import messages_source
 from guardrails.schema.validator import schema_validation
 from guardrails.hub_telemetry.hub_tracing import async_trace
@@ -19,12 +19,9 @@ from guardrails.types.pydantic import ModelOrListOfModels
 from guardrails.types.validator import ValidatorMap
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.classes.llm.llm_response import LLMResponse
-from guardrails.actions.reask import NonParseableReAsk, ReAsk
+from guardrails.actions.reask import NonParseableReAsk
 from guardrails.telemetry import trace_async_call, trace_async_step
 
-from guardrails.constants import fail_status
-from guardrails.prompt import Prompt
-
 
 class AsyncRunner(Runner):
     def __init__(
@@ -42,6 +39,7 @@ class AsyncRunner(Runner):
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        validated_messages: Optional[ValidatedMessages] = None,
     ):
         super().__init__(
             output_type=output_type,
@@ -56,6 +54,7 @@ class AsyncRunner(Runner):
             full_schema_reask=full_schema_reask,
             disable_tracer=disable_tracer,
             exec_options=exec_options,
+            validated_messages=validated_messages,
         )
         self.api = api
 
@@ -85,22 +84,44 @@ class AsyncRunner(Runner):
                 self.output_schema,
             )
             index = 0
+            reask_groups: List[ReaskGroupSetup] = []
             for index in range(self.num_reasks + 1):
-                # Run a single step.
-                iteration = await self.async_step(
-                    index=index,
-                    api=self.api,
-                    messages=messages,
-                    prompt_params=prompt_params,
-                    output_schema=output_schema,
-                    output=self.output if index == 0 else None,
-                    call_log=call_log,
-                )
+                if reask_groups:
+                    # Run a step for each group of fields concurrently.
+                    iteration = await self.async_step_reask_groups(
+                        index,
+                        call_log,
+                        reask_groups,
+                        api=self.api,
+                        prompt_params=prompt_params,
+                    )
+                else:
+                    # Run a single step.
+                    iteration = await self.async_step(
+                        index=index,
+                        api=self.api,
+                        messages=messages,
+                        prompt_params=prompt_params,
+                        output_schema=output_schema,
+                        output=self.output if index == 0 else None,
+                        call_log=call_log,
+                    )
 
                 # Loop again?
                 if not self.do_loop(index, iteration.reasks):
                     break
 
+                # Get new prompts and output schemas for each group of fields.
+                reask_groups = self.prepare_to_fan_out(
+                    iteration.reasks,
+                    output_schema,
+                    parsed_output=iteration.outputs.parsed_output,
+                    validated_output=call_log.validation_response,
+                    prompt_params=prompt_params,
+                )
+                if reask_groups:
+                    continue
+
                 # Get new prompt and output schema.
                 (
                     output_schema,
@@ -124,6 +145,39 @@ class AsyncRunner(Runner):
 
         return call_log
 
+    async def async_step_reask_groups(
+        self,
+        index: int,
+        call_log: Call,
+        reask_groups: List[ReaskGroupSetup],
+        *,
+        api: Optional[AsyncPromptCallableBase],
+        prompt_params: Optional[Dict] = None,
+    ) -> Iteration:
+        """Run a step for each group of field reasks concurrently, and merge
+        their outputs."""
+        previous_response = call_log.validation_response
+        iterations = await asyncio.gather(
+            *[
+                self.async_step(
+                    index,
+                    output_schema,
+                    call_log,
+                    api=api,
+                    messages=messages,
+                    prompt_params=prompt_params,
+                )
+                for _, output_schema, messages in reask_groups
+            ]
+        )
+
+        return self.merge_reask_groups(
+            call_log,
+            previous_response,
+            [reask_group for reask_group, _, _ in reask_groups],
+            list(iterations),
+        )
+
     # TODO: Refactor this to use inheritance and overrides
     @async_trace(name="/step", origin="AsyncRunner.async_step")
     @trace_async_step
@@ -158,8 +212,18 @@ class AsyncRunner(Runner):
 
         try:
             # Prepare: run pre-processing, and input validation.
+            llm_response = None
             if output is not None:
                 messages = None
+            elif self.can_overlap_input_validation(messages):
+                # Prepare and Call: run the API alongside input validation.
+                messages, llm_response = await self.async_prepare_and_call(
+                    call_log,
+                    messages=messages,
+                    prompt_params=prompt_params,
+                    api=api,
+                    attempt_number=index,
+                )
             else:
                 messages = await self.async_prepare(
                     call_log,
@@ -172,7 +236,8 @@ class AsyncRunner(Runner):
             iteration.inputs.messages = messages
 
             # Call: run the API.
-            llm_response = await self.async_call(messages, api, output)
+            if llm_response is None:
+                llm_response = await self.async_call(messages, api, output)
 
             iteration.outputs.llm_response_info = llm_response
             output = llm_response.output
@@ -273,6 +338,8 @@ class AsyncRunner(Runner):
             iteration=iteration,
             disable_tracer=self._disable_tracer,
             path="$",
+            short_circuit=self.exec_options.short_circuit,
+            timeouts=self.exec_options.timeouts,
             stream=stream,
             **kwargs,
         )
@@ -316,6 +383,54 @@ class AsyncRunner(Runner):
 
         return messages
 
+    @async_trace(name="/input_prep", origin="AsyncRunner.async_prepare_and_call")
+    async def async_prepare_and_call(
+        self,
+        call_log: Call,
+        attempt_number: int,
+        *,
+        messages: MessageHistory,
+        prompt_params: Optional[Dict] = None,
+        api: Optional[AsyncPromptCallableBase],
+    ) -> Tuple[MessageHistory, LLMResponse]:
+        """Prepare the messages and query the LLM API with them while they
+        are validated.
+
+        The call is cancelled if the messages fail validation, and the API
+        is queried again if validation changed them.
+
+        Returns:
+            The validated message history and the LLM response.
+        """
+        prompt_params = prompt_params or {}
+        if api is None:
+            raise UserFacingException(ValueError("API must be provided."))
+
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+        speculative_messages = [dict(msg) for msg in formatted_messages]
+        llm_call = asyncio.ensure_future(self.async_call(speculative_messages, api))
+        try:
+            await self.validate_messages(call_log, formatted_messages, attempt_number)
+        except BaseException:
+            llm_call.cancel()
+            raise
+
+        if messages_source(formatted_messages) != messages_source(speculative_messages):
+            llm_call.cancel()
+            return formatted_messages, await self.async_call(formatted_messages, api)
+        return formatted_messages, await llm_call
+
+    def format_messages(
+        self, messages: MessageHistory, prompt_params: Dict, attempt_number: int
+    ) -> MessageHistory:
+        # Format any variables in the message history with the prompt params.
+        return [
+            {**msg, "content": msg["content"].format(**prompt_params)}
+            for msg in messages
+        ]
+
     async def prepare_messages(
         self,
         call_log: Call,
@@ -323,13 +438,9 @@ class AsyncRunner(Runner):
         prompt_params: Dict,
         attempt_number: int,
     ) -> MessageHistory:
-        formatted_messages = []
-
-        # Format any variables in the message history with the prompt params.
-        for msg in messages:
-            msg_copy = copy.deepcopy(msg)
-            msg_copy["content"] = msg_copy["content"].format(**prompt_params)
-            formatted_messages.append(msg_copy)
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
 
         if "messages" in self.validation_map:
             await self.validate_messages(call_log, formatted_messages, attempt_number)
@@ -340,39 +451,31 @@ class AsyncRunner(Runner):
     async def validate_messages(
         self, call_log: Call, messages: MessageHistory, attempt_number: int
     ):
-        for msg in messages:
-            content = (
-                msg["content"].source
-                if isinstance(msg["content"], Prompt)
-                else msg["content"]
-            )
-            inputs = Inputs(
-                llm_output=content,
-            )
-            iteration = Iteration(
-                call_id=call_log.id, index=attempt_number, inputs=inputs
-            )
-            call_log.iterations.insert(0, iteration)
-            value, _metadata = await validator_service.async_validate(
-                value=content,
-                metadata=self.metadata,
-                validator_map=self.validation_map,
-                iteration=iteration,
-                disable_tracer=self._disable_tracer,
-                path="messages",
-            )
-
-            validated_msg = validator_service.post_process_validation(
-                value, attempt_number, iteration, OutputTypes.STRING
-            )
-
-            iteration.outputs.validation_response = validated_msg
-
-            if isinstance(validated_msg, ReAsk):
-                raise ValidationError(f"Messages validation failed: {validated_msg}")
-            elif not validated_msg or iteration.status == fail_status:
-                raise ValidationError("Messages validation failed")
-
-            msg["content"] = cast(str, validated_msg)
+        contents = self.messages_to_validate(messages)
+        if contents:
+            # Collects the logs for every message,
+            #   before they are split into an iteration per message.
+            iteration = Iteration(call_id=call_log.id, index=attempt_number)
+            validated_contents = None
+            try:
+                validated_contents, _metadata = await validator_service.async_validate(
+                    value={str(index): content for index, content in contents.items()},
+                    metadata=self.metadata,
+                    validator_map=self.messages_validator_map(contents),
+                    iteration=iteration,
+                    disable_tracer=self._disable_tracer,
+                    path="messages",
+                    short_circuit=self.exec_options.short_circuit,
+                    timeouts=self.exec_options.timeouts,
+                )
+            finally:
+                self.record_validated_messages(
+                    call_log,
+                    messages,
+                    contents,
+                    validated_contents,
+                    iteration,
+                    attempt_number,
+                )
 
         return messages  # type: ignore
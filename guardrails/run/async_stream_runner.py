@@ -20,6 +20,8 @@ from guardrails.llm_providers import (
 from guardrails.logger import set_scope
 from guardrails.run import StreamRunner
 from guardrails.run.async_runner import AsyncRunner
+from guardrails.run.speculative_stream import SpeculativeStream
+from guardrails.run.utils import async_close_stream, record_stream_abort
 from guardrails.telemetry import trace_async_stream_step
 from guardrails.hub_telemetry.hub_tracing import async_trace_stream
 from guardrails.types import OnFailAction
@@ -116,154 +118,243 @@ class AsyncStreamRunner(AsyncRunner, StreamRunner):
         validation_response = ""
         validation_progress = {}
         refrain_triggered = False
+        refrained = False
         validation_passed = True
+        speculative = (
+            SpeculativeStream(call_log, iteration)
+            if self.exec_options.speculative_streaming
+            else None
+        )
 
-        if self.output_type == OutputTypes.STRING:
-            validator_service = AsyncValidatorService(self.disable_tracer)
-            async for chunk in stream_output:
-                chunk_text = self.get_chunk_text(chunk, api)
-                _ = self.is_last_chunk(chunk, api)
+        chunks_received = 0
+        stream_done = False
 
-                fragment += chunk_text
+        async def abort_stream():
+            # Close the upstream LLM stream if we stopped reading from it
+            #   before it was exhausted, e.g. because a validator refrained
+            #   or raised, or because the caller abandoned this generator.
+            nonlocal stream_done
+            if not stream_done:
+                stream_done = True
+                await async_close_stream(stream_output)
+                record_stream_abort(iteration, api, chunks_received)
 
-                results = await validator_service.async_partial_validate(
-                    chunk_text,
-                    self.metadata,
-                    self.validation_map,
-                    iteration,
-                    "$",
-                    "$",
-                    True,
+        try:
+            if self.output_type == OutputTypes.STRING:
+                validator_service = AsyncValidatorService(
+                    self.disable_tracer, timeouts=self.exec_options.timeouts
                 )
-                validators = self.validation_map.get("$", [])
+                async for chunk in stream_output:
+                    chunks_received += 1
+                    chunk_text = self.get_chunk_text(chunk, api)
+                    _ = self.is_last_chunk(chunk, api)
+
+                    fragment += chunk_text
+                    if speculative is not None:
+                        yield speculative.forward(chunk_text)
 
-                # collect the result validated_chunk into validation progress
-                # per validator
-                for result in results:
-                    validator_log = result.validator_logs  # type: ignore
-                    validator = next(
-                        filter(
-                            lambda x: x.rail_alias == validator_log.registered_name,
-                            validators,
-                        ),
-                        None,
+                    results = await validator_service.async_partial_validate(
+                        chunk_text,
+                        self.metadata,
+                        self.validation_map,
+                        iteration,
+                        "$",
+                        "$",
+                        True,
                     )
-                    if (
-                        validator_log.validation_result
-                        and validator_log.validation_result.validated_chunk
-                    ):
-                        is_filter = validator.on_fail_descriptor is OnFailAction.FILTER  # type: ignore
-                        is_refrain = (
-                            validator.on_fail_descriptor is OnFailAction.REFRAIN  # type: ignore
+                    validators = self.validation_map.get("$", [])
+
+                    # collect the result validated_chunk into validation progress
+                    # per validator
+                    for result in results:
+                        validator_log = result.validator_logs  # type: ignore
+                        validator = next(
+                            filter(
+                                lambda x: x.rail_alias == validator_log.registered_name,
+                                validators,
+                            ),
+                            None,
                         )
-                        if validator_log.validation_result.outcome == "fail":
-                            validation_passed = False
-                        reasks, valid_op = self.introspect(
+                        if (
                             validator_log.validation_result
-                        )
-                        if reasks:
-                            raise ValueError(
-                                "Reasks are not yet supported with streaming. Please "
-                                "remove reasks from schema or disable streaming."
+                            and validator_log.validation_result.validated_chunk
+                        ):
+                            on_fail = validator.on_fail_descriptor  # type: ignore
+                            is_filter = on_fail is OnFailAction.FILTER
+                            is_refrain = on_fail is OnFailAction.REFRAIN
+                            if validator_log.validation_result.outcome == "fail":
+                                validation_passed = False
+                            reasks, valid_op = self.introspect(
+                                validator_log.validation_result
                             )
+                            if reasks:
+                                raise ValueError(
+                                    "Reasks are not yet supported with streaming. "
+                                    "Please remove reasks from schema or disable "
+                                    "streaming."
+                                )
 
-                        if isinstance(validator_log.validation_result, PassResult):
-                            chunk = validator_log.validation_result.validated_chunk
-                        elif isinstance(validator_log.validation_result, FailResult):
-                            if is_filter or is_refrain:
-                                refrain_triggered = True
-                                chunk = ""
-                            else:
-                                chunk = validator_service.perform_correction(
-                                    validator_log.validation_result,
-                                    validator_log.validation_result.validated_chunk,
-                                    validator,  # type: ignore
-                                    rechecked_value=None,
-                                )  # type: ignore
+                            validation_result = validator_log.validation_result
+                            if isinstance(validation_result, PassResult):
+                                chunk = validation_result.validated_chunk
+                            elif isinstance(validation_result, FailResult):
+                                if is_filter or is_refrain:
+                                    refrain_triggered = True
+                                    refrained = refrained or is_refrain
+                                    chunk = ""
+                                else:
+                                    chunk = validator_service.perform_correction(
+                                        validation_result,
+                                        validation_result.validated_chunk,
+                                        validator,  # type: ignore
+                                        rechecked_value=None,
+                                    )  # type: ignore
 
-                        if not hasattr(
-                            validation_progress, validator_log.validator_name
-                        ):
-                            validation_progress[validator_log.validator_name] = ""
+                            if not hasattr(
+                                validation_progress, validator_log.validator_name
+                            ):
+                                validation_progress[validator_log.validator_name] = ""
 
-                        validation_progress[validator_log.validator_name] += chunk
-                # if there is an entry for every validator
-                # run a merge and emit a validation outcome
-                if len(validation_progress) == len(validators) or len(validators) == 0:
-                    if refrain_triggered:
-                        current = ""
-                    else:
-                        merge_chunks = []
-                        for piece in validation_progress:
-                            merge_chunks.append(validation_progress[piece])
+                            validation_progress[validator_log.validator_name] += chunk
+                    if refrained:
+                        # A refrain withholds everything after it, so stop
+                        #   reading from the LLM before emitting the outcome.
+                        await abort_stream()
+                        if speculative is not None:
+                            retraction = speculative.retract_rest()
+                            if retraction is not None:
+                                yield retraction
+                        else:
+                            yield ValidationOutcome(
+                                call_id=call_log.id,  # type: ignore
+                                raw_llm_output=fragment,
+                                validated_output="",
+                                validation_passed=False,
+                            )
+                        validation_progress = {}
+                        break
+                    # if there is an entry for every validator
+                    # run a merge and emit a validation outcome
+                    if (
+                        len(validation_progress) == len(validators)
+                        or len(validators) == 0
+                    ):
+                        if refrain_triggered:
+                            current = ""
+                        else:
+                            merge_chunks = []
+                            for piece in validation_progress:
+                                merge_chunks.append(validation_progress[piece])
 
-                        current = validator_service.multi_merge(fragment, merge_chunks)
+                            current = validator_service.multi_merge(
+                                fragment, merge_chunks
+                            )
 
-                    vo = ValidationOutcome(
-                        call_id=call_log.id,  # type: ignore
-                        raw_llm_output=fragment,
-                        validated_output=current,
-                        validation_passed=True,
-                    )
-                    fragment = ""
-                    validation_progress = {}
-                    refrain_triggered = False
+                        vo = (
+                            speculative.confirm(fragment, current)
+                            if speculative is not None
+                            else ValidationOutcome(
+                                call_id=call_log.id,  # type: ignore
+                                raw_llm_output=fragment,
+                                validated_output=current,
+                                validation_passed=True,
+                            )
+                        )
+                        fragment = ""
+                        validation_progress = {}
+                        refrain_triggered = False
 
-                    yield vo
+                        if vo is not None:
+                            yield vo
+                stream_done = True
 
-            # if theres anything left merge and emit a chunk
-            if len(validation_progress) > 0:
-                merge_chunks = []
-                for piece in validation_progress:
-                    merge_chunks.append(validation_progress[piece])
+                # if theres anything left merge and emit a chunk
+                if len(validation_progress) > 0:
+                    merge_chunks = []
+                    for piece in validation_progress:
+                        merge_chunks.append(validation_progress[piece])
 
-                current = validator_service.multi_merge(fragment, merge_chunks)
-                yield ValidationOutcome(
-                    call_id=call_log.id,  # type: ignore
-                    raw_llm_output=fragment,
-                    validated_output=current,
-                    validation_passed=validation_passed,
-                )
-        else:
-            async for chunk in stream_output:
-                chunk_text = self.get_chunk_text(chunk, api)
-                fragment += chunk_text
-
-                parsed_fragment, move_to_next = self.parse(
-                    fragment, output_schema, verified=verified
-                )
-                if move_to_next:
-                    continue
-                validated_fragment = await self.async_validate(
-                    iteration,
-                    index,
-                    parsed_fragment,
-                    output_schema,
-                    validate_subschema=True,
-                )
-                if isinstance(validated_fragment, SkeletonReAsk):
-                    raise ValueError(
-                        "Received fragment schema is an invalid sub-schema "
-                        "of the expected output JSON schema."
+                    current = validator_service.multi_merge(fragment, merge_chunks)
+                    vo = (
+                        speculative.confirm(fragment, current)
+                        if speculative is not None
+                        else ValidationOutcome(
+                            call_id=call_log.id,  # type: ignore
+                            raw_llm_output=fragment,
+                            validated_output=current,
+                            validation_passed=validation_passed,
+                        )
                     )
+                    if vo is not None:
+                        yield vo
+            else:
+                # When streaming deltas, what the caller has received so far.
+                streamed_length, streamed_output = 0, None
+                async for chunk in stream_output:
+                    chunks_received += 1
+                    chunk_text = self.get_chunk_text(chunk, api)
+                    fragment += chunk_text
 
-                reasks, valid_op = self.introspect(validated_fragment)
-                if reasks:
-                    raise ValueError(
-                        "Reasks are not yet supported with streaming. Please "
-                        "remove reasks from schema or disable streaming."
+                    parsed_fragment, move_to_next = self.parse(
+                        fragment, output_schema, verified=verified
+                    )
+                    if move_to_next:
+                        continue
+                    validated_fragment = await self.async_validate(
+                        iteration,
+                        index,
+                        parsed_fragment,
+                        output_schema,
+                        validate_subschema=True,
                     )
+                    if isinstance(validated_fragment, SkeletonReAsk):
+                        raise ValueError(
+                            "Received fragment schema is an invalid sub-schema "
+                            "of the expected output JSON schema."
+                        )
 
-                if self.output_type == OutputTypes.LIST:
-                    validation_response = cast(list, validated_fragment)
-                else:
-                    validation_response = cast(dict, validated_fragment)
-                yield ValidationOutcome(
-                    call_id=call_log.id,  # type: ignore
-                    raw_llm_output=fragment,
-                    validated_output=chunk_text,
-                    validation_passed=validated_fragment is not None,
-                )
+                    reasks, valid_op = self.introspect(validated_fragment)
+                    if reasks:
+                        raise ValueError(
+                            "Reasks are not yet supported with streaming. Please "
+                            "remove reasks from schema or disable streaming."
+                        )
+
+                    if self.output_type == OutputTypes.LIST:
+                        validation_response = cast(list, validated_fragment)
+                    else:
+                        validation_response = cast(dict, validated_fragment)
+                    if self.exec_options.stream_deltas:
+                        yield self.delta_outcome(
+                            call_log,
+                            fragment[streamed_length:],
+                            streamed_output,
+                            validated_fragment,
+                        )
+                        streamed_length, streamed_output = (
+                            len(fragment),
+                            validated_fragment,
+                        )
+                        continue
+                    yield ValidationOutcome(
+                        call_id=call_log.id,  # type: ignore
+                        raw_llm_output=fragment,
+                        validated_output=chunk_text,
+                        validation_passed=validated_fragment is not None,
+                    )
+                stream_done = True
+                if (
+                    self.exec_options.stream_deltas
+                    and self.exec_options.materialize_stream_deltas
+                ):
+                    yield ValidationOutcome(
+                        call_id=call_log.id,  # type: ignore
+                        raw_llm_output=fragment,
+                        validated_output=streamed_output,
+                        validation_passed=streamed_output is not None,
+                    )
+        finally:
+            await abort_stream()
 
         iteration.outputs.raw_output = fragment
         # FIXME: Handle case where parsing continuously fails/is a reask
@@ -1,12 +1,22 @@
+import contextvars
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 
 from guardrails import validator_service
-from guardrails.actions.reask import get_reask_setup
+from guardrails.actions.reask import (
+    FieldReAsk,
+    get_reask_group_subschema,
+    get_reask_setup,
+    group_field_reasks,
+    merge_reask_group_output,
+)
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
+from guardrails.classes.execution.validated_messages import ValidatedMessages
 from guardrails.classes.history import Call, Inputs, Iteration, Outputs
+from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.classes.output_type import OutputTypes
 from guardrails.constants import fail_status
 from guardrails.errors import ValidationError
@@ -35,6 +45,11 @@ from guardrails.utils.prompt_utils import (
 )
 from guardrails.actions.reask import NonParseableReAsk, ReAsk, introspect
 from guardrails.telemetry import trace_call, trace_step
+from guardrails.types.on_fail import OnFailAction
+
+
+# The field reasks in a group, and the output schema and messages to reask with.
+ReaskGroupSetup = Tuple[List[FieldReAsk], Dict[str, Any], Messages]
 
 
 class Runner:
@@ -59,6 +74,7 @@ class Runner:
     output_type: OutputTypes
     validation_map: ValidatorMap = {}
     metadata: Dict[str, Any]
+    validated_messages: ValidatedMessages
 
     # LLM Inputs
     messages: Optional[List[Dict[str, Union[Prompt, str]]]] = None
@@ -93,35 +109,43 @@ class Runner:
         full_schema_reask: bool = False,
         disable_tracer: Optional[bool] = True,
         exec_options: Optional[GuardExecutionOptions] = None,
+        validated_messages: Optional[ValidatedMessages] = None,
     ):
         # Validation Inputs
         self.output_type = output_type
         self.output_schema = output_schema
         self.validation_map = validation_map
         self.metadata = metadata or {}
-        self.exec_options = copy.deepcopy(exec_options) or GuardExecutionOptions()
-
-        # LLM Inputs
-
-        stringified_output_schema = prompt_content_for_schema(
-            output_type, output_schema, validation_map
-        )
-        xml_output_schema = json_schema_to_rail_output(
-            json_schema=output_schema, validator_map=validation_map
+        # Only the options themselves are reassigned per call,
+        #   so a shallow copy is enough to keep the Guard's unchanged.
+        self.exec_options = (
+            copy.copy(exec_options) if exec_options else GuardExecutionOptions()
         )
+        self.validated_messages = validated_messages or ValidatedMessages()
 
+        # LLM Inputs
         if messages:
+            stringified_output_schema = prompt_content_for_schema(
+                output_type, output_schema, validation_map
+            )
+            xml_output_schema = json_schema_to_rail_output(
+                json_schema=output_schema, validator_map=validation_map
+            )
+
             self.exec_options.messages = messages
-            messages_copy = []
-            for msg in messages:
-                msg_copy = copy.deepcopy(msg)
-                msg_copy["content"] = Prompt(
-                    msg_copy["content"],
-                    output_schema=stringified_output_schema,
-                    xml_output_schema=xml_output_schema,
-                )
-                messages_copy.append(msg_copy)
-            self.messages = messages_copy
+            # Messages are never changed in place, only replaced,
+            #   so each one is a shallow copy that shares its content.
+            self.messages = [
+                {
+                    **msg,
+                    "content": Prompt(
+                        msg["content"],
+                        output_schema=stringified_output_schema,
+                        xml_output_schema=xml_output_schema,
+                    ),
+                }
+                for msg in messages
+            ]
 
         self.base_model = base_model
 
@@ -165,22 +189,44 @@ class Runner:
             )
 
             index = 0
+            reask_groups: List[ReaskGroupSetup] = []
             for index in range(self.num_reasks + 1):
-                # Run a single step.
-                iteration = self.step(
-                    index=index,
-                    api=self.api,
-                    messages=messages,
-                    prompt_params=prompt_params,
-                    output_schema=output_schema,
-                    output=self.output if index == 0 else None,
-                    call_log=call_log,
-                )
+                if reask_groups:
+                    # Run a step for each group of fields concurrently.
+                    iteration = self.step_reask_groups(
+                        index,
+                        call_log,
+                        reask_groups,
+                        api=self.api,
+                        prompt_params=prompt_params,
+                    )
+                else:
+                    # Run a single step.
+                    iteration = self.step(
+                        index=index,
+                        api=self.api,
+                        messages=messages,
+                        prompt_params=prompt_params,
+                        output_schema=output_schema,
+                        output=self.output if index == 0 else None,
+                        call_log=call_log,
+                    )
 
                 # Loop again?
                 if not self.do_loop(index, iteration.reasks):
                     break
 
+                # Get new prompts and output schemas for each group of fields.
+                reask_groups = self.prepare_to_fan_out(
+                    iteration.reasks,
+                    output_schema,
+                    parsed_output=iteration.outputs.parsed_output,
+                    validated_output=call_log.validation_response,
+                    prompt_params=prompt_params,
+                )
+                if reask_groups:
+                    continue
+
                 # Get new prompt and output schema.
                 (output_schema, messages) = self.prepare_to_loop(
                     iteration.reasks,
@@ -233,8 +279,18 @@ class Runner:
 
         try:
             # Prepare: run pre-processing, and input validation.
+            llm_response = None
             if output is not None:
                 messages = None
+            elif self.can_overlap_input_validation(messages):
+                # Prepare and Call: run the API alongside input validation.
+                messages, llm_response = self.prepare_and_call(
+                    call_log,
+                    messages=messages,
+                    prompt_params=prompt_params,
+                    api=api,
+                    attempt_number=index,
+                )
             else:
                 messages = self.prepare(
                     call_log,
@@ -247,7 +303,8 @@ class Runner:
             iteration.inputs.messages = messages
 
             # Call: run the API.
-            llm_response = self.call(messages, api, output)
+            if llm_response is None:
+                llm_response = self.call(messages, api, output)
 
             iteration.outputs.llm_response_info = llm_response
             raw_output = llm_response.output
@@ -288,42 +345,144 @@ class Runner:
     def validate_messages(
         self, call_log: Call, messages: MessageHistory, attempt_number: int
     ) -> None:
-        for msg in messages:
+        contents = self.messages_to_validate(messages)
+        if contents:
+            # Collects the logs for every message,
+            #   before they are split into an iteration per message.
+            iteration = Iteration(call_id=call_log.id, index=attempt_number)
+            validated_contents = None
+            try:
+                validated_contents, _metadata = validator_service.validate(
+                    value={str(index): content for index, content in contents.items()},
+                    metadata=self.metadata,
+                    validator_map=self.messages_validator_map(contents),
+                    iteration=iteration,
+                    disable_tracer=self._disable_tracer,
+                    path="messages",
+                    short_circuit=self.exec_options.short_circuit,
+                    timeouts=self.exec_options.timeouts,
+                )
+            finally:
+                self.record_validated_messages(
+                    call_log,
+                    messages,
+                    contents,
+                    validated_contents,
+                    iteration,
+                    attempt_number,
+                )
+
+        return messages  # type: ignore
+
+    def messages_to_validate(self, messages: MessageHistory) -> Dict[int, str]:
+        """Get the content of the messages that need validating by their
+        index, filling in the messages that already passed validation."""
+        fingerprint = self.messages_fingerprint()
+        contents: Dict[int, str] = {}
+        for index, msg in enumerate(messages):
             content = (
                 msg["content"].source
                 if isinstance(msg["content"], Prompt)
                 else msg["content"]
             )
-            inputs = Inputs(
-                llm_output=content,
+            validated_content = self.validated_messages.get(
+                fingerprint, msg.get("role", ""), content, self.metadata
             )
-            iteration = Iteration(
-                call_id=call_log.id, index=attempt_number, inputs=inputs
-            )
-            call_log.iterations.insert(0, iteration)
-            value, _metadata = validator_service.validate(
-                value=content,
-                metadata=self.metadata,
-                validator_map=self.validation_map,
-                iteration=iteration,
-                disable_tracer=self._disable_tracer,
-                path="messages",
+            if validated_content is None:
+                contents[index] = content
+            else:
+                msg["content"] = validated_content
+        return contents
+
+    def messages_fingerprint(self) -> str:
+        return ValidatedMessages.fingerprint(self.validation_map["messages"])
+
+    def messages_validator_map(self, contents: Dict[int, str]) -> ValidatorMap:
+        """Apply the validators on the messages to each message by its
+        index, so they are validated in a single pass."""
+        validators = self.validation_map["messages"]
+        return {f"messages.{index}": validators for index in contents}
+
+    def record_validated_messages(
+        self,
+        call_log: Call,
+        messages: MessageHistory,
+        contents: Dict[int, str],
+        validated_contents: Optional[Dict[str, Any]],
+        iteration: Iteration,
+        attempt_number: int,
+    ) -> None:
+        """Record an iteration for each validated message, and raise if any
+        of them failed validation.
+
+        The iterations are added ahead of the rest of the call, last message
+        first, in one go rather than one at a time.
+        """
+        logs_by_path: Dict[str, List[ValidatorLogs]] = {}
+        for log in iteration.outputs.validator_logs:
+            logs_by_path.setdefault(log.property_path, []).append(log)
+
+        msg_iterations: List[Iteration] = []
+        validation_error = None
+        for index, content in contents.items():
+            msg_iteration = Iteration(
+                call_id=call_log.id,
+                index=attempt_number,
+                inputs=Inputs(llm_output=content),
+                outputs=Outputs(
+                    validator_logs=logs_by_path.get(f"messages.{index}", [])
+                ),
             )
+            msg_iterations.append(msg_iteration)
+            if validated_contents is None or validation_error:
+                continue
 
             validated_msg = validator_service.post_process_validation(
-                value, attempt_number, iteration, OutputTypes.STRING
+                validated_contents.get(str(index)),
+                attempt_number,
+                msg_iteration,
+                OutputTypes.STRING,
             )
-
-            iteration.outputs.validation_response = validated_msg
+            msg_iteration.outputs.validation_response = validated_msg
 
             if isinstance(validated_msg, ReAsk):
-                raise ValidationError(f"Messages validation failed: {validated_msg}")
-            elif not validated_msg or iteration.status == fail_status:
-                raise ValidationError("Messages validation failed")
-
-            msg["content"] = cast(str, validated_msg)
+                validation_error = ValidationError(
+                    f"Messages validation failed: {validated_msg}"
+                )
+            elif not validated_msg or msg_iteration.status == fail_status:
+                validation_error = ValidationError("Messages validation failed")
+            else:
+                messages[index]["content"] = cast(str, validated_msg)
+        call_log.iterations[0:0] = reversed(msg_iterations)
+
+        if validation_error:
+            raise validation_error
+        if validated_contents is not None:
+            self.validated_messages.record(
+                self.messages_fingerprint(),
+                [
+                    (
+                        messages[index].get("role", ""),
+                        content,
+                        messages[index]["content"],
+                    )
+                    for index, content in contents.items()
+                ],
+                self.metadata,
+            )
 
-        return messages  # type: ignore
+    def format_messages(
+        self, messages: MessageHistory, prompt_params: Dict, attempt_number: int
+    ) -> MessageHistory:
+        # Format any variables in the message history with the prompt params.
+        #   Validation replaces the content of the formatted messages,
+        #   so each one is a shallow copy.
+        if attempt_number == 0:
+            return [
+                {**msg, "content": msg["content"].format(**prompt_params)}
+                for msg in messages
+            ]
+        return [dict(msg) for msg in messages]
 
     def prepare_messages(
         self,
@@ -332,13 +491,9 @@ class Runner:
         prompt_params: Dict,
         attempt_number: int,
     ) -> MessageHistory:
-        formatted_messages: MessageHistory = []
-        # Format any variables in the message history with the prompt params.
-        for msg in messages:
-            msg_copy = copy.deepcopy(msg)
-            if attempt_number == 0:
-                msg_copy["content"] = msg_copy["content"].format(**prompt_params)
-            formatted_messages.append(msg_copy)
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
 
         # validate messages
         if "messages" in self.validation_map:
@@ -360,6 +515,8 @@ class Runner:
             iteration=iteration,
             disable_tracer=self._disable_tracer,
             path="prompt",
+            short_circuit=self.exec_options.short_circuit,
+            timeouts=self.exec_options.timeouts,
         )
 
         validated_prompt = validator_service.post_process_validation(
@@ -400,6 +557,74 @@ class Runner:
 
         return messages
 
+    def can_overlap_input_validation(self, messages: Optional[MessageHistory]) -> bool:
+        """Whether the LLM call may start before the messages are validated.
+
+        Validators that fail with "exception" or "noop" cannot change the
+        messages, so the call either stands or is discarded. Any other
+        on fail action requires the user to accept that the call is issued
+        again when the messages change.
+        """
+        if (
+            not self.exec_options.overlap_input_validation
+            or not messages
+            or "messages" not in self.validation_map
+        ):
+            return False
+        if self.exec_options.reissue_on_input_fix:
+            return True
+        return all(
+            validator.on_fail_descriptor in (OnFailAction.EXCEPTION, OnFailAction.NOOP)
+            for validator in self.validation_map["messages"]
+        )
+
+    @trace(name="/input_prep", origin="Runner.prepare_and_call")
+    def prepare_and_call(
+        self,
+        call_log: Call,
+        attempt_number: int,
+        *,
+        messages: MessageHistory,
+        prompt_params: Optional[Dict] = None,
+        api: Optional[PromptCallableBase],
+    ) -> Tuple[MessageHistory, LLMResponse]:
+        """Prepare the messages and query the LLM API with them while they
+        are validated.
+
+        The response is discarded if the messages fail validation, and the
+        API is queried again if validation changed them.
+
+        Returns:
+            The validated message history and the LLM response.
+        """
+        prompt_params = prompt_params or {}
+        if api is None:
+            raise UserFacingException(ValueError("API must be provided."))
+
+        formatted_messages = self.format_messages(
+            messages, prompt_params, attempt_number
+        )
+        speculative_messages = [dict(msg) for msg in formatted_messages]
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            llm_call = executor.submit(
+                contextvars.copy_context().run, self.call, speculative_messages, api
+            )
+            try:
+                self.validate_messages(call_log, formatted_messages, attempt_number)
+            except BaseException:
+                # Python cannot interrupt a call that is already running,
+                #   so its response is discarded instead.
+                llm_call.cancel()
+                raise
+        finally:
+            executor.shutdown(wait=False)
+
+        if messages_source(formatted_messages) != messages_source(speculative_messages):
+            llm_call.cancel()
+            return formatted_messages, self.call(formatted_messages, api)
+        return formatted_messages, llm_call.result()
+
     @trace(name="/llm_call", origin="Runner.call")
     @trace_call
     def call(
@@ -469,6 +694,8 @@ class Runner:
             iteration=iteration,
             disable_tracer=self._disable_tracer,
             path="$",
+            short_circuit=self.exec_options.short_circuit,
+            timeouts=self.exec_options.timeouts,
             stream=stream,
             **kwargs,
         )
@@ -523,3 +750,125 @@ class Runner:
         )
 
         return output_schema, messages
+
+    def prepare_to_fan_out(
+        self,
+        reasks: Sequence[ReAsk],
+        output_schema: Dict[str, Any],
+        *,
+        parsed_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+        validated_output: Optional[Union[str, List, Dict, ReAsk]] = None,
+        prompt_params: Optional[Dict] = None,
+    ) -> List[ReaskGroupSetup]:
+        """Prepare to reask for each group of fields under a different top
+        level key separately.
+
+        Returns no groups unless parallel field reasks are enabled and
+        the fields are in more than one group.
+        """
+        if (
+            not self.exec_options.parallel_field_reasks
+            or self.full_schema_reask
+            or not isinstance(validated_output, dict)
+        ):
+            return []
+        reask_groups = group_field_reasks(reasks)
+        if len(reask_groups) < 2:
+            return []
+
+        reask_group_setups = []
+        for reask_group in reask_groups:
+            group_schema = get_reask_group_subschema(output_schema, reask_group)
+            if group_schema is None:
+                return []
+            keys = group_schema["properties"]
+            group_parsed_output = parsed_output
+            if isinstance(parsed_output, dict):
+                group_parsed_output = {
+                    k: v for k, v in parsed_output.items() if k in keys
+                }
+            group_schema, messages = self.prepare_to_loop(
+                reask_group,
+                group_schema,
+                parsed_output=group_parsed_output,
+                validated_output={
+                    k: v for k, v in validated_output.items() if k in keys
+                },
+                prompt_params=prompt_params,
+            )
+            reask_group_setups.append((reask_group, group_schema, messages))
+        return reask_group_setups
+
+    def step_reask_groups(
+        self,
+        index: int,
+        call_log: Call,
+        reask_groups: List[ReaskGroupSetup],
+        *,
+        api: Optional[PromptCallableBase],
+        prompt_params: Optional[Dict] = None,
+    ) -> Iteration:
+        """Run a step for each group of field reasks concurrently, and merge
+        their outputs."""
+        previous_response = call_log.validation_response
+        with ThreadPoolExecutor(max_workers=len(reask_groups)) as executor:
+            steps = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.step,
+                    index,
+                    output_schema,
+                    call_log,
+                    api=api,
+                    messages=messages,
+                    prompt_params=prompt_params,
+                )
+                for _, output_schema, messages in reask_groups
+            ]
+            iterations = [step.result() for step in steps]
+
+        return self.merge_reask_groups(
+            call_log,
+            previous_response,
+            [reask_group for reask_group, _, _ in reask_groups],
+            iterations,
+        )
+
+    def merge_reask_groups(
+        self,
+        call_log: Call,
+        previous_response: Any,
+        reask_groups: List[List[FieldReAsk]],
+        iterations: List[Iteration],
+    ) -> Iteration:
+        """Merge the outputs of the steps for each group of field reasks.
+
+        The steps push their iterations to the call log in whatever order
+        they start, so the iterations are first put back in the order of
+        their groups. Each iteration is then given the output merged up to
+        and including its group, so merging the call log's iterations
+        still gives the whole output.
+
+        Returns:
+            The last of the iterations, with the merged output and the
+            remaining reasks.
+        """
+        group_iteration_ids = {id(iteration) for iteration in iterations}
+        positions = [
+            position
+            for position, iteration in enumerate(call_log.iterations)
+            if id(iteration) in group_iteration_ids
+        ]
+        for position, iteration in zip(positions, iterations):
+            call_log.iterations[position] = iteration
+
+        merged_output = previous_response
+        for reask_group, iteration in zip(reask_groups, iterations):
+            merged_output = merge_reask_group_output(
+                merged_output, reask_group, iteration.outputs.validation_response
+            )
+            reasks, valid_output = self.introspect(merged_output)
+            iteration.outputs.validation_response = merged_output
+            iteration.outputs.guarded_output = valid_output
+            iteration.outputs.reasks = list(reasks)
+        return iterations[-1]
@@ -0,0 +1,134 @@
+from typing import List, Optional, Set, Tuple
+
+from guardrails.classes.history import Call, Iteration
+from guardrails.classes.validation.validation_result import (
+    ErrorSpan,
+    StreamRetraction,
+)
+from guardrails.classes.validation_outcome import ValidationOutcome
+from guardrails.constants import pass_status
+
+# Whether validation has passed so far, and the error spans it has found.
+ValidationState = Tuple[bool, List[ErrorSpan]]
+
+
+class SpeculativeStream:
+    """Tracks the text forwarded to the caller before it was validated, and
+    turns the validation results for that text into retractions.
+
+    Validation results are expected to cover the streamed text in order,
+    each one starting where the last one ended. Retractions are positioned
+    relative to the text the caller has rendered, i.e. with every earlier
+    retraction already applied.
+
+    When validation runs in another thread, that thread should `observe` the
+    validation state and hand it over with each result, to be `update`d, so
+    that the logs it writes are never read while they are being written.
+    """
+
+    def __init__(self, call_log: Call, iteration: Iteration):
+        self._call_log = call_log
+        self._iteration = iteration
+        self._reported_error_spans: Set[Tuple[int, int, str]] = set()
+        # The length of the streamed text that validation has caught up with.
+        self._validated_length = 0
+        self.streamed_text = ""
+        self.validated_text = ""
+        self._state: Optional[ValidationState] = None
+
+    def observe(self) -> ValidationState:
+        """Read the validation state from the logs."""
+        return (
+            self._call_log.status == pass_status,
+            list(self._iteration.outputs.error_spans_in_output),
+        )
+
+    def update(self, state: ValidationState) -> None:
+        """Use a validation state observed by the thread running validation
+        instead of reading the logs."""
+        self._state = state
+
+    @property
+    def validation_passed(self) -> bool:
+        state = self._state or self.observe()
+        return state[0]
+
+    def _error_spans(self, start: int, end: int) -> List[ErrorSpan]:
+        """The error spans not reported yet that start before `end` in the
+        streamed text, relative to the text from `start` to `end`."""
+        error_spans = []
+        state = self._state or self.observe()
+        for error_span in state[1]:
+            key = (error_span.start, error_span.end, error_span.reason)
+            if error_span.start >= end or key in self._reported_error_spans:
+                continue
+            self._reported_error_spans.add(key)
+            span_start = max(error_span.start, start)
+            span_end = min(error_span.end, end)
+            if span_start < span_end:
+                error_spans.append(
+                    ErrorSpan(
+                        start=span_start - start,
+                        end=span_end - start,
+                        reason=error_span.reason,
+                    )
+                )
+        return error_spans
+
+    def _retract(
+        self, end: int, replacement: str, error_spans: List[ErrorSpan]
+    ) -> ValidationOutcome:
+        start = self._validated_length
+        rendered_start = len(self.validated_text)
+        self._validated_length = end
+        self.validated_text += replacement
+        return ValidationOutcome(
+            call_id=self._call_log.id,  # type: ignore
+            raw_llm_output=self.streamed_text[start:end],
+            validated_output=replacement,
+            validation_passed=self.validation_passed,
+            retraction=StreamRetraction(
+                start=rendered_start,
+                end=rendered_start + end - start,
+                replacement=replacement,
+                error_spans=error_spans,
+            ),
+        )
+
+    def forward(self, chunk_text: str) -> ValidationOutcome:
+        """Forward a chunk to the caller before it is validated."""
+        self.streamed_text += chunk_text
+        return ValidationOutcome(
+            call_id=self._call_log.id,  # type: ignore
+            raw_llm_output=chunk_text,
+            validated_output=chunk_text,
+            validation_passed=self.validation_passed,
+            speculative=True,
+        )
+
+    def confirm(
+        self, original_text: str, validated_text: str
+    ) -> Optional[ValidationOutcome]:
+        """Record the validation result for the next segment of the streamed
+        text.
+
+        Returns a retraction if validation changed the segment or found
+        errors in it, and None if the forwarded text stands.
+        """
+        start = self._validated_length
+        end = min(start + len(original_text), len(self.streamed_text))
+        error_spans = self._error_spans(start, end)
+        if validated_text == original_text and not error_spans:
+            self._validated_length = end
+            self.validated_text += validated_text
+            return None
+        return self._retract(end, validated_text, error_spans)
+
+    def retract_rest(self) -> Optional[ValidationOutcome]:
+        """Retract any streamed text that validation will never reach, e.g.
+        because a validator refrained."""
+        start = self._validated_length
+        end = len(self.streamed_text)
+        if start >= end:
+            return None
+        return self._retract(end, "", self._error_spans(start, end))
@@ -1,3 +1,6 @@
+import contextvars
+import threading
+from queue import Empty, Queue
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, cast
 
 from guardrails import validator_service
@@ -8,6 +11,8 @@ from guardrails.llm_providers import (
     PromptCallableBase,
 )
 from guardrails.run.runner import Runner
+from guardrails.run.speculative_stream import SpeculativeStream
+from guardrails.run.utils import close_stream, record_stream_abort
 from guardrails.hub_telemetry.hub_tracing import trace_stream
 from guardrails.utils.parsing_utils import (
     coerce_types,
@@ -17,6 +22,12 @@ from guardrails.utils.parsing_utils import (
 from guardrails.actions.reask import ReAsk, SkeletonReAsk
 from guardrails.constants import pass_status
 from guardrails.telemetry import trace_stream_step
+from guardrails.utils.json_patch_utils import make_json_patch
+
+
+# Marks the end of the chunks, or results, passed between a speculative
+#   stream and its validation thread.
+_STREAM_END = object()
 
 
 class StreamRunner(Runner):
@@ -121,115 +132,174 @@ class StreamRunner(Runner):
         verified = set()
         validation_response = ""
         fragment = ""
+        chunks_received = 0
+        stream_done = False
+
+        def abort_stream():
+            # Close the upstream LLM stream if we stopped reading from it
+            #   before it was exhausted, e.g. because a validator refrained
+            #   or raised, or because the caller abandoned this generator.
+            nonlocal stream_done
+            if not stream_done:
+                stream_done = True
+                close_stream(stream)
+                record_stream_abort(iteration, api, chunks_received)
+
         # Loop over the stream
         # and construct "fragments" of concatenated chunks
         # for now, handle string and json schema differently
-        if self.output_type == OutputTypes.STRING:
+        try:
+            if self.output_type == OutputTypes.STRING:
+
+                def prepare_chunk_generator(stream) -> Iterator[Tuple[Any, bool]]:
+                    nonlocal chunks_received, stream_done
+                    try:
+                        for chunk in stream:
+                            chunks_received += 1
+                            chunk_text = self.get_chunk_text(chunk, api)
+                            nonlocal fragment
+                            fragment += chunk_text
+                            finished = self.is_last_chunk(chunk, api)
+                            # 2. Parse the chunk
+                            parsed_chunk, move_to_next = self.parse(
+                                chunk_text, output_schema, verified=verified
+                            )
+                            nonlocal parsed_fragment
+                            # ignore types because output schema guarantees a string
+                            parsed_fragment += parsed_chunk  # type: ignore
+                            if move_to_next:
+                                # Continue to next chunk
+                                continue
+                            yield parsed_chunk, finished
+                        stream_done = True
+                    finally:
+                        # The validator service closes this generator as soon
+                        #   as a validator refrains.
+                        abort_stream()
+
+                prepped_stream = prepare_chunk_generator(stream)
+                if self.exec_options.speculative_streaming:
+                    speculative = SpeculativeStream(call_log, iteration)
+                    yield from self.speculative_validate_stream(
+                        prepped_stream, speculative, iteration
+                    )
+                    validation_response = speculative.validated_text
+                    valid_op = validation_response
+                else:
+                    gen = validator_service.validate_stream(
+                        prepped_stream,
+                        self.metadata,
+                        self.validation_map,
+                        iteration,
+                        self._disable_tracer,
+                        "$",
+                        timeouts=self.exec_options.timeouts,
+                        validate_subschema=True,
+                    )
 
-            def prepare_chunk_generator(stream) -> Iterator[Tuple[Any, bool]]:
+                    for res in gen:
+                        chunk = res.chunk
+                        original_text = res.original_text
+                        if isinstance(chunk, SkeletonReAsk):
+                            raise ValueError(
+                                "Received fragment schema is an invalid sub-schema "
+                                "of the expected output JSON schema."
+                            )
+
+                        # 4. Introspect: inspect the validated fragment for reasks
+                        reasks, valid_op = self.introspect(chunk)
+                        if reasks:
+                            raise ValueError(
+                                "Reasks are not yet supported with streaming. Please "
+                                "remove reasks from schema or disable streaming."
+                            )
+                        # 5. Convert validated fragment to a pretty JSON string
+                        validation_response += cast(str, chunk)
+                        passed = call_log.status == pass_status
+                        yield ValidationOutcome(
+                            call_id=call_log.id,  # type: ignore
+                            #  The chunk or the whole output?
+                            raw_llm_output=original_text,
+                            validated_output=chunk,
+                            validation_passed=passed,
+                        )
+
+            # handle non string schema
+            else:
+                # When streaming deltas, what the caller has received so far.
+                streamed_length, streamed_output = 0, None
                 for chunk in stream:
+                    chunks_received += 1
+                    # 1. Get the text from the chunk and append to fragment
                     chunk_text = self.get_chunk_text(chunk, api)
-                    nonlocal fragment
                     fragment += chunk_text
-                    finished = self.is_last_chunk(chunk, api)
-                    # 2. Parse the chunk
-                    parsed_chunk, move_to_next = self.parse(
-                        chunk_text, output_schema, verified=verified
+
+                    # 2. Parse the fragment
+                    parsed_fragment, move_to_next = self.parse(
+                        fragment, output_schema, verified=verified
                     )
-                    nonlocal parsed_fragment
-                    # ignore types because output schema guarantees a string
-                    parsed_fragment += parsed_chunk  # type: ignore
                     if move_to_next:
                         # Continue to next chunk
                         continue
-                    yield parsed_chunk, finished
-
-            prepped_stream = prepare_chunk_generator(stream)
-            gen = validator_service.validate_stream(
-                prepped_stream,
-                self.metadata,
-                self.validation_map,
-                iteration,
-                self._disable_tracer,
-                "$",
-                validate_subschema=True,
-            )
 
-            for res in gen:
-                chunk = res.chunk
-                original_text = res.original_text
-                if isinstance(chunk, SkeletonReAsk):
-                    raise ValueError(
-                        "Received fragment schema is an invalid sub-schema "
-                        "of the expected output JSON schema."
+                    # 3. Run output validation
+                    validated_fragment = self.validate(
+                        iteration,
+                        index,
+                        parsed_fragment,
+                        output_schema,
+                        validate_subschema=True,
                     )
-
-                # 4. Introspect: inspect the validated fragment for reasks
-                reasks, valid_op = self.introspect(chunk)
-                if reasks:
-                    raise ValueError(
-                        "Reasks are not yet supported with streaming. Please "
-                        "remove reasks from schema or disable streaming."
+                    if isinstance(validated_fragment, SkeletonReAsk):
+                        raise ValueError(
+                            "Received fragment schema is an invalid sub-schema "
+                            "of the expected output JSON schema."
+                        )
+
+                    # 4. Introspect: inspect the validated fragment for reasks
+                    reasks, valid_op = self.introspect(validated_fragment)
+                    if reasks:
+                        raise ValueError(
+                            "Reasks are not yet supported with streaming. Please "
+                            "remove reasks from schema or disable streaming."
+                        )
+
+                    if self.output_type == OutputTypes.LIST:
+                        validation_response = cast(list, validated_fragment)
+                    else:
+                        validation_response = cast(dict, validated_fragment)
+                    # 5. Convert validated fragment to a pretty JSON string
+                    if self.exec_options.stream_deltas:
+                        yield self.delta_outcome(
+                            call_log,
+                            fragment[streamed_length:],
+                            streamed_output,
+                            validated_fragment,
+                        )
+                        streamed_length, streamed_output = (
+                            len(fragment),
+                            validated_fragment,
+                        )
+                        continue
+                    yield ValidationOutcome(
+                        call_id=call_log.id,  # type: ignore
+                        raw_llm_output=fragment,
+                        validated_output=validated_fragment,
+                        validation_passed=validated_fragment is not None,
                     )
-                # 5. Convert validated fragment to a pretty JSON string
-                validation_response += cast(str, chunk)
-                passed = call_log.status == pass_status
-                yield ValidationOutcome(
-                    call_id=call_log.id,  # type: ignore
-                    #  The chunk or the whole output?
-                    raw_llm_output=original_text,
-                    validated_output=chunk,
-                    validation_passed=passed,
-                )
-
-        # handle non string schema
-        else:
-            for chunk in stream:
-                # 1. Get the text from the chunk and append to fragment
-                chunk_text = self.get_chunk_text(chunk, api)
-                fragment += chunk_text
-
-                # 2. Parse the fragment
-                parsed_fragment, move_to_next = self.parse(
-                    fragment, output_schema, verified=verified
-                )
-                if move_to_next:
-                    # Continue to next chunk
-                    continue
-
-                # 3. Run output validation
-                validated_fragment = self.validate(
-                    iteration,
-                    index,
-                    parsed_fragment,
-                    output_schema,
-                    validate_subschema=True,
-                )
-                if isinstance(validated_fragment, SkeletonReAsk):
-                    raise ValueError(
-                        "Received fragment schema is an invalid sub-schema "
-                        "of the expected output JSON schema."
+                stream_done = True
+                if (
+                    self.exec_options.stream_deltas
+                    and self.exec_options.materialize_stream_deltas
+                ):
+                    yield ValidationOutcome(
+                        call_id=call_log.id,  # type: ignore
+                        raw_llm_output=fragment,
+                        validated_output=streamed_output,
+                        validation_passed=streamed_output is not None,
                     )
-
-                # 4. Introspect: inspect the validated fragment for reasks
-                reasks, valid_op = self.introspect(validated_fragment)
-                if reasks:
-                    raise ValueError(
-                        "Reasks are not yet supported with streaming. Please "
-                        "remove reasks from schema or disable streaming."
-                    )
-
-                if self.output_type == OutputTypes.LIST:
-                    validation_response = cast(list, validated_fragment)
-                else:
-                    validation_response = cast(dict, validated_fragment)
-                # 5. Convert validated fragment to a pretty JSON string
-                yield ValidationOutcome(
-                    call_id=call_log.id,  # type: ignore
-                    raw_llm_output=fragment,
-                    validated_output=validated_fragment,
-                    validation_passed=validated_fragment is not None,
-                )
+        finally:
+            abort_stream()
 
         # # Finally, add to logs
         iteration.outputs.raw_output = fragment
@@ -237,6 +307,128 @@ class StreamRunner(Runner):
         iteration.outputs.validation_response = validation_response
         iteration.outputs.guarded_output = valid_op
 
+    def delta_outcome(
+        self,
+        call_log: Call,
+        raw_delta: str,
+        previous_output: Any,
+        validated_output: Any,
+    ) -> ValidationOutcome[OT]:
+        """Build a ValidationOutcome holding only what changed since the
+        previous one: the newly received raw text, and a JSON Patch from the
+        previously validated output to the current one."""
+        return ValidationOutcome(
+            call_id=call_log.id,  # type: ignore
+            raw_llm_output=raw_delta,
+            patch=make_json_patch(previous_output, validated_output),
+            validation_passed=validated_output is not None,
+        )
+
+    def speculative_validate_stream(
+        self,
+        chunk_stream: Iterator[Tuple[Any, bool]],
+        speculative: SpeculativeStream,
+        iteration: Iteration,
+    ) -> Iterator[ValidationOutcome[OT]]:
+        """Forward each chunk as soon as it is read, validating the stream
+        in the background.
+
+        Whenever validation changes or fails part of the text that was
+        already forwarded, a retraction follows with its replacement.
+        """
+        chunks: Queue = Queue()
+        results: Queue = Queue()
+        validation_done = False
+        # Set by the validation thread once it stops, so that reading from
+        #   the LLM stops without waiting for its results to be handled.
+        validation_stopped = threading.Event()
+
+        def chunks_to_validate() -> Iterator[Tuple[Any, bool]]:
+            while True:
+                chunk = chunks.get()
+                if chunk is _STREAM_END:
+                    return
+                yield chunk
+
+        def validate():
+            try:
+                for res in validator_service.validate_stream(
+                    chunks_to_validate(),
+                    self.metadata,
+                    self.validation_map,
+                    iteration,
+                    self._disable_tracer,
+                    "$",
+                    timeouts=self.exec_options.timeouts,
+                    validate_subschema=True,
+                ):
+                    # Only this thread writes the logs while it runs, so it
+                    #   observes them for the caller's thread.
+                    results.put((res, speculative.observe()))
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(_STREAM_END)
+                validation_stopped.set()
+
+        def retractions(block: bool) -> Iterator[ValidationOutcome[OT]]:
+            nonlocal validation_done
+            while not validation_done:
+                try:
+                    res = results.get(block=block)
+                except Empty:
+                    return
+                if res is _STREAM_END:
+                    validation_done = True
+                    # The validation thread is done writing the logs.
+                    speculative.update(speculative.observe())
+                    return
+                if isinstance(res, Exception):
+                    raise res
+                res, state = res
+                speculative.update(state)
+                reasks, _ = self.introspect(res.chunk)
+                if reasks:
+                    raise ValueError(
+                        "Reasks are not yet supported with streaming. Please "
+                        "remove reasks from schema or disable streaming."
+                    )
+                outcome = speculative.confirm(res.original_text, res.chunk)
+                if outcome is not None:
+                    yield outcome
+
+        speculative.update(speculative.observe())
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run,
+            args=(validate,),
+            name="guardrails-speculative-validation",
+            daemon=True,
+        ).start()
+        try:
+            for chunk, finished in chunk_stream:
+                if validation_stopped.is_set():
+                    break
+                yield speculative.forward(chunk)
+                chunks.put((chunk, finished))
+                yield from retractions(block=False)
+                if validation_stopped.is_set():
+                    break
+            if validation_stopped.is_set():
+                # Validation stopped early, e.g. because a validator
+                #   refrained, so nothing more will be confirmed; close the
+                #   LLM stream before reading from it again.
+                close_stream(chunk_stream)
+            chunks.put(_STREAM_END)
+            yield from retractions(block=True)
+        finally:
+            # Unblock the validation thread if we stopped reading early.
+            chunks.put(_STREAM_END)
+
+        outcome = speculative.retract_rest()
+        if outcome is not None:
+            yield outcome
+
     def is_last_chunk(self, chunk: Any, api: Union[PromptCallableBase, None]) -> bool:
         """Detect if chunk is final chunk."""
         try:
@@ -1,30 +1,31 @@
-import copy
+import inspect
 from string import Template
-from typing import Dict, cast, Optional, Tuple
+from typing import Any, Dict, cast, Optional, Tuple
 
+from guardrails.classes.history import Iteration
 from guardrails.classes.output_type import OutputTypes
 from guardrails.llm_providers import (
     LiteLLMCallable,
     AsyncLiteLLMCallable,
     PromptCallableBase,
 )
+from guardrails.logger import logger
 from guardrails.prompt.prompt import Prompt
 from guardrails.types.inputs import MessageHistory
 from guardrails.prompt.instructions import Instructions
+from guardrails.utils.casting_utils import to_int
 
 
 def messages_source(messages: MessageHistory) -> MessageHistory:
     messages_copy = []
     for msg in messages:
-        msg_copy = copy.deepcopy(msg)
         content = (
             msg["content"].source
             if isinstance(msg["content"], Prompt)
             or isinstance(msg["content"], Instructions)
             else msg["content"]
         )
-        msg_copy["content"] = content
-        messages_copy.append(cast(Dict[str, str], msg_copy))
+        messages_copy.append(cast(Dict[str, str], {**msg, "content": content}))
     return messages_copy
 
 
@@ -88,3 +89,62 @@ def preprocess_prompt(
     return preprocess_prompt_for_json_output(
         prompt_callable, instructions, prompt, use_xml
     )
+
+
+def _stream_close_targets(stream: Any) -> Tuple[Any, ...]:
+    # LiteLLM wraps the provider's stream object in `completion_stream`;
+    # fall back to it when the wrapper itself cannot be closed.
+    return (stream, getattr(stream, "completion_stream", None))
+
+
+def close_stream(stream: Any) -> None:
+    """Close an LLM stream that will not be consumed any further.
+
+    This releases the underlying HTTP connection so the provider stops
+    generating (and billing for) tokens nobody will read.
+    """
+    for target in _stream_close_targets(stream):
+        close = getattr(target, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Failed to close LLM stream: {e}")
+            return
+
+
+async def async_close_stream(stream: Any) -> None:
+    """Close an async LLM stream that will not be consumed any further."""
+    for target in _stream_close_targets(stream):
+        close = getattr(target, "aclose", None) or getattr(target, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Failed to close LLM stream: {e}")
+            return
+
+
+def record_stream_abort(
+    iteration: Iteration, api: Optional[PromptCallableBase], chunks_received: int
+) -> None:
+    """Mark the iteration's stream as aborted and estimate the completion
+    tokens that were not generated because of it.
+
+    Tokens saved can only be estimated when `max_tokens` was passed to
+    the LLM; each streamed chunk is counted as a single token unless the
+    response reported its own token usage.
+    """
+    outputs = iteration.outputs
+    outputs.stream_aborted = True
+    init_kwargs = getattr(api, "init_kwargs", None) or {}
+    max_tokens = to_int(init_kwargs.get("max_tokens"))
+    if max_tokens is None:
+        return
+    llm_response = outputs.llm_response_info
+    tokens_received = (
+        llm_response.response_token_count if llm_response else None
+    ) or chunks_received
+    outputs.tokens_saved = max(max_tokens - tokens_received, 0)
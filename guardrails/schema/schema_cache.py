@@ -0,0 +1,241 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Set, get_args
+
+from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
+from guardrails.classes.output_type import OutputTypes
+from guardrails.classes.schema.processed_schema import ProcessedSchema
+from guardrails.classes.validation.validator_reference import ValidatorReference
+from guardrails.logger import logger
+from guardrails.schema.pydantic_schema import (
+    get_base_model,
+    is_base_model_type,
+    pydantic_model_to_schema,
+)
+from guardrails.schema.rail_schema import rail_string_to_schema
+from guardrails.settings import settings
+from guardrails.types.on_fail import OnFailAction
+from guardrails.types.pydantic import ModelOrListOfModels
+from guardrails.utils.fingerprint_utils import validators_fingerprint
+from guardrails.utils.validator_utils import parse_validator_reference
+from guardrails.validator_base import get_validator_class
+from guardrails.version import GUARDRAILS_VERSION
+
+SCHEMA_CACHE_SIZE = 256
+# Change this whenever the compiled form of a schema changes,
+#   so that files written by an older version are not read.
+COMPILED_SCHEMA_VERSION = 1
+
+
+def get_schema_cache_dir() -> Optional[str]:
+    if settings.schema_cache_dir is not None:
+        return settings.schema_cache_dir
+    return os.environ.get("GUARDRAILS_SCHEMA_CACHE_DIR") or None
+
+
+def _nested_models(annotation: Any) -> Iterator[type]:
+    if is_base_model_type(annotation):
+        yield annotation
+    for arg in get_args(annotation):
+        yield from _nested_models(arg)
+
+
+def _model_fingerprint_parts(
+    model: type, parts: List[str], seen: Set[type]
+) -> List[str]:
+    seen.add(model)
+    parts.append(f"{model.__module__}.{model.__qualname__}:{model.model_config!r}")
+    for field_name, field in model.model_fields.items():  # type: ignore
+        validators = []
+        if isinstance(field.json_schema_extra, dict):
+            validators = field.json_schema_extra.get("validators", [])
+            if not isinstance(validators, list):
+                validators = [validators]
+        parts.append(
+            f"{field_name}:{field!r}:"
+            f"{validators_fingerprint(v for v in validators if hasattr(v, 'get_args'))}"
+        )
+        for nested_model in _nested_models(field.annotation):
+            if nested_model not in seen:
+                _model_fingerprint_parts(nested_model, parts, seen)
+    return parts
+
+
+def pydantic_model_fingerprint(model: type) -> str:
+    """Identify a pydantic model by its fields, and those of the models
+    nested in it, including the validators on them."""
+    parts = _model_fingerprint_parts(model, [], set())
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class SchemaCache:
+    """A least recently used cache of the schemas compiled from RAIL and
+    pydantic models.
+
+    A compiled schema is kept as its JSON Schema, validator references and
+    messages. Each Guard gets new validators built from the references, as
+    validators keep state between the chunks of a stream. Schemas whose
+    validators cannot be built again from their references are not cached.
+
+    Compiled RAIL is also persisted to `get_schema_cache_dir()` when one is
+    set. Pydantic models are only cached in memory, by their qualified name
+    and a fingerprint of their fields.
+    """
+
+    def __init__(self, maxsize: int = SCHEMA_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def _get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _put(self, key: Hashable, entry: Any) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _compile(processed_schema: ProcessedSchema) -> Optional[Dict[str, Any]]:
+        """The JSON serializable parts of a compiled schema, or None if its
+        validators cannot be built again from their references."""
+        for validators in processed_schema.validator_map.values():
+            for validator in validators:
+                if (
+                    get_validator_class(validator.rail_alias) is not type(validator)
+                    or validator.on_fail_descriptor == OnFailAction.CUSTOM
+                ):
+                    return None
+        exec_opts = processed_schema.exec_opts
+        return {
+            "output_type": processed_schema.output_type.value,
+            "json_schema": processed_schema.json_schema,
+            "validators": [ref.to_dict() for ref in processed_schema.validators],
+            "messages": exec_opts.messages,
+            "reask_messages": exec_opts.reask_messages,
+        }
+
+    @staticmethod
+    def _load(compiled: Dict[str, Any]) -> ProcessedSchema:
+        validators: List[ValidatorReference] = [
+            ValidatorReference.from_dict(ref)  # type: ignore
+            for ref in compiled["validators"]
+        ]
+        validator_map = {}
+        for ref in validators:
+            validator = parse_validator_reference(ref)
+            if validator:
+                validator_map.setdefault(ref.on, []).append(validator)
+        return ProcessedSchema(
+            output_type=OutputTypes(compiled["output_type"]),
+            validators=validators,
+            validator_map=validator_map,  # type: ignore
+            json_schema=deepcopy(compiled["json_schema"]),
+            exec_opts=GuardExecutionOptions(
+                messages=deepcopy(compiled["messages"]),
+                reask_messages=deepcopy(compiled["reask_messages"]),
+            ),
+        )
+
+    ### RAIL ###
+    @staticmethod
+    def rail_key(rail_string: str) -> str:
+        return hashlib.sha256(
+            f"{GUARDRAILS_VERSION}\0{COMPILED_SCHEMA_VERSION}\0{rail_string}".encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _read(cache_dir: str, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(cache_dir, f"{key}.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read compiled schema {key}: {e}")
+            return None
+
+    @staticmethod
+    def _write(cache_dir: str, key: str, compiled: Dict[str, Any]) -> None:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that other processes
+            #   never read a partially written schema.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(compiled, f)
+                os.replace(tmp_path, os.path.join(cache_dir, f"{key}.json"))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write compiled schema {key}: {e}")
+
+    def rail_string_to_schema(self, rail_string: str) -> ProcessedSchema:
+        key = self.rail_key(rail_string)
+        compiled = self._get(key)
+        if compiled is not None:
+            return self._load(compiled)
+
+        cache_dir = get_schema_cache_dir()
+        if cache_dir:
+            compiled = self._read(cache_dir, key)
+            if compiled is not None:
+                self._put(key, compiled)
+                return self._load(compiled)
+
+        processed_schema = rail_string_to_schema(rail_string)
+        compiled = self._compile(processed_schema)
+        if compiled is not None:
+            # Keep a copy, in case the Guard changes what it was given.
+            compiled = deepcopy(compiled)
+            self._put(key, compiled)
+            if cache_dir:
+                self._write(cache_dir, key, compiled)
+        return processed_schema
+
+    def rail_file_to_schema(self, file_path: str) -> ProcessedSchema:
+        with open(file_path, "r") as f:
+            rail_xml = f.read()
+        return self.rail_string_to_schema(rail_xml)
+
+    ### Pydantic ###
+    def pydantic_model_to_schema(
+        self, pydantic_class: ModelOrListOfModels
+    ) -> ProcessedSchema:
+        schema_model, type_origin, _key_type_origin = get_base_model(pydantic_class)
+        key = (
+            f"{schema_model.__module__}.{schema_model.__qualname__}",
+            repr(type_origin),
+            pydantic_model_fingerprint(schema_model),
+        )
+        compiled = self._get(key)
+        if compiled is not None:
+            return self._load(compiled)
+
+        processed_schema = pydantic_model_to_schema(pydantic_class)
+        compiled = self._compile(processed_schema)
+        if compiled is not None:
+            # Keep a copy, in case the Guard changes what it was given.
+            compiled["json_schema"] = deepcopy(compiled["json_schema"])
+            self._put(key, compiled)
+        return processed_schema
+
+
+schema_cache = SchemaCache()
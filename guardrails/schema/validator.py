@@ -1,11 +1,12 @@
 import json
-from typing import Any, Dict, List, Optional
-from jsonschema import Draft202012Validator, ValidationError
-from referencing import Registry, jsonschema as jsonschema_ref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from guardrails.actions.reask import SkeletonReAsk
 from guardrails.classes.validation.validation_result import FailResult
 
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator, ValidationError
+
 
 class SchemaValidationError(Exception):
     fields: Dict[str, List[str]] = {}
@@ -17,12 +18,12 @@ class SchemaValidationError(Exception):
 
 def validate_against_schema(
     payload: Any,
-    validator: Draft202012Validator,
+    validator: "Draft202012Validator",
     *,
     validate_subschema: Optional[bool] = False,
 ):
     fields: Dict[str, List[str]] = {}
-    error: ValidationError
+    error: "ValidationError"
     for error in validator.iter_errors(payload):
         if validate_subschema is True and error.message.endswith(
             "is a required property"
@@ -43,6 +44,8 @@ def validate_json_schema(json_schema: Dict[str, Any]):
 
     Raises a SchemaValidationError if invalid.
     """
+    from jsonschema import Draft202012Validator
+
     json_schema_validator = Draft202012Validator(
         {
             "$ref": "https://json-schema.org/draft/2020-12/schema",
@@ -68,6 +71,9 @@ def validate_payload(
 
     Raises a SchemaValidationError if invalid.
     """
+    from jsonschema import Draft202012Validator
+    from referencing import Registry, jsonschema as jsonschema_ref
+
     schema_id = json_schema.get("$id", "temp-schema")
     registry = Registry().with_resources(
         [
@@ -16,6 +16,35 @@ class Settings:
     environment variables or by instantiating a TracerProvider.
     """
     disable_tracing: Optional[bool]
+    """Whether synchronous Guards should run validators concurrently on a
+    thread pool instead of an asyncio event loop.
+
+    Falls back to the GUARDRAILS_USE_THREAD_POOL environment variable
+    when unset.
+    """
+    use_thread_pool: Optional[bool]
+    """The number of threads validators are run on when `use_thread_pool`
+    is enabled.
+
+    Falls back to the GUARDRAILS_THREAD_POOL_SIZE environment variable,
+    then to the ThreadPoolExecutor default, when unset.
+    """
+    thread_pool_size: Optional[int]
+    """A directory to persist compiled RAIL schemas in, so that Guards
+    created from the same RAIL in later processes skip parsing it.
+
+    Falls back to the GUARDRAILS_SCHEMA_CACHE_DIR environment variable
+    when unset. Compiled schemas are only cached in memory without one.
+    """
+    schema_cache_dir: Optional[str]
+    """A directory to cache validator manifests fetched from the hub in,
+    by validator id and version, so that installing the same validators
+    again does not fetch them.
+
+    Falls back to the GUARDRAILS_HUB_MANIFEST_CACHE_DIR environment
+    variable when unset. Manifests are always fetched without one.
+    """
+    hub_manifest_cache_dir: Optional[str]
 
     def __new__(cls) -> "Settings":
         if cls._instance is None:
@@ -28,6 +57,10 @@ class Settings:
     def _initialize(self):
         self.use_server = None
         self.disable_tracing = None
+        self.use_thread_pool = None
+        self.thread_pool_size = None
+        self.schema_cache_dir = None
+        self.hub_manifest_cache_dir = None
         self._rc = RC.load()
 
     @property
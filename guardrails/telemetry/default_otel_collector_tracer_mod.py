@@ -1,16 +1,38 @@
+from typing import TYPE_CHECKING
+
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
-# TODO: Make the option between GRPC and HTTP configurable
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-
 import threading
 
+from guardrails.utils.lazy_import_utils import LazyImports
 from guardrails.version import GUARDRAILS_VERSION
 
+if TYPE_CHECKING:
+    # TODO: Make the option between GRPC and HTTP configurable
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+# Only import the OpenTelemetry SDK and exporter once the tracer is created.
+_otel = LazyImports(
+    globals(),
+    {
+        "OTLPSpanExporter": (
+            "opentelemetry.exporter.otlp.proto.grpc.trace_exporter",
+            "OTLPSpanExporter",
+        ),
+        "SERVICE_NAME": ("opentelemetry.sdk.resources", "SERVICE_NAME"),
+        "Resource": ("opentelemetry.sdk.resources", "Resource"),
+        "TracerProvider": ("opentelemetry.sdk.trace", "TracerProvider"),
+        "BatchSpanProcessor": ("opentelemetry.sdk.trace.export", "BatchSpanProcessor"),
+    },
+)
+__getattr__ = _otel.module_getattr
+
 
 class DefaultOtelCollectorTracer:
     _instance = None
@@ -27,6 +49,7 @@ class DefaultOtelCollectorTracer:
         return cls._instance
 
     def _initialize(self, resource_name: str):
+        _otel.load()
         resource = Resource(attributes={SERVICE_NAME: resource_name})
 
         traceProvider = TracerProvider(resource=resource)
@@ -1,23 +1,53 @@
 import os
 import sys
 
+from typing import TYPE_CHECKING
+
 from opentelemetry import trace
 from opentelemetry.trace import Tracer
 
-# TODO: Make the option between GRPC and HTTP configurable
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SimpleSpanProcessor,
-)
-
 import threading
 
+from guardrails.utils.lazy_import_utils import LazyImports
 from guardrails.version import GUARDRAILS_VERSION
 
+if TYPE_CHECKING:
+    # TODO: Make the option between GRPC and HTTP configurable
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+
+# Only import the OpenTelemetry SDK and exporter once the tracer is created.
+_otel = LazyImports(
+    globals(),
+    {
+        "OTLPSpanExporter": (
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter",
+            "OTLPSpanExporter",
+        ),
+        "SERVICE_NAME": ("opentelemetry.sdk.resources", "SERVICE_NAME"),
+        "Resource": ("opentelemetry.sdk.resources", "Resource"),
+        "TracerProvider": ("opentelemetry.sdk.trace", "TracerProvider"),
+        "BatchSpanProcessor": ("opentelemetry.sdk.trace.export", "BatchSpanProcessor"),
+        "ConsoleSpanExporter": (
+            "opentelemetry.sdk.trace.export",
+            "ConsoleSpanExporter",
+        ),
+        "SimpleSpanProcessor": (
+            "opentelemetry.sdk.trace.export",
+            "SimpleSpanProcessor",
+        ),
+    },
+)
+__getattr__ = _otel.module_getattr
+
 
 class DefaultOtlpTracer:
     _instance = None
@@ -34,6 +64,7 @@ class DefaultOtlpTracer:
         return cls._instance
 
     def _initialize(self, resource_name: str):
+        _otel.load()
         envvars_exist = os.environ.get("OTEL_EXPORTER_OTLP_PROTOCOL") and (
             os.environ.get("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
             or os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT")
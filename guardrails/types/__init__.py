@@ -1,5 +1,8 @@
+from typing import TYPE_CHECKING
+
 from guardrails.types.inputs import MessageHistory
 from guardrails.types.on_fail import OnFailAction
+from guardrails.types.on_timeout import OnTimeoutAction
 from guardrails.types.primitives import PrimitiveTypes
 from guardrails.types.pydantic import (
     ModelOrListOfModels,
@@ -7,17 +10,39 @@ from guardrails.types.pydantic import (
     ModelOrModelUnion,
 )
 from guardrails.types.rail import RailTypes
-from guardrails.types.validator import (
-    PydanticValidatorTuple,
-    PydanticValidatorSpec,
-    UseValidatorSpec,
-    UseManyValidatorTuple,
-    UseManyValidatorSpec,
-    ValidatorMap,
+from guardrails.utils.lazy_import_utils import LazyImports
+
+if TYPE_CHECKING:
+    from guardrails.types.validator import (
+        PydanticValidatorTuple,
+        PydanticValidatorSpec,
+        UseValidatorSpec,
+        UseManyValidatorTuple,
+        UseManyValidatorSpec,
+        ValidatorMap,
+    )
+
+# The validator types depend on guardrails.validator_base, which itself
+#   imports from this package, so they are resolved on first access.
+_lazy = LazyImports(
+    globals(),
+    {
+        name: ("guardrails.types.validator", name)
+        for name in (
+            "PydanticValidatorTuple",
+            "PydanticValidatorSpec",
+            "UseValidatorSpec",
+            "UseManyValidatorTuple",
+            "UseManyValidatorSpec",
+            "ValidatorMap",
+        )
+    },
 )
+__getattr__ = _lazy.module_getattr
 
 __all__ = [
     "OnFailAction",
+    "OnTimeoutAction",
     "RailTypes",
     "PrimitiveTypes",
     "MessageHistory",
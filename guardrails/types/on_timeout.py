@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class OnTimeoutAction(str, Enum):
+    """OnTimeoutAction is an Enum that represents the different outcomes a
+    validator can have when it does not finish before its timeout or the
+    call's deadline.
+
+    Attributes:
+        PASS (Literal["pass"]): On timeout, treat the validation as passed.
+        FAIL (Literal["fail"]): On timeout, treat the validation as failed;
+            the validator's on_fail action is applied as usual.
+        EXCEPTION (Literal["exception"]): On timeout, raise a
+            ValidatorTimeoutError.
+    """
+
+    PASS = "pass"
+    FAIL = "fail"
+    EXCEPTION = "exception"
@@ -1,6 +1,4 @@
-import re
 from guardrails.classes.templating.constants_container import ConstantsContainer
-from guardrails.classes.templating.namespace_template import NamespaceTemplate
 
 # TODO: Move this to guardrails/constants/__init__.py
 # Singleton instance created on import/init
@@ -11,15 +9,8 @@ constants = ConstantsContainer()
 #       into guardrails/utils/templating_utils.py
 def substitute_constants(text):
     """Substitute constants in the prompt."""
-    # Substitute constants by reading the constants file.
-    # Regex to extract all occurrences of ${gr.<constant_name>}
-    matches = re.findall(r"\${gr\.(\w+)}", text)
+    from guardrails.classes.templating.compiled_template import (
+        substitute_constants as substitute_compiled_constants,
+    )
 
-    # Substitute all occurrences of ${gr.<constant_name>}
-    #   with the value of the constant.
-    for match in matches:
-        template = NamespaceTemplate(text)
-        mapping = {f"gr.{match}": constants[match]}
-        text = template.safe_substitute(**mapping)
-
-    return text
+    return substitute_compiled_constants(text)
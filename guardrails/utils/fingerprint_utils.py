@@ -0,0 +1,36 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+if TYPE_CHECKING:
+    from guardrails.validator_base import Validator
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def json_fingerprint(obj: Any) -> str:
+    """Identify a JSON-like object, e.g. a JSON Schema, by its content."""
+    return _sha256(json.dumps(obj, sort_keys=True, default=str))
+
+
+def validators_fingerprint(validators: Iterable["Validator"]) -> str:
+    """Identify a set of validators and how they are configured."""
+    validator_keys = sorted(
+        f"{id(validator)}:{type(validator).__qualname__}"
+        f":{validator.on_fail_descriptor}:{validator.get_args()!r}"
+        for validator in validators
+    )
+    return _sha256("\n".join(validator_keys))
+
+
+def validator_map_fingerprint(
+    validator_map: Mapping[str, Iterable["Validator"]],
+) -> str:
+    """Identify a validator map by its paths and the validators on each."""
+    path_keys = sorted(
+        f"{path}={validators_fingerprint(validators)}"
+        for path, validators in validator_map.items()
+    )
+    return _sha256("\n".join(path_keys))
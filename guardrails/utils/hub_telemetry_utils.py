@@ -1,17 +1,41 @@
 # Imports
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from guardrails.settings import settings
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import (  # HTTP Exporter
-    OTLPSpanExporter,
-)
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import ConsoleSpanExporter, BatchSpanProcessor
+from guardrails.utils.lazy_import_utils import LazyImports
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from opentelemetry.trace.propagation import set_span_in_context
 
+if TYPE_CHECKING:
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (  # HTTP Exporter
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter, BatchSpanProcessor
+
+# The OpenTelemetry SDK and OTLP exporter are slow to import,
+#   so only pull them in once a tracer is actually initialized.
+_otel = LazyImports(
+    globals(),
+    {
+        "OTLPSpanExporter": (
+            "opentelemetry.exporter.otlp.proto.http.trace_exporter",
+            "OTLPSpanExporter",
+        ),
+        "SERVICE_NAME": ("opentelemetry.sdk.resources", "SERVICE_NAME"),
+        "Resource": ("opentelemetry.sdk.resources", "Resource"),
+        "TracerProvider": ("opentelemetry.sdk.trace", "TracerProvider"),
+        "ConsoleSpanExporter": (
+            "opentelemetry.sdk.trace.export",
+            "ConsoleSpanExporter",
+        ),
+        "BatchSpanProcessor": ("opentelemetry.sdk.trace.export", "BatchSpanProcessor"),
+    },
+)
+__getattr__ = _otel.module_getattr
+
 
 class HubTelemetry:
     """Singleton class for initializing a tracer for Guardrails Hub."""
@@ -55,6 +79,7 @@ class HubTelemetry:
         enabled: Optional[bool] = None,
     ):
         """Initializes a tracer for Guardrails Hub."""
+        _otel.load()
         if enabled is None:
             enabled = settings.rc.enable_metrics or False
         self._enabled = enabled
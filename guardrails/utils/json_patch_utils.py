@@ -0,0 +1,79 @@
+import copy
+from typing import Any, Dict, List
+
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_json_patch(old: Any, new: Any, path: str = "") -> JsonPatch:
+    """Build the JSON Patch (RFC 6902) operations that turn `old` into
+    `new`.
+
+    Objects and arrays are compared member by member so that a value which
+    only grew, as partial LLM output does while streaming, yields just the
+    paths that were added or changed.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        patch: JsonPatch = []
+        for key in old:
+            if key not in new:
+                patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key not in old:
+                patch.append({"op": "add", "path": key_path, "value": value})
+            else:
+                patch.extend(make_json_patch(old[key], value, key_path))
+        return patch
+    if isinstance(old, list) and isinstance(new, list):
+        patch = []
+        for index in range(min(len(old), len(new))):
+            patch.extend(make_json_patch(old[index], new[index], f"{path}/{index}"))
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            patch.append({"op": "remove", "path": f"{path}/{index}"})
+        for index in range(len(old), len(new)):
+            patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        return patch
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_json_patch(document: Any, patch: JsonPatch) -> Any:
+    """Apply JSON Patch operations built by `make_json_patch` to a copy of
+    `document`.
+
+    Only the add, replace and remove operations are supported.
+    """
+    document = copy.deepcopy(document)
+    for operation in patch:
+        op = operation["op"]
+        path = operation["path"]
+        if path == "":
+            if op == "remove":
+                document = None
+            else:
+                document = copy.deepcopy(operation["value"])
+            continue
+        *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+        container = document
+        for token in parents:
+            container = container[int(token) if isinstance(container, list) else token]
+        key: Any = int(last) if isinstance(container, list) else last
+        if op == "remove":
+            del container[key]
+        elif op == "add" and isinstance(container, list):
+            container.insert(key, copy.deepcopy(operation["value"]))
+        elif op in ("add", "replace"):
+            container[key] = copy.deepcopy(operation["value"])
+        else:
+            raise ValueError(f"Unsupported JSON Patch operation: {op}")
+    return document
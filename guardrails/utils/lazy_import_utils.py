@@ -0,0 +1,51 @@
+import importlib
+from typing import Any, Dict, Optional, Tuple
+
+
+class LazyImports:
+    """Defers importing a set of module-level names until first use.
+
+    The names are bound into the owning module's globals the first time
+    they are needed, so code in the module can keep referring to them as
+    plain globals after calling `load()`, and they can still be patched
+    as `<module>.<name>` before they have been loaded.
+
+    Usage:
+        _lazy = LazyImports(globals(), {"Name": ("some.module", "Name")})
+        # An attribute of None binds the module itself.
+        __getattr__ = _lazy.module_getattr
+
+        def uses_name():
+            _lazy.load()
+            return Name()
+    """
+
+    def __init__(
+        self,
+        module_globals: Dict[str, Any],
+        imports: Dict[str, Tuple[str, Optional[str]]],
+    ):
+        self._module_globals = module_globals
+        self._imports = imports
+
+    def load(self) -> None:
+        """Import every name that is not already bound in the module."""
+        for name in self._imports:
+            if name not in self._module_globals:
+                self._module_globals[name] = self._import(name)
+
+    def _import(self, name: str) -> Any:
+        module_path, attribute = self._imports[name]
+        module = importlib.import_module(module_path)
+        if attribute is None:
+            return module
+        return getattr(module, attribute)
+
+    def module_getattr(self, name: str) -> Any:
+        """Module level `__getattr__` that resolves the lazy names."""
+        if name not in self._imports:
+            module_name = self._module_globals.get("__name__")
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = self._import(name)
+        self._module_globals[name] = value
+        return value
@@ -1,10 +1,16 @@
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import ContextManager, List, Literal, Optional
+
+from guardrails.logger import logger
 
 try:
     import sqlalchemy
     from sqlalchemy import text
+    from sqlalchemy.pool import StaticPool
 
     _HAS_SQLALCHEMY = True
 except ImportError:
@@ -42,14 +48,42 @@ class SimpleSqlDriver(SQLDriver):
         raise NotImplementedError
 
 
+SqlValidationMode = Literal["execute", "explain"]
+
+
 class SqlAlchemyDriver(SQLDriver):
     """SQL driver which uses sqlalchemy to validate SQL queries.
 
     It can setup the database schema and check if the queries are valid
     by connecting to the database.
+
+    Queries are validated on connections checked out from the engine's
+    pool, so concurrent guard calls can validate in parallel. Any work a
+    query does is rolled back once it has been validated.
+
+    Args:
+        schema_file: Path to a SQL script to apply to the database.
+        conn: SQLAlchemy connection string.
+        validation_mode: "execute" runs the query to validate it.
+            "explain" only asks the database to plan it with `EXPLAIN`,
+            which checks syntax and referenced tables/columns without
+            reading data or taking locks. Defaults to "execute".
+        timeout: Maximum number of seconds a single validation may run
+            for. Supported on sqlite, postgresql and mysql/mariadb;
+            ignored with a warning on other dialects. Defaults to None.
+        pool_size: Number of connections to keep in the pool.
+            In-memory sqlite databases always use a single shared
+            connection. Defaults to 5.
     """
 
-    def __init__(self, schema_file: Optional[str], conn: Optional[str]) -> None:
+    def __init__(
+        self,
+        schema_file: Optional[str],
+        conn: Optional[str],
+        validation_mode: SqlValidationMode = "execute",
+        timeout: Optional[float] = None,
+        pool_size: int = 5,
+    ) -> None:
         if not _HAS_SQLALCHEMY:
             raise ImportError(
                 """The functionality requires sqlalchemy to be installed.
@@ -63,33 +97,112 @@ class SqlAlchemyDriver(SQLDriver):
            Use sqlite for ex: sqlite://"""
             )
 
+        if validation_mode not in ("execute", "explain"):
+            raise ValueError(
+                f"Invalid validation_mode '{validation_mode}'. "
+                "Must be one of 'execute' or 'explain'."
+            )
+
+        self._validation_mode = validation_mode
+        self._timeout = timeout
+        self._schema: Optional[str] = None
+        # In-memory sqlite databases only exist on the connection that
+        # created them, so they are shared and access is serialized.
+        self._lock: ContextManager = nullcontext()
+
         if conn is not None:
             try:
-                self._engine = sqlalchemy.create_engine(conn)
-                self._conn = self._engine.connect()
+                url = sqlalchemy.engine.make_url(conn)
+                if url.get_backend_name() == "sqlite" and url.database in (
+                    None,
+                    "",
+                    ":memory:",
+                ):
+                    self._engine = sqlalchemy.create_engine(
+                        conn,
+                        poolclass=StaticPool,
+                        connect_args={"check_same_thread": False},
+                    )
+                    self._lock = threading.Lock()
+                else:
+                    self._engine = sqlalchemy.create_engine(
+                        conn, pool_size=pool_size, pool_pre_ping=True
+                    )
             except Exception as ex:
                 raise ValueError(ex)
 
         if schema_file is not None:
             schema = Path(schema_file).read_text()
-            if conn is not None and conn.startswith("sqlite"):
-                self._conn.connection.executescript(schema)  # type: ignore
-            else:
-                from sqlalchemy import text
-
-                self._conn.execute(text(schema))
+            with self._engine.begin() as connection:
+                if conn is not None and conn.startswith("sqlite"):
+                    connection.connection.executescript(schema)  # type: ignore
+                else:
+                    connection.execute(text(schema))
+
+    @contextmanager
+    def _statement_timeout(self, connection: "sqlalchemy.Connection"):
+        if self._timeout is None:
+            yield
+            return
+
+        dialect = connection.dialect.name
+        timeout_ms = int(self._timeout * 1000)
+        if dialect == "sqlite":
+            deadline = time.monotonic() + self._timeout
+            driver_connection = connection.connection.driver_connection
+            # Returning a truthy value from the progress handler
+            #   interrupts the running statement.
+            driver_connection.set_progress_handler(  # type: ignore
+                lambda: int(time.monotonic() > deadline), 1000
+            )
+            try:
+                yield
+            finally:
+                driver_connection.set_progress_handler(None, 0)  # type: ignore
+        elif dialect == "postgresql":
+            # Scoped to the current transaction, which is rolled back.
+            connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+            yield
+        elif dialect in ("mysql", "mariadb"):
+            connection.execute(text(f"SET SESSION MAX_EXECUTION_TIME = {timeout_ms}"))
+            try:
+                yield
+            finally:
+                connection.execute(text("SET SESSION MAX_EXECUTION_TIME = 0"))
+        else:
+            logger.warning(
+                f"Statement timeouts are not supported for dialect '{dialect}'. "
+                "Validating without a timeout."
+            )
+            yield
 
     def validate_sql(self, query: str) -> List[str]:
         exceptions: List[str] = []
+        statement = query
+        if self._validation_mode == "explain":
+            statement = f"EXPLAIN {query}"
         try:
-            self._conn.execute(text(query))
+            with self._lock, self._engine.connect() as connection:
+                try:
+                    with self._statement_timeout(connection):
+                        connection.execute(text(statement))
+                finally:
+                    # Validation should never leave changes behind.
+                    connection.rollback()
         except Exception as ex:
             exceptions.append(str(ex))
         return exceptions
 
     def get_schema(self) -> str:
+        # Reflecting the schema is expensive, so only do it once.
+        if self._schema is None:
+            with self._lock:
+                self._schema = self._reflect_schema()
+        return self._schema
+
+    def _reflect_schema(self) -> str:
         # Get table schema using sqlalchemy.inspect
-        insp = sqlalchemy.inspect(self._conn)
+        insp = sqlalchemy.inspect(self._engine)
 
         schema = {}
         for table in insp.get_table_names():
@@ -117,8 +230,13 @@ class SqlAlchemyDriver(SQLDriver):
 
 
 def create_sql_driver(
-    schema_file: Optional[str] = None, conn: Optional[str] = None
+    schema_file: Optional[str] = None, conn: Optional[str] = None, **kwargs
 ) -> SQLDriver:
+    """Create a SQL driver.
+
+    Extra keyword arguments (`validation_mode`, `timeout`, `pool_size`)
+    are passed through to `SqlAlchemyDriver`.
+    """
     if schema_file is None and conn is None:
         return SimpleSqlDriver()
-    return SqlAlchemyDriver(schema_file=schema_file, conn=conn)
+    return SqlAlchemyDriver(schema_file=schema_file, conn=conn, **kwargs)
@@ -5,6 +5,7 @@
 
 import asyncio
 import contextlib
+import contextvars
 from functools import partial
 import inspect
 import logging
@@ -12,30 +13,42 @@ from collections import defaultdict
 from dataclasses import dataclass
 import re
 from string import Template
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 from typing_extensions import deprecated
 from warnings import warn
 import warnings
 
-import requests
-from langchain_core.runnables import Runnable
-
 from guardrails.settings import settings
 from guardrails.classes import ErrorSpan  # noqa
 from guardrails.classes import PassResult  # noqa
 from guardrails.classes import FailResult, ValidationResult
+from guardrails.classes.execution.validation_timeouts import get_current_timeouts
 from guardrails.constants import hub
 from guardrails.hub_token.token import VALIDATOR_HUB_SERVICE, get_jwt_token
 from guardrails.logger import logger
 from guardrails.remote_inference import remote_inference
 from guardrails.hub_telemetry.hub_tracing import trace
 from guardrails.types.on_fail import OnFailAction
+from guardrails.types.on_timeout import OnTimeoutAction
 from guardrails.utils.safe_get import safe_get
 from guardrails.utils.hub_telemetry_utils import HubTelemetry
 from guardrails.utils.tokenization_utils import (
     postproc_splits,
 )
 
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+
 
 ### functions to get chunks ###
 def split_sentence_str(chunk: str):
@@ -114,6 +127,11 @@ class Validator:
 
         self.use_local = kwargs.get("use_local", None)
         self.validation_endpoint = kwargs.get("validation_endpoint", None)
+        # Override the Guard's validator timeout and on timeout action
+        self.timeout: Optional[float] = kwargs.get("timeout", None)
+        self.on_timeout: Optional[Union[str, OnTimeoutAction]] = kwargs.get(
+            "on_timeout", None
+        )
         # NOTE: I think this is an evergreen check
         # We should test w/o an rc file,
         #   and if this doesn't raise then we should remove this.
@@ -254,7 +272,10 @@ class Validator:
         async context     due to lack of available event loops.
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.validate, value, metadata)
+        # Run in a copy of this context so the validator sees its timeouts.
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run, self.validate, value, metadata
+        )
 
     @trace(name="/validator_inference", origin="Validator._inference")
     def _inference(self, model_input: Any) -> Any:
@@ -345,7 +366,9 @@ class Validator:
         validate_stream_partial = partial(
             self.validate_stream, chunk, metadata, **kwargs
         )
-        return await loop.run_in_executor(None, validate_stream_partial)
+        return await loop.run_in_executor(
+            None, contextvars.copy_context().run, validate_stream_partial
+        )
 
     def _hub_inference_request(
         self, request_body: Union[dict, str], validation_endpoint: str
@@ -366,11 +389,25 @@ class Validator:
         Returns:
             Any: Post request response from the ML based validation model.
         """
+        import requests
+
         headers = {
             "Authorization": f"Bearer {self.hub_jwt_token}",
             "Content-Type": "application/json",
         }
-        req = requests.post(validation_endpoint, data=request_body, headers=headers)
+        # This validator's timeout or the Guard's, bounded by the time left
+        #   before the call's deadline.
+        timeout = get_current_timeouts().timeout_for(self)
+        if timeout is not None and timeout <= 0:
+            raise requests.exceptions.Timeout(
+                f"No time left to request {validation_endpoint}"
+            )
+        req = requests.post(
+            validation_endpoint,
+            data=request_body,
+            headers=headers,
+            timeout=timeout,
+        )
         if not req.ok:
             if req.status_code == 401:
                 raise Exception(
@@ -496,7 +533,7 @@ class Validator:
         self._metadata = metadata
         return self
 
-    def to_runnable(self) -> Runnable:
+    def to_runnable(self) -> "Runnable":
         from guardrails.integrations.langchain.validator_runnable import (
             ValidatorRunnable,
         )
@@ -564,12 +601,14 @@ def register_validator(
     return decorator
 
 
-def try_to_import_hub():
+def try_to_import_hub(validator_id: Optional[str] = None):
     try:
-        # This should import everything and trigger registration
-        # So it should only have to happen once
-        # in lieu of completely unregistered validators
-        import guardrails.hub  # noqa
+        # Importing a validator's package triggers its registration.
+        # Only the package indexed for validator_id is imported,
+        # or every installed package when there is no id.
+        from guardrails.hub.hub_index import import_hub_validator
+
+        import_hub_validator(validator_id)
     except ImportError:
         logger.error("Could not import hub. Validators may not work properly.")
 
@@ -583,7 +622,7 @@ def get_validator_class(name: Optional[str]) -> Optional[Type[Validator]]:
 
     registration = validators_registry.get(validator_key)
     if not registration:
-        try_to_import_hub()
+        try_to_import_hub(validator_key)
         registration = validators_registry.get(validator_key)
 
     if not registration:
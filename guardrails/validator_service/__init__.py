@@ -5,12 +5,14 @@ import warnings
 
 from guardrails.actions.filter import apply_filters
 from guardrails.actions.refrain import apply_refrain
+from guardrails.classes.execution.validation_timeouts import ValidationTimeouts
 from guardrails.classes.history import Iteration
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.validation.validation_result import (
     StreamValidationResult,
 )
 from guardrails.types import ValidatorMap
+from guardrails.settings import settings
 from guardrails.telemetry.legacy_validator_tracing import trace_validation_result
 
 # Keep this imported for backwards compatibility
@@ -19,6 +21,9 @@ from guardrails.validator_service.async_validator_service import AsyncValidatorS
 from guardrails.validator_service.sequential_validator_service import (
     SequentialValidatorService,
 )
+from guardrails.validator_service.thread_pool_validator_service import (
+    ThreadPoolValidatorService,
+)
 
 
 try:
@@ -47,6 +52,19 @@ def should_run_sync():
     return process_count == 1 or run_sync.lower() == "true"
 
 
+def should_use_thread_pool() -> bool:
+    if settings.use_thread_pool is not None:
+        return settings.use_thread_pool
+    use_thread_pool = os.environ.get("GUARDRAILS_USE_THREAD_POOL", "false")
+    bool_values = ["true", "false"]
+    if use_thread_pool.lower() not in bool_values:
+        warnings.warn(
+            f"GUARDRAILS_USE_THREAD_POOL must be one of {bool_values}!"
+            f" Defaulting to 'false'."
+        )
+    return use_thread_pool.lower() == "true"
+
+
 def get_loop() -> asyncio.AbstractEventLoop:
     try:
         loop = asyncio.get_running_loop()
@@ -69,6 +87,8 @@ def validate(
     iteration: Iteration,
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
+    short_circuit: bool = False,
+    timeouts: Optional[ValidationTimeouts] = None,
     **kwargs,
 ):
     if path is None:
@@ -76,17 +96,27 @@ def validate(
 
     loop = None
     if should_run_sync():
-        validator_service = SequentialValidatorService(disable_tracer)
+        validator_service = SequentialValidatorService(
+            disable_tracer, short_circuit=short_circuit, timeouts=timeouts
+        )
+    elif should_use_thread_pool():
+        validator_service = ThreadPoolValidatorService(
+            disable_tracer, short_circuit=short_circuit, timeouts=timeouts
+        )
     else:
         try:
             loop = get_loop()
-            validator_service = AsyncValidatorService(disable_tracer)
+            validator_service = AsyncValidatorService(
+                disable_tracer, short_circuit=short_circuit, timeouts=timeouts
+            )
         except RuntimeError:
             warnings.warn(
                 "Could not obtain an event loop."
                 " Falling back to synchronous validation."
             )
-            validator_service = SequentialValidatorService(disable_tracer)
+            validator_service = SequentialValidatorService(
+                disable_tracer, short_circuit=short_circuit, timeouts=timeouts
+            )
 
     return validator_service.validate(
         value,
@@ -107,11 +137,14 @@ def validate_stream(
     iteration: Iteration,
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
+    timeouts: Optional[ValidationTimeouts] = None,
     **kwargs,
 ) -> Iterator[StreamValidationResult]:
     if path is None:
         path = "$"
-    sequential_validator_service = SequentialValidatorService(disable_tracer)
+    sequential_validator_service = SequentialValidatorService(
+        disable_tracer, timeouts=timeouts
+    )
     gen = sequential_validator_service.validate_stream(
         value_stream, metadata, validator_map, iteration, path, path, **kwargs
     )
@@ -126,11 +159,15 @@ async def async_validate(
     disable_tracer: Optional[bool] = True,
     path: Optional[str] = None,
     stream: Optional[bool] = False,
+    short_circuit: bool = False,
+    timeouts: Optional[ValidationTimeouts] = None,
     **kwargs,
 ) -> Tuple[Any, dict]:
     if path is None:
         path = "$"
-    validator_service = AsyncValidatorService(disable_tracer)
+    validator_service = AsyncValidatorService(
+        disable_tracer, short_circuit=short_circuit, timeouts=timeouts
+    )
     return await validator_service.async_validate(
         value, metadata, validator_map, iteration, path, path, stream, **kwargs
     )
@@ -1,9 +1,21 @@
 import asyncio
-from typing import Any, Awaitable, Coroutine, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from guardrails.actions.filter import Filter
 from guardrails.actions.refrain import Refrain
 from guardrails.classes.history import Iteration
+from guardrails.classes.execution.validation_timeouts import use_timeouts
 from guardrails.classes.validation.validation_result import (
     FailResult,
     PassResult,
@@ -13,7 +25,6 @@ from guardrails.hub_telemetry.hub_tracing import async_trace
 from guardrails.telemetry.validator_tracing import trace_async_validator
 from guardrails.types import ValidatorMap, OnFailAction
 from guardrails.classes.validation.validator_logs import ValidatorLogs
-from guardrails.actions.reask import FieldReAsk
 from guardrails.validator_base import Validator
 from guardrails.validator_service.validator_service_base import (
     ValidatorRun,
@@ -22,6 +33,8 @@ from guardrails.validator_service.validator_service_base import (
 
 ValidatorResult = Optional[Union[ValidationResult, Awaitable[ValidationResult]]]
 
+T = TypeVar("T")
+
 
 class AsyncValidatorService(ValidatorServiceBase):
     @async_trace(
@@ -47,10 +60,11 @@ class AsyncValidatorService(ValidatorServiceBase):
             validation_session_id=validation_session_id,
             **validator._kwargs,
         )(validate_func)
-        if stream:
-            result = await traced_validator(value, metadata, **kwargs)
-        else:
-            result = await traced_validator(value, metadata)
+        with use_timeouts(self._timeouts):
+            if stream:
+                result = await traced_validator(value, metadata, **kwargs)
+            else:
+                result = await traced_validator(value, metadata)
         return result
 
     async def run_validator_async(
@@ -61,9 +75,10 @@ class AsyncValidatorService(ValidatorServiceBase):
         stream: Optional[bool] = False,
         *,
         validation_session_id: str,
+        validator_logs: Optional[ValidatorLogs] = None,
         **kwargs,
     ) -> ValidationResult:
-        result = await self.execute_validator(
+        coroutine = self.execute_validator(
             validator,
             value,
             metadata,
@@ -71,6 +86,18 @@ class AsyncValidatorService(ValidatorServiceBase):
             validation_session_id=validation_session_id,
             **kwargs,
         )
+        timeout = self._timeouts.timeout_for(validator)
+        if timeout is None:
+            result = await coroutine
+        else:
+            # NOTE: Synchronous validators keep running in their executor thread
+            #   after timing out; only the wait for their result is abandoned.
+            try:
+                result = await asyncio.wait_for(coroutine, timeout)
+            except asyncio.TimeoutError:
+                result = self.timeout_validator_run(
+                    validator, value, timeout, validator_logs
+                )
 
         if result is None:
             result = PassResult()
@@ -90,14 +117,19 @@ class AsyncValidatorService(ValidatorServiceBase):
             iteration, validator, value, absolute_property_path
         )
 
-        result = await self.run_validator_async(
-            validator,
-            value,
-            metadata,
-            stream,
-            validation_session_id=iteration.id,
-            **kwargs,
-        )
+        try:
+            result = await self.run_validator_async(
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=iteration.id,
+                validator_logs=validator_logs,
+                **kwargs,
+            )
+        except asyncio.CancelledError:
+            self.cancel_validator_run(validator_logs)
+            raise
 
         validator_logs = self.after_run_validator(validator, validator_logs, result)
 
@@ -149,8 +181,9 @@ class AsyncValidatorService(ValidatorServiceBase):
         **kwargs,
     ):
         validators = validator_map.get(reference_property_path, [])
+        if not validators:
+            return value, metadata
         coroutines: List[Coroutine[Any, Any, ValidatorRun]] = []
-        validators_logs: List[ValidatorLogs] = []
         for validator in validators:
             coroutines.append(
                 self.run_validator(
@@ -164,43 +197,47 @@ class AsyncValidatorService(ValidatorServiceBase):
                 )
             )
 
-        results = await asyncio.gather(*coroutines)
-        reasks: List[FieldReAsk] = []
-        for res in results:
-            validators_logs.append(res.validator_logs)
-            # QUESTION: Do we still want to do this here or handle it during the merge?
-            # return early if we have a filter, refrain, or reask
-            if isinstance(res.value, (Filter, Refrain)):
-                return res.value, metadata
-            elif isinstance(res.value, FieldReAsk):
-                reasks.append(res.value)
-
-        # handle reasks
-        if len(reasks) > 0:
-            first_reask = reasks[0]
-            fail_results = []
-            for reask in reasks:
-                fail_results.extend(reask.fail_results)
-            first_reask.fail_results = fail_results
-            return first_reask, metadata
-
-        # merge the results
-        fix_values = [
-            res.value
-            for res in results
-            if (
-                isinstance(res.validator_logs.validation_result, FailResult)
-                and (
-                    res.on_fail_action == OnFailAction.FIX
-                    or res.on_fail_action == OnFailAction.FIX_REASK
-                    or res.on_fail_action == OnFailAction.CUSTOM
+        results = await self.gather(
+            coroutines,
+            is_terminal=lambda res: isinstance(res.value, (Filter, Refrain)),
+        )
+        return self.merge_validator_runs(value, metadata, results)
+
+    async def gather(
+        self,
+        coroutines: List[Coroutine[Any, Any, T]],
+        *,
+        is_terminal: Callable[[T], bool],
+    ) -> List[T]:
+        """Run the coroutines concurrently and get their results in order.
+
+        When short-circuiting, the first coroutine to raise or to return
+        a terminal result cancels the ones still pending, and only the
+        results of those that finished are returned.
+        """
+        if not self._short_circuit:
+            return await asyncio.gather(*coroutines)
+
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-            )
-        ]
-        if len(fix_values) > 0:
-            value = self.merge_results(value, fix_values)
+                for task in done:
+                    exception = task.exception()
+                    if exception is not None:
+                        raise exception
+                if any(is_terminal(task.result()) for task in done):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let the cancelled validators record their cancellation.
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        return value, metadata
+        return [task.result() for task in tasks if not task.cancelled()]
 
     async def validate_children(
         self,
@@ -235,16 +272,29 @@ class AsyncValidatorService(ValidatorServiceBase):
             )
             return child_key, new_child_value, new_metadata
 
+        # Only descend into the parts of the value that have validators.
+        subtree = self.get_path_trie(validator_map).find(ref_parent_path)
+        if subtree is None or not subtree.children:
+            return value, metadata
+
         coroutines = []
         if isinstance(value, List):
+            validate_items = subtree.has_item_validators
             for index, child in enumerate(value):
+                if not validate_items and not isinstance(child, (List, Dict)):
+                    continue
                 coroutines.append(validate_child(child, index=index))
         elif isinstance(value, Dict):
             for key in value:
+                if subtree.find(str(key)) is None:
+                    continue
                 child = value.get(key)
                 coroutines.append(validate_child(child, key=key))
 
-        results = await asyncio.gather(*coroutines)
+        # A refrain anywhere in the value refrains the whole output.
+        results = await self.gather(
+            coroutines, is_terminal=lambda res: isinstance(res[1], Refrain)
+        )
 
         for key, child_value, child_metadata in results:
             value[key] = child_value
@@ -1,4 +1,10 @@
 import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
 
 from guardrails.actions.filter import Filter
@@ -10,6 +16,7 @@ from guardrails.classes.validation.validation_result import (
     StreamValidationResult,
     ValidationResult,
 )
+from guardrails.settings import settings
 from guardrails.types import ValidatorMap, OnFailAction
 from guardrails.utils.exception_utils import UserFacingException
 from guardrails.classes.validation.validator_logs import ValidatorLogs
@@ -18,7 +25,92 @@ from guardrails.validator_base import Validator
 from guardrails.validator_service.validator_service_base import ValidatorServiceBase
 
 
+# A validator, its logs, and its result once it has run.
+PendingValidatorRun = Tuple[
+    Validator, ValidatorLogs, "Future[Optional[ValidationResult]]"
+]
+
+# The on fail actions that leave a chunk unchanged for the validators after.
+CHUNK_PRESERVING_ACTIONS = (OnFailAction.NOOP, OnFailAction.EXCEPTION)
+
+
+def get_thread_pool_size() -> Optional[int]:
+    if settings.thread_pool_size is not None:
+        return settings.thread_pool_size
+    pool_size = os.environ.get("GUARDRAILS_THREAD_POOL_SIZE")
+    return int(pool_size) if pool_size else None
+
+
 class SequentialValidatorService(ValidatorServiceBase):
+    # Shared by this service and its subclasses, and sized on first use.
+    _executor: Optional[ThreadPoolExecutor] = None
+    # Shared like `_executor`, and only created once a validator is run
+    #   with a timeout.
+    _timeout_executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def get_executor() -> ThreadPoolExecutor:
+        # Assigned on SequentialValidatorService rather than cls,
+        #   so that a subclass does not create a pool of its own.
+        with SequentialValidatorService._executor_lock:
+            if SequentialValidatorService._executor is None:
+                SequentialValidatorService._executor = ThreadPoolExecutor(
+                    max_workers=get_thread_pool_size(),
+                    thread_name_prefix="guardrails-validation",
+                )
+            return SequentialValidatorService._executor
+
+    @staticmethod
+    def get_timeout_executor() -> ThreadPoolExecutor:
+        with SequentialValidatorService._executor_lock:
+            if SequentialValidatorService._timeout_executor is None:
+                SequentialValidatorService._timeout_executor = ThreadPoolExecutor(
+                    max_workers=get_thread_pool_size(),
+                    thread_name_prefix="guardrails-validator",
+                )
+            return SequentialValidatorService._timeout_executor
+
+    def execute_validator_with_timeout(
+        self,
+        timeout: float,
+        validator: Validator,
+        value: Any,
+        metadata: Dict,
+        stream: Optional[bool] = False,
+        *,
+        validation_session_id: str,
+        **kwargs,
+    ) -> Optional[ValidationResult]:
+        """Run a validator in a worker thread, raising a TimeoutError if it
+        does not finish within `timeout` seconds.
+
+        Python threads cannot be interrupted, so a validator that times
+        out while running keeps running in the background; only the wait
+        for its result is abandoned. One that times out while still queued
+        behind others is cancelled and never runs.
+        """
+        if timeout <= 0:
+            raise FutureTimeoutError()
+        context = contextvars.copy_context()
+        future = self.get_timeout_executor().submit(
+            context.run,
+            functools.partial(
+                self.execute_validator,
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=validation_session_id,
+                **kwargs,
+            ),
+        )
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
     def run_validator_sync(
         self,
         validator: Validator,
@@ -30,14 +122,31 @@ class SequentialValidatorService(ValidatorServiceBase):
         validation_session_id: str,
         **kwargs,
     ) -> Optional[ValidationResult]:
-        result = self.execute_validator(
-            validator,
-            value,
-            metadata,
-            stream,
-            validation_session_id=validation_session_id,
-            **kwargs,
-        )
+        timeout = self._timeouts.timeout_for(validator)
+        if timeout is None:
+            result = self.execute_validator(
+                validator,
+                value,
+                metadata,
+                stream,
+                validation_session_id=validation_session_id,
+                **kwargs,
+            )
+        else:
+            try:
+                result = self.execute_validator_with_timeout(
+                    timeout,
+                    validator,
+                    value,
+                    metadata,
+                    stream,
+                    validation_session_id=validation_session_id,
+                    **kwargs,
+                )
+            except FutureTimeoutError:
+                return self.timeout_validator_run(
+                    validator, value, timeout, validator_logs
+                )
         if asyncio.iscoroutine(result):
             raise UserFacingException(
                 ValueError(
@@ -75,6 +184,66 @@ class SequentialValidatorService(ValidatorServiceBase):
 
         return self.after_run_validator(validator, validator_logs, result)
 
+    def start_validator_runs(
+        self,
+        iteration: Iteration,
+        validators: List[Validator],
+        value: Any,
+        metadata: Dict,
+        property_path: str,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> List[PendingValidatorRun]:
+        """Start running each validator on the same value concurrently.
+
+        The logs are created in the order of the validators, and each run
+        is finished in that same order by `finish_validator_run`.
+        """
+        executor = self.get_executor()
+        pending_runs: List[PendingValidatorRun] = []
+        for validator in validators:
+            validator_logs = self.before_run_validator(
+                iteration, validator, value, property_path
+            )
+            future = executor.submit(
+                contextvars.copy_context().run,
+                functools.partial(
+                    self.run_validator_sync,
+                    validator,
+                    value,
+                    metadata,
+                    validator_logs,
+                    stream,
+                    validation_session_id=iteration.id,
+                    **kwargs,
+                ),
+            )
+            pending_runs.append((validator, validator_logs, future))
+        return pending_runs
+
+    def finish_validator_run(self, pending_run: PendingValidatorRun) -> ValidatorLogs:
+        """Wait for a run started by `start_validator_runs` and log its
+        result."""
+        validator, validator_logs, future = pending_run
+        return self.after_run_validator(validator, validator_logs, future.result())
+
+    def discard_validator_runs(self, pending_runs: List[PendingValidatorRun]):
+        """Cancel the runs whose results were not used, e.g. because an
+        earlier validator raised or refrained."""
+        for _, validator_logs, future in pending_runs:
+            if validator_logs.end_time is None:
+                future.cancel()
+                self.cancel_validator_run(validator_logs)
+
+    def can_run_concurrently(self, validators: List[Validator]) -> bool:
+        """Whether the validators can be run on a chunk concurrently without
+        changing what each of them sees."""
+        return len(validators) > 1 and all(
+            validator.on_fail_descriptor in CHUNK_PRESERVING_ACTIONS
+            and not validator.override_value_on_pass
+            for validator in validators
+        )
+
     def run_validators_stream(
         self,
         iteration: Iteration,
@@ -132,14 +301,12 @@ class SequentialValidatorService(ValidatorServiceBase):
             fixed_values = []
             last_chunk = chunk
             last_chunk_missing_validators = []
-            if refrain_triggered:
-                break
-            for validator in validators:
-                # reset chunk to original text
-                chunk = original_text
-                validator_logs = self.run_validator(
+            # Every validator is given the original chunk,
+            #   so they are independent of each other.
+            pending_runs = (
+                self.start_validator_runs(
                     iteration,
-                    validator,
+                    validators,
                     chunk,
                     metadata,
                     absolute_property_path,
@@ -147,45 +314,77 @@ class SequentialValidatorService(ValidatorServiceBase):
                     remainder=finished,
                     **kwargs,
                 )
-                result = validator_logs.validation_result
-                if result is None:
-                    last_chunk_missing_validators.append(validator)
-                result = cast(ValidationResult, result)
-                # if we have a concrete result, log it in the validation map
-                if isinstance(result, FailResult):
-                    is_filter = validator.on_fail_descriptor is OnFailAction.FILTER
-                    is_refrain = validator.on_fail_descriptor is OnFailAction.REFRAIN
-                    if is_filter or is_refrain:
-                        refrain_triggered = True
-                        break
-                    rechecked_value = None
-                    chunk = self.perform_correction(
-                        result,
-                        chunk,
-                        validator,
-                        rechecked_value=rechecked_value,
-                    )
-                    fixed_values.append(chunk)
-                    validator_partial_acc[id(validator)] += chunk  # type: ignore
-                elif isinstance(result, PassResult):
-                    if (
-                        validator.override_value_on_pass
-                        and result.value_override is not result.ValueOverrideSentinel
-                    ):
-                        chunk = result.value_override
+                if len(validators) > 1
+                else None
+            )
+            try:
+                for index, validator in enumerate(validators):
+                    # reset chunk to original text
+                    chunk = original_text
+                    if pending_runs is not None:
+                        validator_logs = self.finish_validator_run(pending_runs[index])
                     else:
-                        chunk = result.validated_chunk
-                    fixed_values.append(chunk)
-                    validator_partial_acc[id(validator)] += chunk  # type: ignore
-                validator_logs.value_after_validation = chunk
-                if result and result.metadata is not None:
-                    metadata = result.metadata
+                        validator_logs = self.run_validator(
+                            iteration,
+                            validator,
+                            chunk,
+                            metadata,
+                            absolute_property_path,
+                            True,
+                            remainder=finished,
+                            **kwargs,
+                        )
+                    result = validator_logs.validation_result
+                    if result is None:
+                        last_chunk_missing_validators.append(validator)
+                    result = cast(ValidationResult, result)
+                    # if we have a concrete result, log it in the validation map
+                    if isinstance(result, FailResult):
+                        is_filter = validator.on_fail_descriptor is OnFailAction.FILTER
+                        is_refrain = (
+                            validator.on_fail_descriptor is OnFailAction.REFRAIN
+                        )
+                        if is_filter or is_refrain:
+                            refrain_triggered = True
+                            break
+                        rechecked_value = None
+                        chunk = self.perform_correction(
+                            result,
+                            chunk,
+                            validator,
+                            rechecked_value=rechecked_value,
+                        )
+                        fixed_values.append(chunk)
+                        validator_partial_acc[id(validator)] += chunk  # type: ignore
+                    elif isinstance(result, PassResult):
+                        if (
+                            validator.override_value_on_pass
+                            and result.value_override
+                            is not result.ValueOverrideSentinel
+                        ):
+                            chunk = result.value_override
+                        else:
+                            chunk = result.validated_chunk
+                        fixed_values.append(chunk)
+                        validator_partial_acc[id(validator)] += chunk  # type: ignore
+                    validator_logs.value_after_validation = chunk
+                    if result and result.metadata is not None:
+                        metadata = result.metadata
+            finally:
+                if pending_runs is not None:
+                    self.discard_validator_runs(pending_runs)
 
             if refrain_triggered:
+                # Nothing after a refrain is ever emitted, so stop the
+                #   upstream stream before handing back the final result.
+                close = getattr(value_stream, "close", None)
+                if callable(close):
+                    close()
                 # if we have a failresult from a refrain/filter validator, yield empty
                 yield StreamValidationResult(
                     chunk="", original_text=acc_output, metadata=metadata
                 )
+                break
             else:
                 # if every validator has yielded a concrete value, merge and yield
                 # only merge and yield if all validators have run
@@ -209,7 +408,7 @@ class SequentialValidatorService(ValidatorServiceBase):
         # handle case where LLM doesn't yield finished flag
         # we need to validate remainder of accumulated chunks
         if not last_chunk_validated and not refrain_triggered:
-            original_text = last_chunk
+            original_text = acc_output
             for validator in last_chunk_missing_validators:
                 last_log = self.run_validator(
                     iteration,
@@ -272,42 +471,76 @@ class SequentialValidatorService(ValidatorServiceBase):
         # When we have at least one non-None value?
         # When we have all non-None values?
         # Does this depend on whether we are fix or not?
+        run_concurrently = self.can_run_concurrently(validators)
         for chunk, finished in value_stream:
             original_text = chunk
-            for validator in validators:
-                validator_logs = self.run_validator(
+            pending_runs = (
+                self.start_validator_runs(
                     iteration,
-                    validator,
+                    validators,
                     chunk,
                     metadata,
                     absolute_property_path,
                     True,
                     **kwargs,
                 )
-                result = validator_logs.validation_result
-                result = cast(ValidationResult, result)
+                if run_concurrently
+                else None
+            )
+            try:
+                for index, validator in enumerate(validators):
+                    if pending_runs is not None:
+                        validator_logs = self.finish_validator_run(pending_runs[index])
+                    else:
+                        validator_logs = self.run_validator(
+                            iteration,
+                            validator,
+                            chunk,
+                            metadata,
+                            absolute_property_path,
+                            True,
+                            **kwargs,
+                        )
+                    result = validator_logs.validation_result
+                    result = cast(ValidationResult, result)
 
-                if isinstance(result, FailResult):
-                    rechecked_value = None
-                    chunk = self.perform_correction(
-                        result,
-                        chunk,
-                        validator,
-                        rechecked_value=rechecked_value,
-                    )
-                elif isinstance(result, PassResult):
-                    if (
-                        validator.override_value_on_pass
-                        and result.value_override is not result.ValueOverrideSentinel
-                    ):
-                        chunk = result.value_override
+                    if isinstance(result, FailResult):
+                        rechecked_value = None
+                        chunk = self.perform_correction(
+                            result,
+                            chunk,
+                            validator,
+                            rechecked_value=rechecked_value,
+                        )
+                    elif isinstance(result, PassResult):
+                        if (
+                            validator.override_value_on_pass
+                            and result.value_override
+                            is not result.ValueOverrideSentinel
+                        ):
+                            chunk = result.value_override
 
-                validator_logs.value_after_validation = chunk
-                if result and result.metadata is not None:
-                    metadata = result.metadata
-                # # TODO: Filter is no longer terminal, so we shouldn't yield, right?
-                # if isinstance(chunk, (Refrain, Filter, ReAsk)):
-                #     yield chunk, metadata
+                    validator_logs.value_after_validation = chunk
+                    if result and result.metadata is not None:
+                        metadata = result.metadata
+                    if isinstance(chunk, Refrain):
+                        break
+                    # # TODO: Filter is no longer terminal, so we shouldn't yield?
+                    # if isinstance(chunk, (Refrain, Filter, ReAsk)):
+                    #     yield chunk, metadata
+            finally:
+                if pending_runs is not None:
+                    self.discard_validator_runs(pending_runs)
+            if isinstance(chunk, Refrain):
+                # Nothing after a refrain is ever emitted, so stop the
+                #   upstream stream before handing back the final result.
+                close = getattr(value_stream, "close", None)
+                if callable(close):
+                    close()
+                yield StreamValidationResult(
+                    chunk="", original_text=original_text, metadata=metadata
+                )
+                break
             yield StreamValidationResult(
                 chunk=chunk, original_text=original_text, metadata=metadata
             )
@@ -325,7 +558,7 @@ class SequentialValidatorService(ValidatorServiceBase):
     ) -> Tuple[Any, Dict[str, Any]]:
         # Validate the field
         validators = validator_map.get(reference_property_path, [])
-        for validator in validators:
+        for index, validator in enumerate(validators):
             if stream:
                 if validator.on_fail_descriptor is OnFailAction.REASK:
                     raise ValueError(
@@ -396,6 +629,16 @@ class SequentialValidatorService(ValidatorServiceBase):
                 metadata = result.metadata
 
             if isinstance(value, (Refrain, Filter, ReAsk)):
+                if self._short_circuit:
+                    for skipped in validators[index + 1 :]:
+                        self.cancel_validator_run(
+                            self.before_run_validator(
+                                iteration,
+                                skipped,
+                                validator_logs.value_before_validation,
+                                absolute_property_path,
+                            )
+                        )
                 return value, metadata
         return value, metadata
 
@@ -426,9 +669,16 @@ class SequentialValidatorService(ValidatorServiceBase):
         ###
 
         child_ref_path = reference_path.replace(".*", "")
-        # Validate children first
-        if isinstance(value, List):
+        subtree = self.get_path_trie(validator_map).find(child_ref_path)
+        # Validate children first,
+        #   only descending into the parts of the value that have validators.
+        if subtree is None or not subtree.children:
+            pass
+        elif isinstance(value, List):
+            validate_items = subtree.has_item_validators
             for index, child in enumerate(value):
+                if not validate_items and not isinstance(child, (List, Dict)):
+                    continue
                 abs_child_path = f"{absolute_path}.{index}"
                 ref_child_path = f"{child_ref_path}.*"
                 child_value, metadata = self.validate(
@@ -440,8 +690,13 @@ class SequentialValidatorService(ValidatorServiceBase):
                     ref_child_path,
                 )
                 value[index] = child_value
+                # A refrain anywhere in the value refrains the whole output.
+                if self._short_circuit and isinstance(child_value, Refrain):
+                    break
         elif isinstance(value, Dict):
             for key in value:
+                if subtree.find(str(key)) is None:
+                    continue
                 child = value.get(key)
                 abs_child_path = f"{absolute_path}.{key}"
                 ref_child_path = f"{child_ref_path}.{key}"
@@ -454,6 +709,8 @@ class SequentialValidatorService(ValidatorServiceBase):
                     ref_child_path,
                 )
                 value[key] = child_value
+                if self._short_circuit and isinstance(child_value, Refrain):
+                    break
 
         # Then validate the parent value
         value, metadata = self.run_validators(
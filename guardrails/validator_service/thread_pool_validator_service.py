@@ -0,0 +1,267 @@
+import contextvars
+import functools
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from guardrails.actions.filter import Filter
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.history import Iteration
+from guardrails.classes.validation.validation_result import (
+    FailResult,
+    PassResult,
+)
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.types import OnFailAction, ValidatorMap
+from guardrails.validator_base import Validator
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+from guardrails.validator_service.validator_service_base import ValidatorRun
+
+
+@dataclass
+class ValidationNode:
+    """A value in the validated output that has validators applied to it,
+    along with where to write its validated value back to."""
+
+    value: Any
+    absolute_path: str
+    reference_path: str
+    parent: Optional[Union[List, Dict]] = None
+    key: Optional[Union[str, int]] = None
+    runs: List[Tuple[ValidatorLogs, "Future[ValidatorRun]"]] = field(
+        default_factory=list
+    )
+
+
+class ThreadPoolValidatorService(SequentialValidatorService):
+    """Runs validators concurrently on a dedicated thread pool without
+    an event loop, so synchronous Guards get parallel validation even
+    when called from inside a running event loop.
+
+    The output is validated from its deepest values up: every value at
+    the same depth is independent of the others, so all of their
+    validators are run at once, and a value's validators only run once
+    its children have been validated. Only validator runs are submitted
+    to the pool; the calling thread coordinates them, so a saturated
+    pool cannot deadlock.
+    """
+
+    def run_validator_in_thread(
+        self,
+        validator: Validator,
+        validator_logs: ValidatorLogs,
+        value: Any,
+        metadata: Dict,
+        *,
+        validation_session_id: str,
+        **kwargs,
+    ) -> ValidatorRun:
+        result = self.run_validator_sync(
+            validator,
+            value,
+            metadata,
+            validator_logs,
+            validation_session_id=validation_session_id,
+            **kwargs,
+        )
+        if result is None:
+            result = PassResult()
+        validator_logs = self.after_run_validator(validator, validator_logs, result)
+
+        if isinstance(result, FailResult):
+            rechecked_value = None
+            if validator.on_fail_descriptor == OnFailAction.FIX_REASK:
+                rechecked_value = self.run_validator_sync(
+                    validator,
+                    result.fix_value,
+                    result.metadata or {},
+                    validator_logs,
+                    validation_session_id=validation_session_id,
+                    **kwargs,
+                )
+            value = self.perform_correction(
+                result,
+                value,
+                validator,
+                rechecked_value=rechecked_value,
+            )
+        elif (
+            isinstance(result, PassResult)
+            and result.value_override is not PassResult.ValueOverrideSentinel
+        ):
+            value = result.value_override
+
+        validator_logs.value_after_validation = value
+
+        return ValidatorRun(
+            value=value,
+            metadata=result.metadata or metadata,
+            on_fail_action=validator.on_fail_descriptor,
+            validator_logs=validator_logs,
+        )
+
+    def collect_nodes(
+        self,
+        value: Any,
+        validator_map: ValidatorMap,
+        absolute_path: str,
+        reference_path: str,
+    ) -> List[List[ValidationNode]]:
+        """Get the values with validators applied to them, grouped by depth.
+
+        The root value is always included so its validated value can be
+        returned.
+        """
+        path_trie = self.get_path_trie(validator_map)
+        levels: List[List[ValidationNode]] = []
+
+        def visit(node: ValidationNode, depth: int):
+            child_ref_path = node.reference_path.replace(".*", "")
+            subtree = path_trie.find(child_ref_path)
+            if subtree is not None and subtree.children:
+                if isinstance(node.value, List):
+                    validate_items = subtree.has_item_validators
+                    for index, child in enumerate(node.value):
+                        if not validate_items and not isinstance(child, (List, Dict)):
+                            continue
+                        visit(
+                            ValidationNode(
+                                child,
+                                f"{node.absolute_path}.{index}",
+                                f"{child_ref_path}.*",
+                                parent=node.value,
+                                key=index,
+                            ),
+                            depth + 1,
+                        )
+                elif isinstance(node.value, Dict):
+                    for key, child in node.value.items():
+                        if subtree.find(str(key)) is None:
+                            continue
+                        visit(
+                            ValidationNode(
+                                child,
+                                f"{node.absolute_path}.{key}",
+                                f"{child_ref_path}.{key}",
+                                parent=node.value,
+                                key=key,
+                            ),
+                            depth + 1,
+                        )
+            if depth == 0 or validator_map.get(node.reference_path):
+                while len(levels) <= depth:
+                    levels.append([])
+                levels[depth].append(node)
+
+        visit(ValidationNode(value, absolute_path, reference_path), 0)
+        return levels
+
+    def wait_for_runs(self, futures: List["Future[ValidatorRun]"]) -> None:
+        """Wait for the validator runs to finish, raising the first
+        exception.
+
+        When short-circuiting, the first terminal outcome also stops the
+        wait and the runs that have not started yet are cancelled.
+        """
+        pending = set(futures)
+        return_when = FIRST_COMPLETED if self._short_circuit else FIRST_EXCEPTION
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=return_when)
+                for future in done:
+                    exception = future.exception()
+                    if exception is not None:
+                        raise exception
+                if self._short_circuit and any(
+                    isinstance(future.result().value, (Filter, Refrain))
+                    for future in done
+                ):
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def validate(
+        self,
+        value: Any,
+        metadata: dict,
+        validator_map: ValidatorMap,
+        iteration: Iteration,
+        absolute_path: str,
+        reference_path: str,
+        stream: Optional[bool] = False,
+        **kwargs,
+    ) -> Tuple[Any, dict]:
+        # Stream validators accumulate state across chunks,
+        #   so they are always run in order.
+        if stream:
+            return super().validate(
+                value,
+                metadata,
+                validator_map,
+                iteration,
+                absolute_path,
+                reference_path,
+                stream=stream,
+                **kwargs,
+            )
+
+        executor = self.get_executor()
+        levels = self.collect_nodes(value, validator_map, absolute_path, reference_path)
+        for level in reversed(levels):
+            futures: List["Future[ValidatorRun]"] = []
+            for node in level:
+                for validator in validator_map.get(node.reference_path, []):
+                    validator_logs = self.before_run_validator(
+                        iteration, validator, node.value, node.absolute_path
+                    )
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        functools.partial(
+                            self.run_validator_in_thread,
+                            validator,
+                            validator_logs,
+                            node.value,
+                            metadata,
+                            validation_session_id=iteration.id,
+                            **kwargs,
+                        ),
+                    )
+                    node.runs.append((validator_logs, future))
+                    futures.append(future)
+
+            self.wait_for_runs(futures)
+
+            refrained = False
+            for node in level:
+                results: List[ValidatorRun] = []
+                for validator_logs, future in node.runs:
+                    if future.cancelled():
+                        self.cancel_validator_run(validator_logs)
+                    elif future.done():
+                        results.append(future.result())
+                node_value = node.value
+                if results:
+                    for res in results:
+                        metadata = {**metadata, **res.metadata}
+                    node_value, metadata = self.merge_validator_runs(
+                        node.value, metadata, results
+                    )
+                if node.parent is None:
+                    value = node_value
+                else:
+                    node.parent[node.key] = node_value  # type: ignore
+                refrained = refrained or isinstance(node_value, Refrain)
+
+            # A refrain anywhere in the value refrains the whole output.
+            if self._short_circuit and refrained:
+                break
+
+        return value, metadata
@@ -0,0 +1,45 @@
+from typing import Dict, Optional
+
+from guardrails.types import ValidatorMap
+
+
+class ValidatorPathTrie:
+    """A ValidatorMap compiled into a trie of its reference path segments.
+
+    Each node represents a reference path prefix, split on ".", that at
+    least one validator is registered at or below. The validator
+    services use it to skip descending into the parts of a value that
+    have no validators applied to them.
+    """
+
+    __slots__ = ("children",)
+
+    def __init__(self):
+        self.children: Dict[str, ValidatorPathTrie] = {}
+
+    @classmethod
+    def from_validator_map(cls, validator_map: ValidatorMap) -> "ValidatorPathTrie":
+        root = cls()
+        for path, validators in validator_map.items():
+            if not validators:
+                continue
+            node = root
+            for segment in path.split("."):
+                node = node.children.setdefault(segment, cls())
+        return root
+
+    def find(self, path: str) -> Optional["ValidatorPathTrie"]:
+        """Get the node for a reference path relative to this one, or None
+        if nothing is validated at or below it."""
+        node = self
+        for segment in path.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    @property
+    def has_item_validators(self) -> bool:
+        """Whether validators are applied to the items of a list at this
+        path."""
+        return "*" in self.children
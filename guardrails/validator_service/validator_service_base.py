@@ -1,24 +1,30 @@
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Awaitable, Dict, Optional, Union
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union
 
 from guardrails.actions.filter import Filter
 from guardrails.actions.refrain import Refrain
+from guardrails.classes.execution.validation_timeouts import (
+    ValidationTimeouts,
+    use_timeouts,
+)
 from guardrails.classes.history import Iteration
 from guardrails.classes.validation.validation_result import (
     FailResult,
+    PassResult,
     ValidationResult,
 )
-from guardrails.errors import ValidationError
+from guardrails.errors import ValidationError, ValidatorTimeoutError
 from guardrails.merge import merge
 from guardrails.hub_telemetry.hub_tracing import trace
-from guardrails.types import OnFailAction
+from guardrails.types import OnFailAction, OnTimeoutAction, ValidatorMap
 from guardrails.classes.validation.validator_logs import ValidatorLogs
 from guardrails.actions.reask import FieldReAsk
 from guardrails.telemetry import trace_validator
 from guardrails.utils.serialization_utils import deserialize, serialize
 from guardrails.validator_base import Validator
+from guardrails.validator_service.validator_path_trie import ValidatorPathTrie
 
 ValidatorResult = Optional[Union[ValidationResult, Awaitable[ValidationResult]]]
 
@@ -34,8 +40,18 @@ class ValidatorRun:
 class ValidatorServiceBase:
     """Base class for validator services."""
 
-    def __init__(self, disable_tracer: Optional[bool] = True):
+    def __init__(
+        self,
+        disable_tracer: Optional[bool] = True,
+        short_circuit: bool = False,
+        timeouts: Optional[ValidationTimeouts] = None,
+    ):
         self._disable_tracer = disable_tracer
+        # Whether to stop validating a value on the first terminal outcome
+        #   instead of running every validator and collecting all failures.
+        self._short_circuit = short_circuit
+        self._timeouts = timeouts or ValidationTimeouts()
+        self._path_trie: Optional[Tuple[ValidatorMap, ValidatorPathTrie]] = None
 
     # NOTE: This is avoiding an issue with multiprocessing.
     #       If we wrap the validate methods at the class level or anytime before
@@ -64,10 +80,11 @@ class ValidatorServiceBase:
             validation_session_id=validation_session_id,
             **validator._kwargs,
         )(validate_func)
-        if stream:
-            result = traced_validator(value, metadata, **kwargs)
-        else:
-            result = traced_validator(value, metadata)
+        with use_timeouts(self._timeouts):
+            if stream:
+                result = traced_validator(value, metadata, **kwargs)
+            else:
+                result = traced_validator(value, metadata)
         return result
 
     def perform_correction(
@@ -119,6 +136,16 @@ class ValidatorServiceBase:
                 f"expected 'fix' or 'exception'."
             )
 
+    def get_path_trie(self, validator_map: ValidatorMap) -> ValidatorPathTrie:
+        """Get the path trie for a validator map, compiling it once per map
+        for the lifetime of this service."""
+        if self._path_trie is None or self._path_trie[0] is not validator_map:
+            self._path_trie = (
+                validator_map,
+                ValidatorPathTrie.from_validator_map(validator_map),
+            )
+        return self._path_trie[1]
+
     def before_run_validator(
         self,
         iteration: Iteration,
@@ -136,10 +163,11 @@ class ValidatorServiceBase:
             #   this will have to change.
             instance_id=id(validator),
         )
-        iteration.outputs.validator_logs.append(validator_logs)
-
+        # Start the log before it is appended, so the log aggregates never
+        #   mistake it for one that finished without a result.
         start_time = datetime.now()
         validator_logs.start_time = start_time
+        iteration.outputs.validator_logs.append(validator_logs)
 
         return validator_logs
 
@@ -155,6 +183,36 @@ class ValidatorServiceBase:
 
         return validator_logs
 
+    def cancel_validator_run(self, validator_logs: ValidatorLogs) -> ValidatorLogs:
+        validator_logs.cancelled = True
+        validator_logs.end_time = datetime.now()
+
+        return validator_logs
+
+    def timeout_validator_run(
+        self,
+        validator: Validator,
+        value: Any,
+        timeout: float,
+        validator_logs: Optional[ValidatorLogs] = None,
+    ) -> ValidationResult:
+        """Get the result of a validator that did not finish in time
+        according to its on timeout action, or raise a
+        ValidatorTimeoutError."""
+        if validator_logs is not None:
+            validator_logs.timed_out = True
+        error_message = (
+            f"Validator {validator.rail_alias} timed out after {timeout:g} seconds."
+        )
+        on_timeout = self._timeouts.on_timeout_for(validator)
+        if on_timeout == OnTimeoutAction.PASS:
+            return PassResult(validated_chunk=value)
+        if on_timeout == OnTimeoutAction.FAIL:
+            return FailResult(error_message=error_message, validated_chunk=value)
+        if validator_logs is not None:
+            validator_logs.end_time = datetime.now()
+        raise ValidatorTimeoutError(error_message)
+
     def run_validator(
         self,
         iteration: Iteration,
@@ -167,6 +225,47 @@ class ValidatorServiceBase:
     ) -> ValidatorRun:
         raise NotImplementedError
 
+    def merge_validator_runs(
+        self, value: Any, metadata: Dict, results: List[ValidatorRun]
+    ) -> Tuple[Any, Dict]:
+        """Combine the runs of validators that were applied concurrently to
+        the same value."""
+        reasks: List[FieldReAsk] = []
+        for res in results:
+            # QUESTION: Do we still want to do this here or handle it during the merge?
+            # return early if we have a filter, refrain, or reask
+            if isinstance(res.value, (Filter, Refrain)):
+                return res.value, metadata
+            elif isinstance(res.value, FieldReAsk):
+                reasks.append(res.value)
+
+        # handle reasks
+        if len(reasks) > 0:
+            first_reask = reasks[0]
+            fail_results = []
+            for reask in reasks:
+                fail_results.extend(reask.fail_results)
+            first_reask.fail_results = fail_results
+            return first_reask, metadata
+
+        # merge the results
+        fix_values = [
+            res.value
+            for res in results
+            if (
+                isinstance(res.validator_logs.validation_result, FailResult)
+                and (
+                    res.on_fail_action == OnFailAction.FIX
+                    or res.on_fail_action == OnFailAction.FIX_REASK
+                    or res.on_fail_action == OnFailAction.CUSTOM
+                )
+            )
+        ]
+        if len(fix_values) > 0:
+            value = self.merge_results(value, fix_values)
+
+        return value, metadata
+
     # requires at least 2 validators
     def multi_merge(self, original: str, new_values: list[str]) -> Optional[str]:
         if len(new_values) == 0:
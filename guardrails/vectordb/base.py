@@ -52,6 +52,22 @@ class VectorDBBase(ABC):
         """
         ...
 
+    def similarity_search_vectors(
+        self, vectors: List[List[float]], k: int
+    ) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given
+        vectors.
+
+        Args:
+            vectors: Vectors to search for.
+            k: Number of similar vectors to return per query vector.
+
+        Returns:
+            List[List[int]] List of indexes of the similar vectors, one list
+            per query vector.
+        """
+        return [self.similarity_search_vector(vector, k) for vector in vectors]
+
     def similarity_search(self, text: str, k: int) -> List[int]:
         """Searches for vectors which are similar to the given text.
         Args:
@@ -63,6 +79,24 @@ class VectorDBBase(ABC):
         vector = self._embedder.embed_query(text)
         return self.similarity_search_vector(vector, k)
 
+    def similarity_search_batch(self, texts: List[str], k: int) -> List[List[int]]:
+        """Searches for vectors which are similar to each of the given texts.
+
+        All texts are embedded together and searched in a single call.
+
+        Args:
+            texts: Texts to search for.
+            k: Number of similar vectors to return per text.
+
+        Returns:
+            List[List[int]] List of indexes of the similar vectors, one list
+            per text.
+        """
+        if not texts:
+            return []
+        vectors = self._embedder.embed_queries(texts)
+        return self.similarity_search_vectors(vectors, k)
+
     def similarity_search_with_threshold(
         self, text: str, k: int, threshold: float
     ) -> List[int]:
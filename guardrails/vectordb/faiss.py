@@ -79,6 +79,14 @@ class Faiss(VectorDBBase):
         _, scores = self._index.search(np.array([vector]), k)  # type: ignore
         return scores[0].tolist()
 
+    def similarity_search_vectors(
+        self, vectors: List[List[float]], k: int
+    ) -> List[List[int]]:
+        import numpy as np
+
+        _, scores = self._index.search(np.array(vectors), k)  # type: ignore
+        return scores.tolist()
+
     def similarity_search_vector_with_threshold(
         self, vector: List[float], k: int, threshold: float
     ) -> List[int]:
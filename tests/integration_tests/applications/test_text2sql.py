@@ -44,3 +44,48 @@ def test_text2sql_with_coro():
     s = Text2Sql("sqlite://", llm_api=mock_llm)
     with pytest.raises(ValueError):
         s("")
+
+
+def _mock_embeddings(mocker):
+    mocker.patch(
+        "guardrails.embedding.OpenAIEmbedding.embed",
+        new=lambda self, texts: [[float(i)] * 1536 for i in range(len(texts))],
+    )
+    return mocker.patch(
+        "guardrails.embedding.OpenAIEmbedding._get_embedding",
+        side_effect=lambda texts: [[0.1] * 1536 for _ in texts],
+    )
+
+
+def test_text2sql_caches_examples(mocker):
+    get_embedding = _mock_embeddings(mocker)
+    with open(EXAMPLES_PATH, "r") as f:
+        examples = json.load(f)
+
+    s = Text2Sql("sqlite://", schema_file=SCHEMA_PATH, examples=examples)
+    first = s._get_examples_prompts(["How many departments are there?"])
+    second = s._get_examples_prompts(["  how many   departments are there? "])
+
+    assert first == second
+    assert first[0] != ""
+    get_embedding.assert_called_once_with(["How many departments are there?"])
+
+
+def test_text2sql_batch(mocker):
+    get_embedding = _mock_embeddings(mocker)
+    with open(EXAMPLES_PATH, "r") as f:
+        examples = json.load(f)
+
+    def mock_llm(*args, **kwargs):
+        return '{"generated_sql": "SELECT count(*) FROM department"}'
+
+    s = Text2Sql(
+        "sqlite://", schema_file=SCHEMA_PATH, examples=examples, llm_api=mock_llm
+    )
+    outputs = s.batch(["How many departments are there?", "List all department names."])
+
+    assert outputs == ["SELECT count(*) FROM department"] * 2
+    # Both questions are embedded as asked, in a single request.
+    get_embedding.assert_called_once_with(
+        ["How many departments are there?", "List all department names."]
+    )
@@ -2,17 +2,20 @@ import json
 
 import pytest
 
+from guardrails.actions import reask as reask_module
 from guardrails.classes.execution.guard_execution_options import GuardExecutionOptions
 from guardrails.actions.reask import (
     FieldReAsk,
     gather_reasks,
     get_reask_setup,
     prune_obj_for_reasking,
+    reask_schema_cache,
     sub_reasks_with_fixed_values,
 )
 from guardrails.classes.output_type import OutputTypes
 from guardrails.classes.validation.validation_result import FailResult
 from guardrails.schema.rail_schema import rail_string_to_schema
+from tests.integration_tests.test_assets.validators import TwoWords
 
 
 @pytest.mark.parametrize(
@@ -575,6 +578,77 @@ Here are examples of simple (XML, JSON) pairs that show the expected behavior:
     assert reask_messages.source[0]["content"].source == expected_instructions
 
 
+class TestReaskSchemaCache:
+    output_schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+        "required": ["name", "age"],
+    }
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        reask_schema_cache.clear()
+        yield
+        reask_schema_cache.clear()
+
+    @staticmethod
+    def reask_for(name: str, error_message: str) -> FieldReAsk:
+        return FieldReAsk(
+            incorrect_value=name,
+            fail_results=[FailResult(error_message=error_message)],
+            path=["name"],
+        )
+
+    def get_reask_setup(self, validation_map, reask):
+        return get_reask_setup(
+            OutputTypes.DICT,
+            self.output_schema,
+            validation_map=validation_map,
+            reasks=[reask],
+            parsing_response={"name": reask.incorrect_value, "age": 5},
+            validation_response={"name": reask, "age": 5},
+        )
+
+    def test_schema_is_only_rendered_once(self, mocker):
+        render_xml = mocker.spy(reask_module, "json_schema_to_rail_output")
+        validation_map = {"$.name": [TwoWords()]}
+
+        _, first_messages = self.get_reask_setup(
+            validation_map, self.reask_for("Alice", "Not two words")
+        )
+        _, second_messages = self.get_reask_setup(
+            validation_map, self.reask_for("Bob", "Still not two words")
+        )
+
+        assert render_xml.call_count == 1
+        # The per-call values are still rendered into each prompt.
+        second_prompt = second_messages.source[1]["content"].source
+        assert '"Bob"' in second_prompt
+        assert "Still not two words" in second_prompt
+        assert first_messages.source[1]["content"].source != second_prompt
+
+    def test_cached_setup_matches_rendered_setup(self):
+        validation_map = {"$.name": [TwoWords()]}
+        reask = self.reask_for("Alice", "Not two words")
+
+        rendered_schema, rendered_messages = self.get_reask_setup(validation_map, reask)
+        cached_schema, cached_messages = self.get_reask_setup(validation_map, reask)
+
+        assert cached_schema == rendered_schema
+        assert [m["content"].source for m in cached_messages.source] == [
+            m["content"].source for m in rendered_messages.source
+        ]
+
+    def test_changed_validators_are_rendered(self, mocker):
+        render_xml = mocker.spy(reask_module, "json_schema_to_rail_output")
+        reask = self.reask_for("Alice", "Not two words")
+
+        self.get_reask_setup({"$.name": [TwoWords()]}, reask)
+        self.get_reask_setup({"$.age": [TwoWords()]}, reask)
+
+        assert render_xml.call_count == 2
+
+
 ### FIXME: Implement once Field Level ReAsk is implemented w/ JSON schema ###
 # empty_root = Element("root")
 # non_empty_root = Element("root")
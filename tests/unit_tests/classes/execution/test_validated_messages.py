@@ -0,0 +1,56 @@
+from guardrails.classes.execution.validated_messages import ValidatedMessages
+from guardrails.types import OnFailAction
+from tests.integration_tests.test_assets.validators import TwoWords, ValidLength
+
+
+class TestFingerprint:
+    def test_is_order_independent(self):
+        two_words = TwoWords()
+        valid_length = ValidLength(min=1, max=10)
+
+        assert ValidatedMessages.fingerprint(
+            [two_words, valid_length]
+        ) == ValidatedMessages.fingerprint([valid_length, two_words])
+
+    def test_depends_on_configuration(self):
+        validator = ValidLength(min=1, max=10, on_fail=OnFailAction.FIX)
+        fingerprint = ValidatedMessages.fingerprint([validator])
+
+        assert fingerprint == ValidatedMessages.fingerprint([validator])
+        assert fingerprint != ValidatedMessages.fingerprint(
+            [ValidLength(min=1, max=10, on_fail=OnFailAction.EXCEPTION)]
+        )
+        assert fingerprint != ValidatedMessages.fingerprint([])
+
+
+class TestValidatedMessages:
+    def test_get_recorded_message(self):
+        cache = ValidatedMessages()
+        cache.record("fp", [("user", "Hello there!", "Hello there")], {"a": 1})
+
+        assert cache.get("fp", "user", "Hello there!", {"a": 1}) == "Hello there"
+        assert cache.get("fp", "system", "Hello there!", {"a": 1}) is None
+        assert cache.get("fp", "user", "Hello there", {"a": 1}) is None
+        assert cache.get("other", "user", "Hello there!", {"a": 1}) is None
+        assert cache.get("fp", "user", "Hello there!", {"a": 2}) is None
+
+    def test_least_recently_used_are_evicted(self):
+        cache = ValidatedMessages(maxsize=2)
+        cache.record("fp", [("user", "a", "a"), ("user", "b", "b")], {})
+        assert cache.get("fp", "user", "a", {}) == "a"
+
+        cache.record("fp", [("user", "c", "c")], {})
+
+        assert cache.get("fp", "user", "a", {}) == "a"
+        assert cache.get("fp", "user", "b", {}) is None
+        assert cache.get("fp", "user", "c", {}) == "c"
+
+    def test_incomparable_metadata_misses(self):
+        class Incomparable:
+            def __eq__(self, other):
+                raise ValueError("ambiguous")
+
+        cache = ValidatedMessages()
+        cache.record("fp", [("user", "a", "a")], {"value": Incomparable()})
+
+        assert cache.get("fp", "user", "a", {"value": Incomparable()}) is None
@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from guardrails.classes.generic.deferred_stack import DeferredStack
+from guardrails.classes.generic.stack import Stack
+
+
+def new_stack():
+    fetched = []
+
+    def fetch(key):
+        fetched.append(key)
+        return [f"{key}-1", f"{key}-2"]
+
+    return DeferredStack("a", fetch=fetch), fetched
+
+
+def test_fetches_deferred_items_in_order_on_access():
+    stack, fetched = new_stack()
+    stack.defer("b")
+    stack.defer("c")
+
+    assert stack.loaded() == Stack("a")
+    assert fetched == []
+
+    assert stack.last == "c-2"
+    assert list(stack) == ["a", "b-1", "b-2", "c-1", "c-2"]
+    assert fetched == ["b", "c"]
+
+
+def test_fetches_deferred_items_before_pushing():
+    stack, _ = new_stack()
+    stack.defer("b")
+
+    stack.push("c")
+
+    assert list(stack) == ["a", "b-1", "b-2", "c"]
+
+
+def test_copies_include_deferred_items():
+    stack, fetched = new_stack()
+    stack.defer("b")
+
+    assert copy.deepcopy(stack) == ["a", "b-1", "b-2"]
+    assert pickle.loads(pickle.dumps(stack)) == ["a", "b-1", "b-2"]
+    assert fetched == ["b"]
+
+
+def test_keeps_keys_whose_fetch_failed():
+    fetched = []
+
+    def fetch(key):
+        if key == "c" and "c" not in fetched:
+            fetched.append(key)
+            raise ConnectionError(key)
+        fetched.append(key)
+        return [key]
+
+    stack = DeferredStack("a", fetch=fetch)
+    stack.defer("b")
+    stack.defer("c")
+    stack.defer("d")
+
+    with pytest.raises(ConnectionError):
+        stack.fetch_deferred()
+
+    assert stack.loaded() == Stack("a", "b")
+    assert list(stack) == ["a", "b", "c", "d"]
+    assert fetched == ["b", "c", "c", "d"]
@@ -0,0 +1,278 @@
+from datetime import datetime
+
+from guardrails.actions.filter import Filter
+from guardrails.actions.reask import (
+    FieldReAsk,
+    gather_reasks,
+    sub_reasks_with_fixed_values,
+)
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.history.call import Call
+from guardrails.classes.history.call_inputs import CallInputs
+from guardrails.classes.history.inputs import Inputs
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.history.outputs import Outputs
+from guardrails.classes.validation.validation_result import (
+    ErrorSpan,
+    FailResult,
+    PassResult,
+    ValidationResult,
+)
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.constants import error_status, fail_status, not_run_status, pass_status
+from guardrails.schema.parser import get_value_from_path
+
+
+def make_log(validator_name, result, finished=True):
+    log = ValidatorLogs(
+        registered_name=validator_name,
+        validator_name=validator_name,
+        value_before_validation="chunk",
+        value_after_validation="chunk",
+        validation_result=result,
+        property_path="$",
+        start_time=datetime.now(),
+    )
+    if finished:
+        log.end_time = datetime.now()
+    return log
+
+
+def fail(chunk, *spans):
+    return FailResult(
+        error_message="bad",
+        validated_chunk=chunk,
+        error_spans=[ErrorSpan(start=s, end=e, reason="bad") for s, e in spans],
+    )
+
+
+def expected_failed_validations(logs):
+    return [
+        log
+        for log in logs
+        if isinstance(log.validation_result, ValidationResult)
+        and log.validation_result.outcome == "fail"
+    ]
+
+
+def expected_error_spans(logs):
+    total_len_by_validator = {}
+    spans = []
+    for log in logs:
+        offset = total_len_by_validator.get(log.validator_name, 0)
+        result = log.validation_result
+        if isinstance(result, FailResult) and result.error_spans is not None:
+            for span in result.error_spans:
+                spans.append((span.start + offset, span.end + offset, span.reason))
+        if isinstance(result, ValidationResult) and result.validated_chunk is not None:
+            offset += len(result.validated_chunk)
+        total_len_by_validator[log.validator_name] = offset
+    return spans
+
+
+def spans_of(outputs):
+    return [(s.start, s.end, s.reason) for s in outputs.error_spans_in_output]
+
+
+def test_matches_recomputation_as_logs_are_appended():
+    outputs = Outputs()
+    logs = [
+        make_log("a", PassResult(validated_chunk="Hello ")),
+        make_log("b", fail("Hello ", (0, 2))),
+        make_log("a", fail("world", (1, 3))),
+        make_log("b", PassResult(validated_chunk="world")),
+        make_log("a", fail("!", (0, 1))),
+    ]
+    for log in logs:
+        outputs.validator_logs.append(log)
+        assert outputs.failed_validations == expected_failed_validations(
+            outputs.validator_logs
+        )
+        assert spans_of(outputs) == expected_error_spans(outputs.validator_logs)
+
+    assert spans_of(outputs) == [(0, 2, "bad"), (7, 9, "bad"), (11, 12, "bad")]
+
+
+def test_in_flight_logs_are_picked_up_once_finished():
+    outputs = Outputs()
+    running = make_log("a", None, finished=False)
+    outputs.validator_logs.append(running)
+    outputs.validator_logs.append(make_log("b", fail("Hello", (0, 1))))
+
+    # The finished log after the running one is not held back by it.
+    assert outputs.failed_validations == outputs.validator_logs[1:]
+
+    running.validation_result = fail("Hello", (2, 4))
+    running.end_time = datetime.now()
+    assert outputs.failed_validations == expected_failed_validations(
+        outputs.validator_logs
+    )
+    assert spans_of(outputs) == [(2, 4, "bad"), (0, 1, "bad")]
+
+
+def test_abnormally_ended_logs_are_skipped():
+    outputs = Outputs()
+    # The validator raised, so the log never finished.
+    outputs.validator_logs.append(make_log("a", None, finished=False))
+    outputs.validator_logs.append(make_log("b", fail("Hello", (0, 1))))
+    outputs.validator_logs.append(make_log("a", fail("world", (1, 2))))
+    outputs.validator_logs.append(make_log("b", fail("!", (0, 1))))
+
+    assert outputs.failed_validations == outputs.validator_logs[1:]
+    assert spans_of(outputs) == [(0, 1, "bad"), (1, 2, "bad"), (5, 6, "bad")]
+
+
+def test_replaced_logs_are_reaggregated():
+    outputs = Outputs(validator_logs=[make_log("a", fail("Hello"))])
+    assert len(outputs.failed_validations) == 1
+
+    outputs.validator_logs = [make_log("a", PassResult())]
+    assert outputs.failed_validations == []
+
+
+def test_call_failed_validations_match_validator_logs():
+    call = Call(inputs=CallInputs())
+    for stream in (False, True):
+        iteration = Iteration(call_id=call.id, index=0, inputs=Inputs(stream=stream))
+        iteration.outputs.validator_logs.extend(
+            [
+                make_log("a", fail("Hello")),
+                make_log("a", PassResult(validated_chunk="world")),
+                # Stream validators that have not seen a full chunk yet.
+                make_log("a", fail(None)),
+            ]
+        )
+        call.iterations.push(iteration)
+
+    assert list(call.failed_validations) == expected_failed_validations(
+        call.validator_logs
+    )
+    assert len(call.failed_validations) == 3
+
+
+def expected_status(call):
+    # The status as computed before it was aggregated.
+    if call.iterations.empty():
+        return not_run_status
+    elif call.error:
+        return error_status
+    output = sub_reasks_with_fixed_values(call.validation_response)
+    if gather_reasks(output)[0]:
+        return fail_status
+    for iteration in call.iterations:
+        for failure in iteration.outputs.failed_validations:
+            if (
+                iteration.inputs.stream
+                and not failure.validation_result.validated_chunk
+            ):
+                continue
+            value = get_value_from_path(output, failure.property_path)
+            if (
+                (value is None and failure.value_before_validation is not None)
+                or value == failure.value_before_validation
+                or isinstance(failure.value_after_validation, (Refrain, Filter))
+            ):
+                return fail_status
+    return pass_status
+
+
+def status_of(call):
+    status = call.status
+    assert status == expected_status(call)
+    return status
+
+
+def field_log(path, before, after, result):
+    log = make_log("a", result)
+    log.property_path = path
+    log.value_before_validation = before
+    log.value_after_validation = after
+    return log
+
+
+def test_call_status_matches_recomputation_across_iterations():
+    call = Call(inputs=CallInputs())
+    statuses = [status_of(call)]
+
+    # A failed field is reasked, and fixed by the reask.
+    first = Iteration(call_id=call.id, index=0)
+    call.iterations.push(first)
+    statuses.append(status_of(call))
+    first.outputs.validator_logs.append(
+        field_log(
+            "$.a",
+            "x",
+            FieldReAsk(incorrect_value="x", fail_results=[fail("x")], path=["a"]),
+            fail("x"),
+        )
+    )
+    statuses.append(status_of(call))
+    first.outputs.validation_response = {
+        "a": FieldReAsk(incorrect_value="x", fail_results=[fail("x")], path=["a"]),
+    }
+    statuses.append(status_of(call))
+
+    second = Iteration(call_id=call.id, index=1)
+    call.iterations.push(second)
+    second.outputs.validator_logs.append(field_log("$.a", "z", "z", PassResult()))
+    second.outputs.validation_response = {"a": "z"}
+    statuses.append(status_of(call))
+
+    # A noop failure in a later iteration leaves the call failing.
+    third = Iteration(call_id=call.id, index=2)
+    call.iterations.push(third)
+    third.outputs.validation_response = {"a": "z"}
+    third.outputs.validator_logs.append(field_log("$.a", "z", "z", fail("z")))
+    statuses.append(status_of(call))
+
+    assert call.failed_validations == expected_failed_validations(call.validator_logs)
+    assert statuses == [
+        not_run_status,
+        pass_status,
+        fail_status,
+        fail_status,
+        pass_status,
+        fail_status,
+    ]
+
+
+def test_call_status_matches_recomputation_as_iterations_change():
+    call = Call(inputs=CallInputs())
+    iterations = []
+    for index, stream in enumerate([False, True, False]):
+        iteration = Iteration(
+            call_id=call.id, index=index, inputs=Inputs(stream=stream)
+        )
+        iteration.outputs.validation_response = "Hello"
+        iterations.append(iteration)
+
+    for iteration in iterations:
+        call.iterations.push(iteration)
+        assert call.status == expected_status(call)
+        iteration.outputs.validator_logs.append(field_log("$", "Hi", "Hi", fail(None)))
+        assert call.status == expected_status(call)
+        iteration.outputs.validator_logs.append(
+            field_log("$", "Hello", "Hello", PassResult(validated_chunk="Hello"))
+        )
+        assert call.status == expected_status(call)
+
+    # Earlier iterations and their logs can still change.
+    running = make_log("a", None, finished=False)
+    iterations[0].outputs.validator_logs.append(running)
+    assert call.status == expected_status(call) == pass_status
+    running.validation_result = fail("Hello")
+    running.value_before_validation = "Hello"
+    running.end_time = datetime.now()
+    assert call.status == expected_status(call) == fail_status
+    assert call.failed_validations == [
+        log
+        for i in call.iterations
+        for log in i.outputs.failed_validations
+        if not i.inputs.stream or log.validation_result.validated_chunk
+    ]
+
+    # Replacing the iterations starts over.
+    call.iterations[0:1] = []
+    assert call.status == expected_status(call)
+    call.iterations.last.outputs.error = "boom"
+    assert call.status == expected_status(call) == error_status
@@ -0,0 +1,175 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from guardrails import Guard
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.classes.validation.validator_logs import ValidatorLogs
+from guardrails.classes.validation.validator_stats import (
+    ValidatorOrdering,
+    ValidatorStats,
+)
+from guardrails.errors import ValidationError
+from guardrails.validator_base import Validator, register_validator
+
+
+@register_validator("test/stats-pass", data_type="string")
+class StatsPass(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+
+
+@register_validator("test/stats-fail", data_type="string")
+class StatsFail(Validator):
+    def validate(self, value, metadata):
+        return FailResult(error_message="Always fails.")
+
+
+def make_logs(validator: Validator, *, latency: float, failed: bool) -> ValidatorLogs:
+    start = datetime(2024, 1, 1)
+    return ValidatorLogs(
+        validator_name=validator.__class__.__name__,
+        registered_name=validator.rail_alias,
+        instance_id=id(validator),
+        property_path="$",
+        value_before_validation="Hello",
+        validation_result=(
+            FailResult(error_message="Failed.") if failed else PassResult()
+        ),
+        start_time=start,
+        end_time=start + timedelta(seconds=latency),
+    )
+
+
+def observe(ordering, validator, *, latency, failures, runs=5):
+    ordering.record(
+        make_logs(validator, latency=latency, failed=i < failures) for i in range(runs)
+    )
+
+
+class TestValidatorStats:
+    def test_empty(self):
+        stats = ValidatorStats()
+        assert stats.avg_latency == 0
+        assert stats.fail_rate == 0
+        assert stats.cost == math.inf
+
+    def test_cost(self):
+        stats = ValidatorStats(runs=4, failures=2, total_latency=2.0)
+        assert stats.avg_latency == 0.5
+        assert stats.fail_rate == 0.5
+        assert stats.cost == 1.0
+
+
+class TestValidatorOrdering:
+    def test_record_skips_cancelled_and_incomplete_logs(self):
+        validator = StatsFail()
+        ordering = ValidatorOrdering()
+        cancelled = make_logs(validator, latency=1, failed=True)
+        cancelled.cancelled = True
+        incomplete = make_logs(validator, latency=1, failed=True)
+        incomplete.end_time = None
+
+        ordering.record(
+            [cancelled, incomplete, make_logs(validator, latency=1, failed=True)]
+        )
+
+        stats = ordering.get_stats(validator)
+        assert stats.runs == 1
+        assert stats.failures == 1
+        assert stats.total_latency == 1
+
+    def test_orders_cheap_failing_validators_first(self):
+        slow_rare = StatsPass()
+        fast_common = StatsFail()
+        never_fails = StatsPass()
+        ordering = ValidatorOrdering()
+        observe(ordering, slow_rare, latency=1.0, failures=1)
+        observe(ordering, fast_common, latency=0.1, failures=4)
+        observe(ordering, never_fails, latency=0.01, failures=0)
+        validator_map = {"$": [never_fails, slow_rare, fast_common]}
+
+        ordered = ordering.order(validator_map)
+
+        assert ordered["$"] == [fast_common, slow_rare, never_fails]
+        assert ordering.chosen_order == {"$": [fast_common, slow_rare, never_fails]}
+        # The given map is left untouched.
+        assert validator_map["$"] == [never_fails, slow_rare, fast_common]
+
+    def test_keeps_order_until_enough_samples(self):
+        slow = StatsPass()
+        fast = StatsFail()
+        ordering = ValidatorOrdering(min_samples=5)
+        observe(ordering, slow, latency=1.0, failures=1)
+        observe(ordering, fast, latency=0.1, failures=4, runs=4)
+        validator_map = {"$": [slow, fast]}
+
+        assert ordering.order(validator_map) is validator_map
+
+    def test_keeps_order_with_value_changing_validators(self):
+        slow = StatsPass(on_fail="fix")
+        fast = StatsFail()
+        ordering = ValidatorOrdering()
+        observe(ordering, slow, latency=1.0, failures=1)
+        observe(ordering, fast, latency=0.1, failures=4)
+        validator_map = {"$": [slow, fast]}
+
+        assert ordering.order(validator_map) is validator_map
+        assert ordering.chosen_order == {"$": [slow, fast]}
+
+    def test_drops_stats_of_validators_no_longer_ordered(self):
+        removed = StatsPass()
+        kept = StatsFail()
+        ordering = ValidatorOrdering()
+        observe(ordering, removed, latency=1.0, failures=1)
+        observe(ordering, kept, latency=0.1, failures=4)
+        ordering.order({"$": [removed, kept], "$.a": [removed]})
+
+        ordering.order({"$": [kept]})
+
+        assert ordering.get_stats(removed).runs == 0
+        assert ordering.get_stats(kept).runs == 5
+        assert ordering.chosen_order == {"$": [kept]}
+
+
+class TestGuardValidatorOrdering:
+    def test_reorders_after_observing_calls(self):
+        guard = Guard().use_many(StatsPass(), StatsFail(on_fail="noop"))
+        guard.configure(reorder_validators=True)
+        guard.validator_ordering.min_samples = 2
+
+        for _ in range(2):
+            guard.parse("Hello")
+
+        pass_validator, fail_validator = guard._validators
+        assert guard.validator_ordering.get_stats(fail_validator).fail_rate == 1
+        assert guard.validator_ordering.get_stats(pass_validator).runs == 2
+
+        guard.parse("Hello")
+
+        assert guard.validator_ordering.chosen_order == {
+            "$": [fail_validator, pass_validator]
+        }
+        logs = guard.history.last.validator_logs
+        assert [log.registered_name for log in logs] == [
+            "test/stats-fail",
+            "test/stats-pass",
+        ]
+
+    def test_disabled_by_default(self):
+        guard = Guard().use_many(StatsPass(), StatsFail(on_fail="noop"))
+
+        guard.parse("Hello")
+
+        assert guard.validator_ordering.get_stats(guard._validators[0]).runs == 0
+        assert guard.validator_ordering.chosen_order == {}
+
+    def test_records_failed_calls(self):
+        guard = Guard().use(StatsFail(on_fail="exception"))
+        guard.configure(reorder_validators=True)
+
+        with pytest.raises(ValidationError):
+            guard.parse("Hello")
+
+        assert guard.validator_ordering.get_stats(guard._validators[0]).failures == 1
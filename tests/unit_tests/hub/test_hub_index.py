@@ -0,0 +1,142 @@
+import json
+import sys
+
+import pytest
+
+from guardrails.hub import hub_index as hub_index_module
+from guardrails.hub.hub_index import (
+    HubNamespace,
+    add_to_hub_index,
+    import_hub_validator,
+    load_hub_index,
+    remove_from_hub_index,
+)
+from guardrails.validator_base import validators_registry
+
+validator_package = """
+from guardrails.validator_base import PassResult, Validator, register_validator
+
+
+@register_validator(name="{validator_id}", data_type="string")
+class {export}(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+"""
+
+
+@pytest.fixture
+def install_package(monkeypatch, tmp_path):
+    """Write validator packages to a directory on the path, and index them."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(hub_index_module, "_imported_unindexed_modules", False)
+    index_path = str(tmp_path / "hub_index.json")
+    installed = []
+
+    def install(module_name, validator_id, export, indexed=True):
+        (tmp_path / f"{module_name}.py").write_text(
+            validator_package.format(validator_id=validator_id, export=export)
+        )
+        if indexed:
+            add_to_hub_index(index_path, validator_id, module_name, [export])
+        installed.append((module_name, validator_id))
+        return index_path
+
+    yield install
+
+    for module_name, validator_id in installed:
+        sys.modules.pop(module_name, None)
+        validators_registry.pop(validator_id, None)
+
+
+class TestHubIndex:
+    def test_index_is_read_again_once_changed(self, tmp_path):
+        index_path = str(tmp_path / "hub_index.json")
+        assert load_hub_index(index_path) == {"exports": {}, "validators": {}}
+
+        add_to_hub_index(index_path, "acme/one", "acme_grhub_one", ["One"])
+        assert load_hub_index(index_path)["exports"] == {"One": "acme_grhub_one"}
+
+        add_to_hub_index(index_path, "acme/two", "acme_grhub_two", ["Two"])
+        assert load_hub_index(index_path)["validators"] == {
+            "acme/one": "acme_grhub_one",
+            "acme/two": "acme_grhub_two",
+        }
+
+    def test_removing_a_validator_removes_its_exports(self, tmp_path):
+        index_path = str(tmp_path / "hub_index.json")
+        add_to_hub_index(index_path, "acme/one", "acme_grhub_one", ["One", "Uno"])
+        add_to_hub_index(index_path, "acme/two", "acme_grhub_two", ["Two"])
+
+        assert remove_from_hub_index(index_path, "acme/one") is True
+        assert remove_from_hub_index(index_path, "acme/one") is False
+        assert load_hub_index(index_path) == {
+            "exports": {"Two": "acme_grhub_two"},
+            "validators": {"acme/two": "acme_grhub_two"},
+        }
+
+    def test_unreadable_index_is_empty(self, tmp_path):
+        index_path = tmp_path / "hub_index.json"
+        index_path.write_text("{not json")
+
+        assert load_hub_index(str(index_path)) == {"exports": {}, "validators": {}}
+
+        add_to_hub_index(str(index_path), "acme/one", "acme_grhub_one", ["One"])
+        assert json.loads(index_path.read_text())["exports"] == {
+            "One": "acme_grhub_one"
+        }
+
+
+class TestHubNamespace:
+    def test_only_imports_the_package_of_an_export(self, install_package):
+        install_package("acme_grhub_one", "acme/one", "One")
+        index_path = install_package("acme_grhub_two", "acme/two", "Two")
+        module_globals = {"__name__": "guardrails.hub"}
+        namespace = HubNamespace(module_globals, index_path)
+
+        one = namespace.module_getattr("One")
+
+        assert one.__name__ == "One"
+        assert module_globals["One"] is one
+        assert "acme_grhub_one" in sys.modules
+        assert "acme_grhub_two" not in sys.modules
+        assert {"One", "Two"} <= set(namespace.module_dir())
+        assert namespace.module_getattr("__all__") == ["One", "Two"]
+
+    def test_unknown_names_raise_attribute_errors(self, install_package):
+        index_path = install_package("acme_grhub_one", "acme/one", "One")
+        namespace = HubNamespace({"__name__": "guardrails.hub"}, index_path)
+
+        with pytest.raises(AttributeError):
+            namespace.module_getattr("Missing")
+        with pytest.raises(AttributeError):
+            namespace.module_getattr("__path__")
+        assert "acme_grhub_one" not in sys.modules
+
+    def test_finds_exports_of_unindexed_packages(self, install_package):
+        install_package("acme_grhub_one", "acme/one", "One")
+        index_path = install_package("acme_grhub_old", "acme/old", "Old", False)
+        namespace = HubNamespace({"__name__": "guardrails.hub"}, index_path)
+
+        assert namespace.module_getattr("Old").__name__ == "Old"
+        assert "acme_grhub_one" not in sys.modules
+
+
+class TestImportHubValidator:
+    def test_only_imports_the_package_of_a_validator(self, install_package):
+        install_package("acme_grhub_one", "acme/one", "One")
+        index_path = install_package("acme_grhub_two", "acme/two", "Two")
+
+        import_hub_validator("acme/two", index_path)
+
+        assert "acme/two" in validators_registry
+        assert "acme/one" not in validators_registry
+        assert "acme_grhub_one" not in sys.modules
+
+    def test_imports_every_package_without_an_id(self, install_package):
+        install_package("acme_grhub_one", "acme/one", "One")
+        index_path = install_package("acme_grhub_old", "acme/old", "Old", False)
+
+        import_hub_validator(index_path=index_path)
+
+        assert "acme/one" in validators_registry
+        assert "acme/old" in validators_registry
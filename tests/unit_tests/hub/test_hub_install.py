@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from unittest.mock import ANY, call, MagicMock
 
@@ -7,7 +9,7 @@ from guardrails.hub.validator_package_service import (
     InvalidHubInstallURL,
 )
 
-from guardrails.hub.install import LocalModelFlagNotSet, install
+from guardrails.hub.install import LocalModelFlagNotSet, install, install_multiple
 
 
 @pytest.mark.parametrize(
@@ -94,7 +96,9 @@ class TestInstall:
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
 
-        get_manifest_and_site_packages_mock.assert_called_once_with("guardrails/id")
+        get_manifest_and_site_packages_mock.assert_called_once_with(
+            "guardrails/id", None, refresh=False
+        )
 
         mock_pip_install_hub_module.assert_called_once_with(
             self.manifest.id, validator_version=None, quiet=ANY, upgrade=ANY, logger=ANY
@@ -156,7 +160,9 @@ class TestInstall:
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
 
-        get_manifest_and_site_packages_mock.assert_called_once_with("guardrails/id")
+        get_manifest_and_site_packages_mock.assert_called_once_with(
+            "guardrails/id", None, refresh=False
+        )
 
         mock_pip_install_hub_module.assert_called_once_with(
             self.manifest.id, validator_version=None, quiet=ANY, upgrade=ANY, logger=ANY
@@ -215,7 +221,9 @@ class TestInstall:
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
 
-        get_manifest_and_site_packages_mock.assert_called_once_with("guardrails/id")
+        get_manifest_and_site_packages_mock.assert_called_once_with(
+            "guardrails/id", None, refresh=False
+        )
 
         mock_pip_install_hub_module.assert_called_once_with(
             self.manifest.id, validator_version=None, quiet=ANY, upgrade=ANY, logger=ANY
@@ -270,7 +278,9 @@ class TestInstall:
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
 
-        get_manifest_and_site_packages_mock.assert_called_once_with("guardrails/id")
+        get_manifest_and_site_packages_mock.assert_called_once_with(
+            "guardrails/id", None, refresh=False
+        )
 
         mock_pip_install_hub_module.assert_called_once_with(
             self.manifest.id, validator_version=None, quiet=ANY, upgrade=ANY, logger=ANY
@@ -436,3 +446,87 @@ class TestInstall:
 
         assert mock_logger_log.call_count == 3
         mock_logger_log.assert_has_calls(log_calls)
+
+
+class TestInstallMultiple:
+    def manifest(self, validator_id: str) -> Manifest:
+        return Manifest.from_dict(
+            {
+                "id": validator_id,
+                "name": "name",
+                "author": {"name": "me", "email": "me@me.me"},
+                "maintainers": [],
+                "repository": {"url": "some-repo"},
+                "namespace": "guardrails",
+                "packageName": validator_id.split("/")[1],
+                "moduleName": "test_validator",
+                "description": "test-description",
+                "exports": ["TestValidator"],
+                "tags": {"hasGuardrailsEndpoint": False},
+            }
+        )
+
+    def test_installs_packages_together(self, mocker):
+        mocker.patch("guardrails.hub.install.RC.exists", return_value=False)
+        mocker.patch("guardrails.hub.install.cli_logger.log")
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_site_packages_location",
+            return_value="./site-packages",
+        )
+        manifests = {
+            "guardrails/one": self.manifest("guardrails/one"),
+            "guardrails/two": self.manifest("guardrails/two"),
+        }
+        both_fetching = threading.Barrier(2, timeout=5)
+        both_post_installing = threading.Barrier(2, timeout=5)
+
+        def get_manifest(validator_id, validator_version, refresh=False):
+            both_fetching.wait()
+            return manifests[validator_id]
+
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_manifest",
+            side_effect=get_manifest,
+        )
+        mock_install_hub_modules = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.install_hub_modules"
+        )
+        mock_run_post_install = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.run_post_install",
+            side_effect=lambda *args, **kwargs: both_post_installing.wait(),
+        )
+        mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.get_validator_from_manifest",
+            side_effect=lambda manifest: MagicMock(),
+        )
+        mock_add_to_hub_init = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.add_to_hub_inits"
+        )
+
+        installed_modules = install_multiple(
+            ["hub://guardrails/one", "hub://guardrails/two>=1.0"],
+            install_local_models=True,
+        )
+
+        assert len(installed_modules) == 2
+        mock_install_hub_modules.assert_called_once_with(
+            [("guardrails/one", None), ("guardrails/two", ">=1.0")],
+            quiet=True,
+            upgrade=False,
+            logger=ANY,
+        )
+        assert mock_run_post_install.call_count == 2
+        mock_add_to_hub_init.assert_has_calls(
+            [
+                call(manifests["guardrails/one"], "./site-packages"),
+                call(manifests["guardrails/two"], "./site-packages"),
+            ]
+        )
+
+    def test_installs_nothing_without_uris(self, mocker):
+        mock_install_hub_modules = mocker.patch(
+            "guardrails.hub.validator_package_service.ValidatorPackageService.install_hub_modules"
+        )
+
+        assert install_multiple([]) == []
+        assert mock_install_hub_modules.call_count == 0
@@ -0,0 +1,68 @@
+import tracemalloc
+
+from guardrails.classes.history import Call
+from guardrails.classes.output_type import OutputTypes
+from guardrails.run import Runner
+from guardrails.run.utils import messages_source
+
+
+# A RAG style prompt: a large context and a question to fill in.
+context = "Context: " + "lorem ipsum dolor sit amet " * 4000
+messages = [
+    {"role": "system", "content": "You are a helpful assistant."},
+    {"role": "user", "content": context + "Question: ${question}"},
+]
+
+
+def prepare_call():
+    runner = Runner(
+        output_type=OutputTypes.STRING,
+        output_schema={"type": "string"},
+        num_reasks=0,
+        validation_map={},
+        messages=messages,
+    )
+    prepared = runner.prepare(
+        Call(),
+        0,
+        messages=runner.messages,
+        prompt_params={"question": "What is lorem ipsum?"},
+        api=lambda **kwargs: None,
+    )
+    return runner, messages_source(prepared)  # type: ignore
+
+
+def peak_allocation(fn) -> int:
+    fn()  # Warm the template cache.
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+class TestMessageMemory:
+    def test_peak_allocation_per_call(self):
+        # Formatting the question into the prompt has to allocate the
+        #   formatted content once, with the template's pieces alongside it.
+        #   Nothing else should copy the context.
+        peak = peak_allocation(prepare_call)
+
+        assert peak < 2.5 * len(context), f"peak allocation of {peak} bytes"
+
+    def test_unformatted_content_is_shared(self):
+        runner, prepared = prepare_call()
+
+        system_message = messages[0]["content"]
+        assert runner.messages[0]["content"].source is system_message
+        assert prepared[0]["content"] is system_message
+
+    def test_messages_are_not_changed(self):
+        runner, prepared = prepare_call()
+        prepared[0]["content"] = "Something else"
+
+        assert messages[0]["content"] == "You are a helpful assistant."
+        assert runner.messages[0]["content"].source == messages[0]["content"]
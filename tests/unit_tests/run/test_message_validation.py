@@ -0,0 +1,176 @@
+import json
+import threading
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from guardrails import Guard, Validator, register_validator
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.errors import ValidationError
+from guardrails.types import OnFailAction
+from tests.integration_tests.test_assets.validators import TwoWords
+
+
+validated_values: List[str] = []
+
+
+@register_validator("test/records-messages", data_type="string")
+class RecordsMessages(Validator):
+    def validate(self, value: Any, metadata: Dict) -> PassResult:
+        validated_values.append(value)
+        return PassResult()
+
+
+both_validating = threading.Barrier(2, timeout=5)
+
+
+@register_validator("test/waits-for-other-message", data_type="string")
+class WaitsForOtherMessage(Validator):
+    """Only passes if another message is validated at the same time."""
+
+    def validate(self, value: Any, metadata: Dict) -> PassResult:
+        both_validating.wait()
+        return PassResult()
+
+
+def mock_llm_api(*, messages, **kwargs):
+    return "A dog."
+
+
+@pytest.fixture(autouse=True)
+def reset_validated_values():
+    validated_values.clear()
+    both_validating.reset()
+
+
+def conversation(*contents: str) -> List[Dict[str, str]]:
+    return [{"role": "user", "content": content} for content in contents]
+
+
+class TestMessageValidation:
+    def test_messages_are_validated_together(self):
+        guard = Guard().use(WaitsForOtherMessage(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello there", "Which pet?"))
+
+        iterations = guard.history.last.iterations
+        assert len(iterations) == 3
+        # The last message first, as the messages are validated ahead of the call.
+        assert [i.inputs.llm_output for i in iterations[:2]] == [
+            "Which pet?",
+            "Hello there",
+        ]
+        assert [log.property_path for log in iterations[0].validator_logs] == [
+            "messages.1"
+        ]
+        assert [log.property_path for log in iterations[1].validator_logs] == [
+            "messages.0"
+        ]
+
+    def test_each_failing_message_is_recorded(self):
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.NOOP), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hi", "What pet then?"))
+
+        iterations = guard.history.last.iterations[:2]
+        assert [len(i.outputs.failed_validations) for i in iterations] == [1, 1]
+
+    def test_failing_message_raises(self):
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.EXCEPTION), on="messages")
+
+        with pytest.raises(ValidationError):
+            guard(mock_llm_api, messages=conversation("Hello there", "Hi"))
+
+    def test_fixed_messages_do_not_fail_the_output(self):
+        class Pet(BaseModel):
+            name: str
+
+        guard = Guard.for_pydantic(Pet).use(
+            TwoWords(on_fail=OnFailAction.FIX), on="messages"
+        )
+
+        response = guard(
+            lambda *, messages, **kwargs: json.dumps({"name": messages[0]["content"]}),
+            messages=conversation("What kind of pet should I get?"),
+        )
+
+        assert response.validation_passed is True
+        assert response.validated_output == {"name": "What kind"}
+
+
+class TestOnlyChangedMessagesAreRevalidated:
+    def test_previous_turn_is_reused(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello there", "Which pet?"))
+        guard(
+            mock_llm_api,
+            messages=conversation("Hello there", "Which pet?", "A smaller one?"),
+        )
+
+        assert validated_values == ["Hello there", "Which pet?", "A smaller one?"]
+
+    def test_fixes_are_reused(self):
+        calls = []
+
+        def llm_api(*, messages, **kwargs):
+            calls.append([m["content"] for m in messages])
+            return "A dog."
+
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.FIX), on="messages")
+
+        guard(llm_api, messages=conversation("What kind of pet?"))
+        guard(llm_api, messages=conversation("What kind of pet?", "Which one then?"))
+
+        assert calls == [["What kind"], ["What kind", "Which one"]]
+        # Only the new message has an iteration on the second turn.
+        assert guard.history.last.iterations.first.inputs.llm_output == (
+            "Which one then?"
+        )
+
+    def test_changed_messages_are_revalidated(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello there", "Which pet?"))
+        guard(mock_llm_api, messages=conversation("Hello there", "Which cat?"))
+
+        assert validated_values == ["Hello there", "Which pet?", "Which cat?"]
+
+    def test_changed_metadata_revalidates(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello"), metadata={"a": 1})
+        guard(mock_llm_api, messages=conversation("Hello"), metadata={"a": 2})
+
+        assert validated_values == ["Hello", "Hello"]
+
+    def test_changed_validators_revalidate(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello"))
+        guard.use(RecordsMessages(), on="messages")
+        guard(mock_llm_api, messages=conversation("Hello"))
+
+        assert validated_values == ["Hello", "Hello", "Hello"]
+
+    def test_messages_are_found_wherever_they_are(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello there", "Which pet?"))
+        guard(
+            mock_llm_api,
+            messages=[{"role": "system", "content": "Be brief."}]
+            + conversation("Hello there", "Which pet?"),
+        )
+
+        assert validated_values == ["Hello there", "Which pet?", "Be brief."]
+
+    def test_reconfiguring_keeps_the_cache(self):
+        guard = Guard().use(RecordsMessages(), on="messages")
+
+        guard(mock_llm_api, messages=conversation("Hello"))
+        guard.configure(num_reasks=2)
+        guard(mock_llm_api, messages=conversation("Hello"))
+
+        assert validated_values == ["Hello"]
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+from typing import Any, Dict
+
+import pytest
+
+from guardrails import Guard, Validator, register_validator
+from guardrails.async_guard import AsyncGuard
+from guardrails.classes.validation.validation_result import PassResult
+from guardrails.errors import ValidationError
+from guardrails.types import OnFailAction
+from tests.integration_tests.test_assets.validators import TwoWords
+
+
+llm_started = threading.Event()
+
+
+@register_validator("test/waits-for-llm", data_type="string")
+class WaitsForLLM(Validator):
+    """Only passes once the LLM call has started."""
+
+    def validate(self, value: Any, metadata: Dict) -> PassResult:
+        assert llm_started.wait(timeout=5), "input validation blocked the LLM call"
+        return PassResult()
+
+
+messages = [{"role": "user", "content": "What kind of pet should I get?"}]
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_started():
+    llm_started.clear()
+
+
+class TestOverlapInputValidation:
+    def test_llm_call_starts_before_validation_finishes(self):
+        def mock_llm_api(*, messages, **kwargs):
+            llm_started.set()
+            return "A dog."
+
+        guard = Guard().use(WaitsForLLM(on_fail=OnFailAction.EXCEPTION), on="messages")
+        guard.configure(overlap_input_validation=True)
+
+        response = guard(mock_llm_api, messages=messages)
+
+        assert response.validated_output == "A dog."
+        assert guard.history.last.iterations.last.inputs.messages == messages
+
+    def test_response_is_discarded_when_validation_fails(self):
+        def mock_llm_api(*, messages, **kwargs):
+            return "A dog."
+
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.EXCEPTION), on="messages")
+        guard.configure(overlap_input_validation=True)
+
+        with pytest.raises(ValidationError):
+            guard(mock_llm_api, messages=messages)
+        assert guard.history.last.iterations.last.outputs.llm_response_info is None
+
+    def test_fixes_are_not_overlapped_by_default(self):
+        calls = []
+
+        def mock_llm_api(*, messages, **kwargs):
+            calls.append(messages[0]["content"])
+            return "A dog."
+
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.FIX), on="messages")
+        guard.configure(overlap_input_validation=True)
+
+        guard(mock_llm_api, messages=messages)
+
+        assert calls == ["What kind"]
+
+    def test_fixes_reissue_the_llm_call(self):
+        calls = []
+
+        def mock_llm_api(*, messages, **kwargs):
+            calls.append(messages[0]["content"])
+            return messages[0]["content"]
+
+        guard = Guard().use(TwoWords(on_fail=OnFailAction.FIX), on="messages")
+        guard.configure(overlap_input_validation=True, reissue_on_input_fix=True)
+
+        response = guard(mock_llm_api, messages=messages)
+
+        assert sorted(calls) == ["What kind", "What kind of pet should I get?"]
+        assert response.validated_output == "What kind"
+
+
+@pytest.mark.asyncio
+class TestAsyncOverlapInputValidation:
+    async def test_llm_call_is_cancelled_when_validation_fails(self):
+        cancelled = asyncio.Event()
+
+        async def mock_llm_api(*, messages, **kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "A dog."
+
+        guard = AsyncGuard().use(
+            TwoWords(on_fail=OnFailAction.EXCEPTION), on="messages"
+        )
+        guard.configure(overlap_input_validation=True)
+
+        with pytest.raises(ValidationError):
+            await guard(mock_llm_api, messages=messages)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    async def test_response_is_used_when_validation_passes(self):
+        calls = []
+
+        async def mock_llm_api(*, messages, **kwargs):
+            calls.append(messages[0]["content"])
+            return "A dog."
+
+        guard = AsyncGuard().use(
+            TwoWords(on_fail=OnFailAction.EXCEPTION), on="messages"
+        )
+        guard.configure(overlap_input_validation=True)
+
+        response = await guard(
+            mock_llm_api, messages=[{"role": "user", "content": "Which pet?"}]
+        )
+
+        assert response.validated_output == "A dog."
+        assert calls == ["Which pet?"]
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import threading
+import time
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from guardrails import Guard
+from guardrails.async_guard import AsyncGuard
+from guardrails.logger import logger
+from guardrails.run.runner import Runner
+from guardrails.types import OnFailAction
+from tests.integration_tests.test_assets.validators import TwoWords
+
+
+class Pet(BaseModel):
+    name: str
+    breed: str
+    age: int
+
+
+messages = [{"role": "user", "content": "Describe a pet as JSON."}]
+first_response = {"name": "Rex", "breed": "Labrador", "age": 3}
+fixes = {"name": "Rex Junior", "breed": "Labrador Retriever"}
+
+
+def reask_field(messages) -> str:
+    """The only field a reask prompt is for."""
+    prompt = messages[-1]["content"]
+    previous_response = prompt.split("Help me correct")[0]
+    (field,) = [field for field in fixes if f'"{field}"' in previous_response]
+    return field
+
+
+def use_two_words(guard):
+    guard.use(TwoWords(on_fail=OnFailAction.REASK), on="$.name")
+    guard.use(TwoWords(on_fail=OnFailAction.REASK), on="$.breed")
+
+
+class TestParallelFieldReasks:
+    def test_fields_are_reasked_for_concurrently(self):
+        both_reasking = threading.Barrier(2, timeout=5)
+        reasked_fields: List[str] = []
+
+        def mock_llm_api(*, messages, **kwargs):
+            if len(messages) == 1:
+                return json.dumps(first_response)
+            field = reask_field(messages)
+            reasked_fields.append(field)
+            both_reasking.wait()
+            return json.dumps({field: fixes[field]})
+
+        guard = Guard.for_pydantic(Pet)
+        use_two_words(guard)
+        guard.configure(parallel_field_reasks=True)
+
+        response = guard(
+            mock_llm_api, messages=messages, num_reasks=1, full_schema_reask=False
+        )
+
+        assert sorted(reasked_fields) == ["breed", "name"]
+        assert response.validation_passed is True
+        assert response.validated_output == {**first_response, **fixes}
+        assert guard.history.last.iterations.length == 3
+
+    def test_group_iterations_have_their_own_logs_in_group_order(self, mocker):
+        both_reasking = threading.Barrier(2, timeout=5)
+
+        def mock_llm_api(*, messages, **kwargs):
+            if len(messages) == 1:
+                return json.dumps(first_response)
+            field = reask_field(messages)
+            both_reasking.wait()
+            logger.warning(f"Reasked for {field}")
+            return json.dumps({field: fixes[field]})
+
+        # Start the step for the first group last.
+        step = Runner.step
+
+        def delayed_step(self, index, output_schema, *args, **kwargs):
+            if index > 0 and "name" in output_schema["properties"]:
+                time.sleep(0.2)
+            return step(self, index, output_schema, *args, **kwargs)
+
+        mocker.patch.object(Runner, "step", delayed_step)
+        guard = Guard.for_pydantic(Pet)
+        use_two_words(guard)
+        guard.configure(parallel_field_reasks=True)
+
+        guard(mock_llm_api, messages=messages, num_reasks=1, full_schema_reask=False)
+
+        iterations = guard.history.last.iterations
+        assert [list(i.logs) for i in iterations[1:]] == [
+            ["Reasked for name"],
+            ["Reasked for breed"],
+        ]
+        assert iterations.last.validation_response == {**first_response, **fixes}
+
+    def test_fields_that_fail_again_are_reasked(self):
+        reasked_fields: List[str] = []
+
+        def mock_llm_api(*, messages, **kwargs):
+            if len(messages) == 1:
+                return json.dumps(first_response)
+            field = reask_field(messages)
+            reasked_fields.append(field)
+            if field == "name":
+                return json.dumps({field: fixes[field]})
+            if reasked_fields.count(field) == 1:
+                return json.dumps({field: "Lab"})
+            # Reasks for a single group of fields are for the whole output.
+            return json.dumps({**first_response, **fixes})
+
+        guard = Guard.for_pydantic(Pet)
+        use_two_words(guard)
+        guard.configure(parallel_field_reasks=True)
+
+        response = guard(
+            mock_llm_api, messages=messages, num_reasks=2, full_schema_reask=False
+        )
+
+        assert sorted(reasked_fields[:2]) == ["breed", "name"]
+        assert reasked_fields[2:] == ["breed"]
+        assert response.validation_passed is True
+        assert response.validated_output == {**first_response, **fixes}
+
+    def test_reasks_are_combined_by_default(self):
+        calls = []
+
+        def mock_llm_api(*, messages, **kwargs):
+            calls.append(messages)
+            return json.dumps(
+                first_response if len(calls) == 1 else {**first_response, **fixes}
+            )
+
+        guard = Guard.for_pydantic(Pet)
+        use_two_words(guard)
+
+        guard(mock_llm_api, messages=messages, num_reasks=1, full_schema_reask=False)
+
+        assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_fields_are_reasked_for_concurrently():
+    reasked_fields: List[str] = []
+    both_reasking = asyncio.Event()
+
+    async def mock_llm_api(*, messages, **kwargs):
+        if len(messages) == 1:
+            return json.dumps(first_response)
+        field = reask_field(messages)
+        reasked_fields.append(field)
+        if len(reasked_fields) == 2:
+            both_reasking.set()
+        await asyncio.wait_for(both_reasking.wait(), timeout=5)
+        return json.dumps({field: fixes[field]})
+
+    guard = AsyncGuard.for_pydantic(Pet)
+    use_two_words(guard)
+    guard.configure(parallel_field_reasks=True)
+
+    response = await guard(
+        mock_llm_api, messages=messages, num_reasks=1, full_schema_reask=False
+    )
+
+    assert sorted(reasked_fields) == ["breed", "name"]
+    assert response.validated_output == {**first_response, **fixes}
@@ -0,0 +1,157 @@
+import pytest
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.history import Call, Iteration
+from guardrails.classes.validation.validation_result import (
+    ErrorSpan,
+    FailResult,
+    PassResult,
+)
+from guardrails.run.speculative_stream import SpeculativeStream
+from guardrails.validator_base import Validator, register_validator
+
+CHUNKS = ["This is ", "fine. ", "This is ", "bad. ", "Done."]
+MESSAGES = [{"role": "user", "content": "Say something."}]
+
+
+@register_validator("test/no-bad-words-with-spans", data_type="string")
+class NoBadWords(Validator):
+    def validate(self, value, metadata):
+        if "bad" in value:
+            start = value.index("bad")
+            return FailResult(
+                error_message="Bad word.",
+                fix_value=value.replace("bad", "***"),
+                error_spans=[ErrorSpan(start=start, end=start + 3, reason="Bad")],
+            )
+        return PassResult()
+
+
+def render(outcomes):
+    """Render a speculative stream the way a client would."""
+    text = ""
+    for outcome in outcomes:
+        if outcome.retraction is not None:
+            retraction = outcome.retraction
+            text = (
+                text[: retraction.start]
+                + retraction.replacement
+                + text[retraction.end :]
+            )
+        else:
+            assert outcome.speculative is True
+            text += outcome.validated_output
+    return text
+
+
+def llm_api(messages, **kwargs):
+    return iter(CHUNKS)
+
+
+class MockAsyncResponse:
+    def __init__(self):
+        async def gen():
+            for chunk in CHUNKS:
+                yield chunk
+
+        self.completion_stream = gen()
+
+
+async def async_llm_api(messages, **kwargs):
+    return MockAsyncResponse()
+
+
+class TestSpeculativeStream:
+    def test_unchanged_text_is_not_retracted(self):
+        call = Call()
+        speculative = SpeculativeStream(call, Iteration(call_id=call.id, index=0))
+
+        outcome = speculative.forward("Hello. ")
+
+        assert outcome.speculative is True
+        assert outcome.validated_output == "Hello. "
+        assert speculative.confirm("Hello. ", "Hello. ") is None
+        assert speculative.retract_rest() is None
+
+    def test_retractions_are_relative_to_rendered_text(self):
+        call = Call()
+        speculative = SpeculativeStream(call, Iteration(call_id=call.id, index=0))
+        for chunk in ["Hi. ", "Bye. ", "Later."]:
+            speculative.forward(chunk)
+
+        first = speculative.confirm("Hi. ", "Hello. ")
+        second = speculative.confirm("Bye. ", "")
+        rest = speculative.retract_rest()
+
+        assert first.retraction.start == 0
+        assert first.retraction.end == 4
+        assert second.retraction.start == 7
+        assert second.retraction.end == 12
+        assert rest.retraction.start == 7
+        assert rest.retraction.end == 13
+        assert speculative.validated_text == "Hello. "
+
+    def test_uses_observed_state_instead_of_logs(self):
+        call = Call()
+        speculative = SpeculativeStream(call, Iteration(call_id=call.id, index=0))
+        speculative.update((False, [ErrorSpan(start=4, end=7, reason="Bad")]))
+
+        speculative.forward("Too bad.")
+        outcome = speculative.confirm("Too bad.", "Too bad.")
+
+        assert outcome.validation_passed is False
+        assert outcome.retraction.error_spans[0].start == 4
+        assert outcome.retraction.replacement == "Too bad."
+
+
+class TestSpeculativeStreaming:
+    @pytest.mark.parametrize("on_fail", ["fix", "noop", "refrain"])
+    def test_matches_validated_stream(self, on_fail):
+        guard = Guard().use(NoBadWords(on_fail=on_fail))
+        validated = "".join(
+            outcome.validated_output
+            for outcome in guard(llm_api, messages=MESSAGES, stream=True)
+        )
+
+        guard.configure(speculative_streaming=True)
+        outcomes = list(guard(llm_api, messages=MESSAGES, stream=True))
+
+        assert outcomes[0].speculative is True
+        assert outcomes[0].validated_output == CHUNKS[0]
+        assert render(outcomes) == validated
+
+    def test_retraction_carries_error_spans(self):
+        guard = Guard().use(NoBadWords(on_fail="fix"))
+        guard.configure(speculative_streaming=True)
+
+        outcomes = list(guard(llm_api, messages=MESSAGES, stream=True))
+
+        retractions = [o.retraction for o in outcomes if o.retraction is not None]
+        error_spans = [span for r in retractions for span in r.error_spans]
+        assert [r.replacement for r in retractions if r.error_spans] == ["This is ***."]
+        assert len(error_spans) == 1
+        assert error_spans[0].end - error_spans[0].start == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("on_fail", ["fix", "noop", "refrain"])
+    async def test_async_matches_validated_stream(self, on_fail):
+        guard = AsyncGuard().use(NoBadWords(on_fail=on_fail))
+        validated = "".join(
+            [
+                outcome.validated_output
+                async for outcome in await guard(
+                    async_llm_api, messages=MESSAGES, stream=True
+                )
+            ]
+        )
+
+        guard.configure(speculative_streaming=True)
+        outcomes = [
+            outcome
+            async for outcome in await guard(
+                async_llm_api, messages=MESSAGES, stream=True
+            )
+        ]
+
+        assert outcomes[0].speculative is True
+        assert render(outcomes) == validated
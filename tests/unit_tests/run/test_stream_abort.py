@@ -0,0 +1,219 @@
+import time
+
+import pytest
+
+from guardrails import AsyncGuard, Guard
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.errors import ValidationError
+from guardrails.validator_base import Validator, register_validator
+
+CHUNKS = ["This is fine. ", "This is bad. ", "This is more. ", "Done."]
+
+
+@register_validator("test/no-bad-sentences", data_type="string")
+class NoBadSentences(Validator):
+    def validate(self, value, metadata):
+        if "bad" in value:
+            return FailResult(error_message="Bad sentence.", fix_value="")
+        return PassResult()
+
+
+class MockStream:
+    """An LLM stream that records how much of it was read and whether it
+    was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.chunks_read = 0
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.closed or self.chunks_read == len(self.chunks):
+            raise StopIteration
+        self.chunks_read += 1
+        return self.chunks[self.chunks_read - 1]
+
+    def close(self):
+        self.closed = True
+
+
+class MockAsyncStream(MockStream):
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return self.__next__()
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def aclose(self):
+        self.close()
+
+
+class MockAsyncResponse:
+    def __init__(self, chunks):
+        self.completion_stream = MockAsyncStream(chunks)
+
+
+class TestStreamRunnerAbort:
+    def test_refrain_closes_stream(self):
+        stream = MockStream(CHUNKS)
+
+        def llm_api(messages, **kwargs):
+            return stream
+
+        guard = Guard().use(NoBadSentences(on_fail="refrain"))
+        outcomes = list(
+            guard(
+                llm_api,
+                messages=[{"role": "user", "content": "Say something."}],
+                stream=True,
+                max_tokens=100,
+            )
+        )
+
+        assert stream.closed is True
+        assert stream.chunks_read == 2
+        assert outcomes[-1].validated_output == ""
+        outputs = guard.history.last.iterations.last.outputs
+        assert outputs.stream_aborted is True
+        assert outputs.tokens_saved == 98
+
+    def test_speculative_refrain_closes_stream(self):
+        class SlowStream(MockStream):
+            def __next__(self):
+                if self.chunks_read == 2:
+                    # Give validation time to refrain on the second chunk.
+                    time.sleep(0.2)
+                return super().__next__()
+
+        stream = SlowStream(CHUNKS)
+
+        def llm_api(messages, **kwargs):
+            return stream
+
+        guard = Guard().use(NoBadSentences(on_fail="refrain"))
+        guard.configure(speculative_streaming=True)
+        outcomes = guard(
+            llm_api,
+            messages=[{"role": "user", "content": "Say something."}],
+            stream=True,
+        )
+        forwarded = [o.validated_output for o in outcomes if o.speculative]
+
+        assert forwarded == CHUNKS[:2]
+        assert stream.closed is True
+        assert stream.chunks_read == 3
+
+    def test_exception_closes_stream(self):
+        stream = MockStream(CHUNKS)
+
+        def llm_api(messages, **kwargs):
+            return stream
+
+        guard = Guard().use(NoBadSentences(on_fail="exception"))
+        with pytest.raises(ValidationError):
+            list(
+                guard(
+                    llm_api,
+                    messages=[{"role": "user", "content": "Say something."}],
+                    stream=True,
+                )
+            )
+
+        assert stream.closed is True
+        assert stream.chunks_read == 2
+        outputs = guard.history.last.iterations.last.outputs
+        assert outputs.stream_aborted is True
+        # max_tokens was not passed, so there is nothing to estimate against.
+        assert outputs.tokens_saved is None
+
+    def test_abandoned_generator_closes_stream(self):
+        stream = MockStream(CHUNKS)
+
+        def llm_api(messages, **kwargs):
+            return stream
+
+        guard = Guard().use(NoBadSentences(on_fail="noop"))
+        gen = guard(
+            llm_api,
+            messages=[{"role": "user", "content": "Say something."}],
+            stream=True,
+        )
+        next(gen)
+        gen.close()
+
+        assert stream.closed is True
+
+    def test_exhausted_stream_is_not_aborted(self):
+        stream = MockStream(CHUNKS)
+
+        def llm_api(messages, **kwargs):
+            return stream
+
+        guard = Guard().use(NoBadSentences(on_fail="noop"))
+        list(
+            guard(
+                llm_api,
+                messages=[{"role": "user", "content": "Say something."}],
+                stream=True,
+                max_tokens=100,
+            )
+        )
+
+        assert stream.closed is False
+        assert stream.chunks_read == len(CHUNKS)
+        outputs = guard.history.last.iterations.last.outputs
+        assert outputs.stream_aborted is False
+        assert outputs.tokens_saved is None
+
+
+@pytest.mark.asyncio
+class TestAsyncStreamRunnerAbort:
+    async def test_refrain_closes_stream(self):
+        response = MockAsyncResponse(CHUNKS)
+
+        async def llm_api(messages, **kwargs):
+            return response
+
+        guard = AsyncGuard().use(NoBadSentences(on_fail="refrain"))
+        gen = await guard(
+            llm_api,
+            messages=[{"role": "user", "content": "Say something."}],
+            stream=True,
+            max_tokens=100,
+        )
+        outcomes = [outcome async for outcome in gen]
+
+        stream = response.completion_stream
+        assert stream.closed is True
+        assert stream.chunks_read == 2
+        assert outcomes[-1].validated_output == ""
+        assert outcomes[-1].validation_passed is False
+        outputs = guard.history.last.iterations.last.outputs
+        assert outputs.stream_aborted is True
+        assert outputs.tokens_saved == 98
+
+    async def test_filter_does_not_close_stream(self):
+        response = MockAsyncResponse(CHUNKS)
+
+        async def llm_api(messages, **kwargs):
+            return response
+
+        guard = AsyncGuard().use(NoBadSentences(on_fail="filter"))
+        gen = await guard(
+            llm_api,
+            messages=[{"role": "user", "content": "Say something."}],
+            stream=True,
+        )
+        [outcome async for outcome in gen]
+
+        stream = response.completion_stream
+        assert stream.closed is False
+        assert stream.chunks_read == len(CHUNKS)
+        outputs = guard.history.last.iterations.last.outputs
+        assert outputs.stream_aborted is False
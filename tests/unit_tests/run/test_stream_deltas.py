@@ -0,0 +1,89 @@
+import json
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from guardrails import AsyncGuard, Guard
+from guardrails.utils.json_patch_utils import apply_json_patch
+
+MESSAGES = [{"role": "user", "content": "Describe a pet."}]
+
+
+class Pet(BaseModel):
+    name: str
+    tags: List[str]
+
+
+PET = {"name": "Fido", "tags": ["good", "dog"]}
+OUTPUT = json.dumps(PET)
+CHUNKS = [OUTPUT[i : i + 4] for i in range(0, len(OUTPUT), 4)]
+
+
+def llm_api(messages, **kwargs):
+    return iter(CHUNKS)
+
+
+class MockAsyncResponse:
+    def __init__(self):
+        async def gen():
+            for chunk in CHUNKS:
+                yield chunk
+
+        self.completion_stream = gen()
+
+
+async def async_llm_api(messages, **kwargs):
+    return MockAsyncResponse()
+
+
+def assert_deltas(outcomes, materialized):
+    deltas = outcomes[:-1] if materialized else outcomes
+    validated = None
+    for delta in deltas:
+        assert delta.validated_output is None
+        validated = apply_json_patch(validated, delta.patch)
+
+    assert validated == PET
+    assert "".join(delta.raw_llm_output for delta in deltas) == OUTPUT
+    # Only the growing parts of the object are sent once it exists.
+    assert all(op["path"] != "" for delta in deltas[1:] for op in delta.patch)
+    if materialized:
+        assert outcomes[-1].patch is None
+        assert outcomes[-1].raw_llm_output == OUTPUT
+        assert outcomes[-1].validated_output == PET
+
+
+class TestStreamDeltas:
+    @pytest.mark.parametrize("materialize", [False, True])
+    def test_stream_deltas(self, materialize):
+        guard = Guard.for_pydantic(Pet)
+        guard.configure(stream_deltas=True, materialize_stream_deltas=materialize)
+
+        outcomes = list(guard(llm_api, messages=MESSAGES, stream=True))
+
+        assert_deltas(outcomes, materialize)
+
+    def test_full_outcomes_by_default(self):
+        guard = Guard.for_pydantic(Pet)
+
+        outcomes = list(guard(llm_api, messages=MESSAGES, stream=True))
+
+        assert all(outcome.patch is None for outcome in outcomes)
+        assert outcomes[-1].raw_llm_output == OUTPUT
+        assert outcomes[-1].validated_output == PET
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("materialize", [False, True])
+    async def test_async_stream_deltas(self, materialize):
+        guard = AsyncGuard.for_pydantic(Pet)
+        guard.configure(stream_deltas=True, materialize_stream_deltas=materialize)
+
+        outcomes = [
+            outcome
+            async for outcome in await guard(
+                async_llm_api, messages=MESSAGES, stream=True
+            )
+        ]
+
+        assert_deltas(outcomes, materialize)
@@ -0,0 +1,165 @@
+import os
+
+import pytest
+from pydantic import BaseModel, Field
+
+from guardrails import Guard
+from guardrails.schema import schema_cache as schema_cache_module
+from guardrails.schema.schema_cache import SchemaCache
+from guardrails.settings import settings
+from tests.integration_tests.test_assets.validators import TwoWords, ValidLength
+
+rail = """
+<rail version="0.1">
+<output>
+    <string name="name" validators="two-words" on-fail-two-words="reask" />
+    <list name="pets" validators="length: 1 3" on-fail-length="fix">
+        <string name="pet" />
+    </list>
+</output>
+<messages>
+<message role="user">Name a person and their pets.</message>
+</messages>
+</rail>
+"""
+
+
+@pytest.fixture
+def parse_rail(mocker):
+    return mocker.spy(schema_cache_module, "rail_string_to_schema")
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "schema_cache_dir", str(tmp_path))
+    return tmp_path
+
+
+def validator_summary(processed_schema):
+    return {
+        path: [(type(v), v.on_fail_descriptor, v.get_args()) for v in validators]
+        for path, validators in processed_schema.validator_map.items()
+    }
+
+
+class TestRailSchemaCache:
+    def test_rail_is_only_parsed_once(self, parse_rail):
+        cache = SchemaCache()
+
+        parsed = cache.rail_string_to_schema(rail)
+        cached = cache.rail_string_to_schema(rail)
+
+        assert parse_rail.call_count == 1
+        assert cached.output_type == parsed.output_type
+        assert cached.json_schema == parsed.json_schema
+        assert cached.validators == parsed.validators
+        assert cached.exec_opts == parsed.exec_opts
+        assert validator_summary(cached) == validator_summary(parsed)
+        assert set(validator_summary(cached)) == {"$.name", "$.pets"}
+        assert validator_summary(cached)["$.name"][0][0] is TwoWords
+        assert validator_summary(cached)["$.pets"][0][0] is ValidLength
+
+    def test_each_schema_has_its_own_validators(self):
+        cache = SchemaCache()
+
+        first = cache.rail_string_to_schema(rail)
+        second = cache.rail_string_to_schema(rail)
+
+        assert first.validator_map["$.name"][0] is not second.validator_map["$.name"][0]
+        second.json_schema["properties"].pop("name")
+        assert "name" in cache.rail_string_to_schema(rail).json_schema["properties"]
+
+    def test_warm_start_skips_parsing(self, parse_rail, cache_dir):
+        parsed = SchemaCache().rail_string_to_schema(rail)
+
+        loaded = SchemaCache().rail_string_to_schema(rail)
+
+        assert parse_rail.call_count == 1
+        assert len(os.listdir(cache_dir)) == 1
+        assert loaded.json_schema == parsed.json_schema
+        assert validator_summary(loaded) == validator_summary(parsed)
+
+    def test_unreadable_files_are_parsed_again(self, parse_rail, cache_dir):
+        (cache_dir / f"{SchemaCache.rail_key(rail)}.json").write_text("{not json")
+
+        processed_schema = SchemaCache().rail_string_to_schema(rail)
+
+        assert parse_rail.call_count == 1
+        assert set(processed_schema.validator_map) == {"$.name", "$.pets"}
+
+
+class TestPydanticSchemaCache:
+    def test_model_is_only_compiled_once(self, mocker):
+        compile_model = mocker.spy(schema_cache_module, "pydantic_model_to_schema")
+
+        class Person(BaseModel):
+            name: str = Field(json_schema_extra={"validators": [TwoWords()]})
+
+        cache = SchemaCache()
+        first = cache.pydantic_model_to_schema(Person)
+        second = cache.pydantic_model_to_schema(Person)
+
+        assert compile_model.call_count == 1
+        assert second.json_schema == first.json_schema
+        assert second.validators == first.validators
+        assert validator_summary(second) == validator_summary(first)
+
+    def test_changed_models_are_compiled(self):
+        cache = SchemaCache()
+
+        def person_model(*validators):
+            class Person(BaseModel):
+                name: str = Field(json_schema_extra={"validators": list(validators)})
+
+            return Person
+
+        first = cache.pydantic_model_to_schema(person_model(TwoWords()))
+        second = cache.pydantic_model_to_schema(person_model(ValidLength(1, 5)))
+
+        assert type(first.validator_map["$.name"][0]) is TwoWords
+        assert type(second.validator_map["$.name"][0]) is ValidLength
+
+    def test_guards_do_not_share_validators(self):
+        class Pet(BaseModel):
+            name: str = Field(json_schema_extra={"validators": [("two-words", "noop")]})
+
+        class Person(BaseModel):
+            name: str = Field(
+                json_schema_extra={"validators": [TwoWords(on_fail="fix")]}
+            )
+            pet: Pet
+
+        first = Guard.for_pydantic(Person)
+        second = Guard.for_pydantic(Person)
+
+        for path in ["$.name", "$.pet.name"]:
+            assert first._validator_map[path][0] is not second._validator_map[path][0]
+        assert second._validator_map["$.pet.name"][0].on_fail_descriptor == "noop"
+        assert second._validator_map["$.name"][0].on_fail_descriptor == "fix"
+
+    def test_custom_on_fail_is_not_cached(self, mocker):
+        compile_model = mocker.spy(schema_cache_module, "pydantic_model_to_schema")
+
+        class Person(BaseModel):
+            name: str = Field(
+                json_schema_extra={
+                    "validators": [TwoWords(on_fail=lambda value, _: value)]
+                }
+            )
+
+        cache = SchemaCache()
+        first = cache.pydantic_model_to_schema(Person)
+        second = cache.pydantic_model_to_schema(Person)
+
+        assert compile_model.call_count == 2
+        assert first.validator_map["$.name"] == second.validator_map["$.name"]
+
+    def test_guards_do_not_share_validator_maps(self):
+        class Person(BaseModel):
+            name: str
+
+        first = Guard.for_pydantic(Person)
+        second = Guard.for_pydantic(Person)
+        second.use(TwoWords(), on="$.name")
+
+        assert "$.name" not in first._validator_map
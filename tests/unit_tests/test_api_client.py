@@ -0,0 +1,241 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Set, Tuple
+
+import pytest
+from guardrails_api_client.exceptions import ServiceException
+from guardrails_api_client.models import Guard as IGuard, ValidatePayload
+
+from guardrails import AsyncGuard, Guard
+from guardrails.api_client import GuardrailsApiClient
+from guardrails.settings import settings
+
+guard_name = "stub-guard"
+validation_outcome = {
+    "callId": "call-1",
+    "rawLlmOutput": "Hello world",
+    "validatedOutput": "Hello world",
+    "validationPassed": True,
+    "validationSummaries": [
+        {
+            "validatorName": "TwoWords",
+            "validatorStatus": "fail",
+            "propertyPath": "$",
+            "failureReason": "Not two words",
+        }
+    ],
+}
+guard_call = {"id": "call-1", "iterations": [], "inputs": {}}
+
+
+class StubGuardrailsApi(BaseHTTPRequestHandler):
+    """Answers the requests GuardrailsApiClient makes, recording each one
+    with the port of the connection it was made on."""
+
+    protocol_version = "HTTP/1.1"
+    requests: List[Tuple[str, str]]
+    client_ports: Set[int]
+
+    def log_message(self, *args):
+        pass
+
+    def _record(self):
+        self.server.requests.append((self.command, self.path))  # type: ignore
+        self.server.client_ports.add(self.client_address[1])  # type: ignore
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length)) if length else None
+
+    def _respond(self, status: int, body: Any):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self._record()
+        if self.path.startswith(f"/guards/{guard_name}/history/"):
+            if self.server.history_failures:  # type: ignore
+                self.server.history_failures -= 1  # type: ignore
+                return self._respond(503, {"message": "Unavailable"})
+            self._respond(200, [guard_call])
+        else:
+            self._respond(404, {"message": "Not Found"})
+
+    def do_PUT(self):
+        self._respond(200, self._record())
+
+    def do_POST(self):
+        body = self._record()
+        if not (body or {}).get("stream"):
+            return self._respond(200, validation_outcome)
+
+        fragments = [
+            {**validation_outcome, "rawLlmOutput": chunk, "validatedOutput": chunk}
+            for chunk in ["Hello", "Hello world"]
+        ]
+        content = "".join(json.dumps(fragment) + "\n" for fragment in fragments)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content.encode())
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGuardrailsApi)
+    server.requests = []  # type: ignore
+    server.client_ports = set()  # type: ignore
+    server.history_failures = 0  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setenv("GUARDRAILS_BASE_URL", base_url)
+    monkeypatch.setenv("GUARDRAILS_API_KEY", "stub-key")
+    monkeypatch.setattr(settings, "use_server", True)
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def requests_for(server, method: str) -> List[str]:
+    return [path for (m, path) in server.requests if m == method]
+
+
+def stream_payload() -> ValidatePayload:
+    payload: Dict[str, Any] = {"llmOutput": "Hello world", "stream": True}
+    return ValidatePayload.from_dict(payload)  # type: ignore
+
+
+class TestGuardrailsApiClient:
+    def test_clients_share_connections(self, stub_server):
+        guard = IGuard(id=guard_name, name=guard_name)
+        first = GuardrailsApiClient()
+        second = GuardrailsApiClient()
+
+        for client in [first, second, first]:
+            client.validate(guard, ValidatePayload(llm_output="Hello world"))
+        fragments = [
+            list(client.stream_validate(guard, stream_payload()))
+            for client in [first, second]
+        ]
+
+        assert first._api_client is second._api_client
+        assert len(requests_for(stub_server, "POST")) == 5
+        assert [len(f) for f in fragments] == [2, 2]
+        # One connection for the generated client and one for streaming
+        assert len(stub_server.client_ports) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_stream_validate(self, stub_server):
+        client = GuardrailsApiClient()
+
+        fragments = [
+            fragment.raw_llm_output
+            async for fragment in client.async_stream_validate(
+                IGuard(id=guard_name, name=guard_name), stream_payload()
+            )
+        ]
+
+        assert fragments == ["Hello", "Hello world"]
+
+
+class TestServerHistory:
+    def test_history_is_fetched_on_first_access(self, stub_server):
+        guard = Guard(name=guard_name)
+
+        outcome = guard.validate("Hello world")
+        guard.validate("Hello world")
+
+        assert outcome.validated_output == "Hello world"
+        assert outcome.validation_summaries[0].failure_reason == "Not two words"
+        assert requests_for(stub_server, "GET") == [f"/guards/{guard_name}"]
+
+        assert len(guard.history) == 2
+        assert guard.history.last.id == "call-1"
+        assert requests_for(stub_server, "GET")[1:] == [
+            f"/guards/{guard_name}/history/call-1",
+            f"/guards/{guard_name}/history/call-1",
+        ]
+
+    def test_dumped_guard_includes_deferred_history(self, stub_server):
+        guard = Guard(name=guard_name)
+
+        guard.validate("Hello world")
+
+        assert [call["id"] for call in guard.model_dump()["history"]] == ["call-1"]
+        assert len(requests_for(stub_server, "GET")) == 2
+
+    def test_concurrent_access_fetches_history_once(self, stub_server):
+        guard = Guard(name=guard_name)
+        guard.validate("Hello world")
+
+        lengths = []
+        threads = [
+            threading.Thread(target=lambda: lengths.append(len(guard.history)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert lengths == [1] * 8
+        assert len(requests_for(stub_server, "GET")) == 2
+
+    def test_failed_fetch_is_retried(self, stub_server):
+        guard = Guard(name=guard_name)
+        guard.validate("Hello world")
+        guard.validate("Hello world")
+        stub_server.history_failures = 1
+
+        with pytest.raises(ServiceException):
+            len(guard.history)
+
+        assert len(guard.history) == 2
+        assert len(requests_for(stub_server, "GET")) == 4
+
+    def test_history_can_be_disabled(self, stub_server, monkeypatch):
+        monkeypatch.setenv("GUARD_HISTORY_ENABLED", "false")
+        guard = Guard(name=guard_name)
+
+        guard.validate("Hello world")
+
+        assert len(guard.history) == 0
+        assert requests_for(stub_server, "GET") == [f"/guards/{guard_name}"]
+
+    def test_streamed_history_is_fetched_on_first_access(self, stub_server):
+        guard = Guard(name=guard_name)
+
+        fragments = list(guard.validate("Hello world", stream=True))
+
+        assert [f.validated_output for f in fragments] == ["Hello", "Hello world"]
+        assert len(requests_for(stub_server, "GET")) == 1
+        assert len(guard.history) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_guard_calls_server_without_blocking(stub_server):
+    guard = AsyncGuard(name=guard_name)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(tick())
+    outcome = await guard.validate("Hello world")
+    ticker.cancel()
+
+    assert outcome.validated_output == "Hello world"
+    assert outcome.validation_passed is True
+    assert ticks > 0
+    assert len(guard.history) == 1
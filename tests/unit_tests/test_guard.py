@@ -3,8 +3,11 @@ import pytest
 import openai  # noqa: F401
 from pydantic import BaseModel
 
+import guardrails.validator_service as vs
 from guardrails import Guard, Validator, register_validator
+from guardrails.classes.schema.model_schema import ModelSchema
 from guardrails.classes.validation.validation_result import PassResult
+from guardrails.classes.validation.validator_reference import ValidatorReference
 from guardrails.utils.validator_utils import verify_metadata_requirements
 from guardrails.utils import args, kwargs, on_fail
 from guardrails.types import OnFailAction
@@ -182,6 +185,24 @@ class TestConfigure:
         assert mock_set_tracer_context.call_count == 1
         assert mock_get_tracer_context.call_count == 1
 
+    def test_short_circuit(self, mocker):
+        guard = Guard().use(TwoWords, on_fail=OnFailAction.REFRAIN).use(LowerCase)
+        validate_spy = mocker.spy(vs, "validate")
+
+        assert guard._exec_opts.short_circuit is False
+
+        guard.configure(short_circuit=True)
+        guard.validate("Oh Canada eh")
+
+        assert guard._exec_opts.short_circuit is True
+        assert validate_spy.call_args.kwargs["short_circuit"] is True
+        assert guard.history.last.validator_logs[-1].cancelled is True
+
+        # Leaving it unset keeps the configured value
+        guard.configure()
+
+        assert guard._exec_opts.short_circuit is True
+
 
 def guard_init_for_rail():
     guard = Guard.for_rail("tests/unit_tests/test_assets/simple.rail")
@@ -558,6 +579,96 @@ class TestValidate:
         assert response.validated_output is None
 
 
+class TestExecutionPlan:
+    def test_plan_is_reused_across_calls(self, mocker):
+        guard: Guard = Guard().use(LowerCase, on_fail=OnFailAction.FIX)
+        fill_spy = mocker.spy(Guard, "_fill_validator_map")
+        to_dict_spy = mocker.spy(ModelSchema, "to_dict")
+
+        first = guard.validate("Oh Canada")
+        plan = guard._execution_plan
+        second = guard.validate("Oh Canada")
+
+        assert first.validated_output == second.validated_output == "oh canada"
+        assert guard._execution_plan is plan
+        assert fill_spy.call_count == 1
+        assert to_dict_spy.call_count == 1
+
+    def test_use_invalidates_plan(self):
+        guard: Guard = Guard().use(LowerCase, on_fail=OnFailAction.FIX)
+        guard.validate("Oh Canada")
+        plan = guard._execution_plan
+
+        guard.use(TwoWords, on_fail=OnFailAction.REFRAIN)
+        assert guard._execution_plan is None
+
+        response = guard.validate("Oh Canada eh")
+
+        assert response.validation_passed is False
+        assert guard._execution_plan is not plan
+        assert len(guard._execution_plan.validators) == 2
+        # The previous plan is a snapshot and is left unchanged.
+        assert len(plan.validators) == 1
+
+    def test_configure_invalidates_plan(self):
+        guard: Guard = Guard().use(LowerCase, on_fail=OnFailAction.FIX)
+        guard.validate("Oh Canada")
+
+        guard.configure(num_reasks=2)
+
+        assert guard._execution_plan is None
+
+    def test_changing_validators_invalidates_plan(self):
+        guard: Guard = Guard().use(LowerCase, on_fail=OnFailAction.FIX)
+        guard.validate("Oh Canada")
+
+        guard.validators.append(
+            ValidatorReference(id="two-words", on="$", on_fail="refrain")
+        )
+        response = guard.validate("Oh Canada eh")
+
+        assert response.validation_passed is False
+        assert len(guard._execution_plan.validators) == 2
+
+    def test_assigning_output_schema_invalidates_plan(self):
+        guard: Guard = Guard().use(LowerCase, on_fail=OnFailAction.FIX)
+        guard.validate("Oh Canada")
+        plan = guard._execution_plan
+
+        guard.output_schema = ModelSchema.from_dict(
+            {"type": "string", "description": "An anthem"}
+        )
+        guard.validate("Oh Canada")
+
+        assert guard._execution_plan is not plan
+        assert guard._execution_plan.output_schema["description"] == "An anthem"
+
+    def test_reask_messages_are_not_changed_by_calls(self):
+        reask_messages = [{"role": "user", "content": "${gr.complete_json_suffix}"}]
+        guard: Guard = Guard().use(TwoWords, on_fail=OnFailAction.REASK)
+        guard.configure(num_reasks=1)
+
+        guard(
+            lambda *args, **kwargs: "Oh Canada eh",
+            messages=[{"role": "user", "content": "Two words"}],
+            reask_messages=reask_messages,
+        )
+
+        assert reask_messages == [
+            {"role": "user", "content": "${gr.complete_json_suffix}"}
+        ]
+
+    def test_plan_checks_required_metadata(self):
+        guard: Guard = Guard().use(RequiringValidator)
+
+        with pytest.raises(ValueError, match="required_key"):
+            guard.validate("Oh Canada")
+
+        response = guard.validate("Oh Canada", metadata={"required_key": "a"})
+
+        assert response.validation_passed is True
+
+
 def test_use_and_use_many():
     guard: Guard = (
         Guard()
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and should only be loaded on first use.
+HEAVY_MODULES = [
+    "langchain_core",
+    "litellm",
+    "lxml",
+    "jsonschema",
+    "diff_match_patch",
+    "rich",
+    "requests",
+    "opentelemetry.sdk",
+    "opentelemetry.exporter",
+]
+
+# Cumulative import time budgets in microseconds. These are generous
+#   compared to a typical run (~0.2-0.4s) so they only catch regressions
+#   that eagerly pull a heavy dependency back in.
+IMPORT_TIME_BUDGETS = {
+    "guardrails": 1_000_000,
+    "guardrails.validator_base": 1_500_000,
+}
+
+
+def cumulative_import_time(module: str) -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like: "import time: <self> | <cumulative> | <module>"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"No import time reported for {module}")
+
+
+@pytest.mark.parametrize("module", ["guardrails", "guardrails.validator_base"])
+def test_heavy_dependencies_are_not_imported(module: str):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("module,budget", IMPORT_TIME_BUDGETS.items())
+def test_import_time_budget(module: str, budget: int):
+    # Take the best of a few runs to smooth out noisy machines.
+    best = min(cumulative_import_time(module) for _ in range(3))
+    assert best < budget, f"import {module} took {best}us (budget {budget}us)"
+
+
+def test_lazy_exports_resolve():
+    import guardrails
+
+    for name in guardrails.__all__:
+        assert getattr(guardrails, name) is not None
@@ -6,6 +6,7 @@ import pytest
 from pydantic import BaseModel, Field
 
 import guardrails as gd
+from guardrails.classes.templating.compiled_template import compile_template
 from guardrails.prompt.instructions import Instructions
 from guardrails.prompt.prompt import Prompt
 from guardrails.utils.constants import constants
@@ -254,6 +255,38 @@ def test_substitute_constants(prompt_str, final_prompt):
     assert prompt.source == final_prompt
 
 
+def test_substitute_nested_constants():
+    """Constants that reference other constants are expanded in one go."""
+    prompt = gd.Prompt("Dummy prompt. ${gr.json_suffix_with_structure_example}")
+
+    assert "${gr." not in prompt.source
+    assert constants["json_suffix_without_examples"] in prompt.source
+    assert prompt.format_instructions_start == len("Dummy prompt. ")
+    assert prompt.variable_names == ["output_schema", "json_example"]
+
+
+def test_compiled_template_is_reused():
+    source = "Dummy prompt ${document}. ${gr.complete_json_suffix_v2}"
+
+    first = Prompt(source).format(document="one")
+    second = Prompt(source).format(document="two")
+
+    assert compile_template(source) is compile_template(source)
+    assert first.source.startswith("Dummy prompt one.")
+    assert second.source.startswith("Dummy prompt two.")
+
+
+def test_compiled_template_tracks_constant_changes():
+    source = "Dummy prompt. ${gr.test_compiled_constant}"
+    constants["test_compiled_constant"] = "first"
+    try:
+        assert Prompt(source).source == "Dummy prompt. first"
+        constants["test_compiled_constant"] = "second"
+        assert Prompt(source).source == "Dummy prompt. second"
+    finally:
+        del constants["test_compiled_constant"]
+
+
 class TestResponse(BaseModel):
     grade: int = Field(description="The grade of the response")
 
@@ -292,3 +325,15 @@ def test_escape():
         'My prompt with a some sample json {{ "a" : 1 }} and a {{f_var}} and a'
         " ${safe_var}. Also an incomplete brace {{."
     )
+
+
+def test_non_templates_bypass_template_cache(mocker):
+    compile_spy = mocker.patch(
+        "guardrails.classes.templating.compiled_template.compile_template"
+    )
+    prompt = Prompt('A formatted prompt with json { "a" : 1 }.')
+
+    assert prompt.variable_names == []
+    assert prompt.escape() == 'A formatted prompt with json {{ "a" : 1 }}.'
+    assert Prompt("No braces.").escape() == "No braces."
+    compile_spy.assert_not_called()
@@ -0,0 +1,52 @@
+import pytest
+
+from guardrails.utils.json_patch_utils import apply_json_patch, make_json_patch
+
+
+@pytest.mark.parametrize(
+    "old,new,expected_patch",
+    [
+        ({"a": 1}, {"a": 1}, []),
+        (None, {"a": 1}, [{"op": "replace", "path": "", "value": {"a": 1}}]),
+        ({"a": 1}, {"a": 1, "b": 2}, [{"op": "add", "path": "/b", "value": 2}]),
+        (
+            {"a": "He"},
+            {"a": "Hello"},
+            [{"op": "replace", "path": "/a", "value": "Hello"}],
+        ),
+        ({"a": 1, "b": 2}, {"a": 1}, [{"op": "remove", "path": "/b"}]),
+        (
+            {"a": [1, {"b": "x"}]},
+            {"a": [1, {"b": "xy"}, 3]},
+            [
+                {"op": "replace", "path": "/a/1/b", "value": "xy"},
+                {"op": "add", "path": "/a/2", "value": 3},
+            ],
+        ),
+        (
+            [1, 2, 3],
+            [1],
+            [{"op": "remove", "path": "/2"}, {"op": "remove", "path": "/1"}],
+        ),
+        (
+            {"a/b~c": 1},
+            {"a/b~c": 2},
+            [{"op": "replace", "path": "/a~1b~0c", "value": 2}],
+        ),
+        ({"a": 1}, {"a": True}, [{"op": "replace", "path": "/a", "value": True}]),
+    ],
+)
+def test_make_json_patch(old, new, expected_patch):
+    patch = make_json_patch(old, new)
+
+    assert patch == expected_patch
+    assert apply_json_patch(old, patch) == new
+
+
+def test_apply_json_patch_does_not_mutate_document():
+    document = {"a": [1]}
+
+    patched = apply_json_patch(document, [{"op": "add", "path": "/a/1", "value": 2}])
+
+    assert patched == {"a": [1, 2]}
+    assert document == {"a": [1]}
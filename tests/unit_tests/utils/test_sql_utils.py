@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from guardrails.utils.sql_utils import SqlAlchemyDriver
+
+SCHEMA = """
+CREATE TABLE employees (id int, name text);
+INSERT INTO employees VALUES (1, 'Alice');
+"""
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "schema.sql"
+    path.write_text(SCHEMA)
+    return str(path)
+
+
+def count_employees(driver: SqlAlchemyDriver) -> int:
+    with driver._engine.connect() as connection:
+        return connection.exec_driver_sql("SELECT count(*) FROM employees").scalar()
+
+
+class TestSqlAlchemyDriver:
+    @pytest.mark.parametrize("validation_mode", ["execute", "explain"])
+    def test_validate_sql(self, schema_file, validation_mode):
+        driver = SqlAlchemyDriver(
+            schema_file, "sqlite://", validation_mode=validation_mode
+        )
+        assert driver.validate_sql("SELECT name FROM employees") == []
+        errors = driver.validate_sql("SELECT missing FROM employees")
+        assert len(errors) == 1
+        assert "missing" in errors[0]
+
+    @pytest.mark.parametrize("validation_mode", ["execute", "explain"])
+    def test_validation_leaves_no_changes(self, schema_file, validation_mode):
+        driver = SqlAlchemyDriver(
+            schema_file, "sqlite://", validation_mode=validation_mode
+        )
+        assert driver.validate_sql("DELETE FROM employees") == []
+        assert count_employees(driver) == 1
+
+    def test_invalid_validation_mode(self):
+        with pytest.raises(ValueError):
+            SqlAlchemyDriver(None, "sqlite://", validation_mode="prepare")  # type: ignore
+
+    def test_timeout(self):
+        driver = SqlAlchemyDriver(None, "sqlite://", timeout=0.05)
+        errors = driver.validate_sql(
+            "WITH RECURSIVE r(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM r) "
+            "SELECT count(*) FROM r"
+        )
+        assert len(errors) == 1
+        assert "interrupted" in errors[0]
+        # The connection is usable again after a timeout.
+        assert driver.validate_sql("SELECT 1") == []
+
+    def test_concurrent_validation(self, schema_file, tmp_path):
+        db_path = tmp_path / "test.db"
+        driver = SqlAlchemyDriver(schema_file, f"sqlite:///{db_path}", pool_size=4)
+        queries = ["SELECT name FROM employees", "SELECT missing FROM employees"] * 8
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(driver.validate_sql, queries))
+        assert [len(errors) for errors in results] == [0, 1] * 8
+
+    def test_get_schema_is_cached(self, schema_file, mocker):
+        driver = SqlAlchemyDriver(schema_file, "sqlite://")
+        inspect_spy = mocker.spy(driver, "_reflect_schema")
+
+        schema = driver.get_schema()
+        assert "Table: employees" in schema
+        assert driver.get_schema() == schema
+        assert inspect_spy.call_count == 1
@@ -178,7 +178,7 @@ class TestValidateChildren:
             index=0,
         )
 
-        validator_map = ({"$.*": [MagicMock(spec=Validator)]},)
+        validator_map = {"$.*": [MagicMock(spec=Validator)]}
         value, metadata = await avs.validate_children(
             value=["mock-child-1", "mock-child-2"],
             metadata={"mock-shared-metadata": "shared-metadata"},
@@ -252,12 +252,10 @@ class TestValidateChildren:
             index=0,
         )
 
-        validator_map = (
-            {
-                "$.child-1": [MagicMock(spec=Validator)],
-                "$.child-2": [MagicMock(spec=Validator)],
-            },
-        )
+        validator_map = {
+            "$.child-1": [MagicMock(spec=Validator)],
+            "$.child-2": [MagicMock(spec=Validator)],
+        }
         value, metadata = await avs.validate_children(
             value={"child-1": "mock-child-1", "child-2": "mock-child-2"},
             metadata={"mock-shared-metadata": "shared-metadata"},
@@ -503,7 +501,12 @@ class TestRunValidator:
 
         assert mock_run_validator_async.call_count == 1
         mock_run_validator_async.assert_called_once_with(
-            validator, "value", {}, False, validation_session_id=iteration.id
+            validator,
+            "value",
+            {},
+            False,
+            validation_session_id=iteration.id,
+            validator_logs=validator_logs,
         )
 
         assert mock_after_run_validator.call_count == 1
@@ -562,7 +565,12 @@ class TestRunValidator:
 
         assert mock_run_validator_async.call_count == 1
         mock_run_validator_async.assert_called_once_with(
-            validator, "value", {}, False, validation_session_id=iteration.id
+            validator,
+            "value",
+            {},
+            False,
+            validation_session_id=iteration.id,
+            validator_logs=validator_logs,
         )
 
         assert mock_after_run_validator.call_count == 1
@@ -625,7 +633,12 @@ class TestRunValidator:
 
         assert mock_run_validator_async.call_count == 1
         mock_run_validator_async.assert_called_once_with(
-            validator, "value", {}, False, validation_session_id=iteration.id
+            validator,
+            "value",
+            {},
+            False,
+            validation_session_id=iteration.id,
+            validator_logs=validator_logs,
         )
 
         assert mock_after_run_validator.call_count == 1
@@ -699,7 +712,14 @@ class TestRunValidator:
         assert mock_run_validator_async.call_count == 2
         mock_run_validator_async.assert_has_calls(
             [
-                call(validator, "value", {}, False, validation_session_id=iteration.id),
+                call(
+                    validator,
+                    "value",
+                    {},
+                    False,
+                    validation_session_id=iteration.id,
+                    validator_logs=validator_logs,
+                ),
                 call(
                     validator,
                     "fixed-value",
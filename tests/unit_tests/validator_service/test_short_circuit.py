@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+import pytest
+
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.errors import ValidationError
+from guardrails.validator_base import Validator, register_validator
+from guardrails.validator_service.async_validator_service import (
+    AsyncValidatorService,
+)
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@register_validator("test/always-fail", data_type="string")
+class AlwaysFail(Validator):
+    def validate(self, value, metadata):
+        return FailResult(error_message="Always fails.")
+
+
+@register_validator("test/slow-pass", data_type="string")
+class SlowPass(Validator):
+    def validate(self, value, metadata):
+        return PassResult()
+
+    async def async_validate(self, value, metadata):
+        await asyncio.sleep(5)
+        return PassResult()
+
+
+def new_iteration() -> Iteration:
+    return Iteration(call_id="mock-call", index=0)
+
+
+class TestAsyncShortCircuit:
+    @pytest.mark.asyncio
+    async def test_refrain_cancels_pending_validators(self):
+        iteration = new_iteration()
+        service = AsyncValidatorService(short_circuit=True)
+        validator_map = {"$": [AlwaysFail(on_fail="refrain"), SlowPass()]}
+
+        start = time.perf_counter()
+        value, _ = await service.async_validate(
+            "Hello", {}, validator_map, iteration, "$", "$"
+        )
+
+        assert time.perf_counter() - start < 2
+        assert isinstance(value, Refrain)
+        logs = {log.registered_name: log for log in iteration.validator_logs}
+        assert logs["test/always-fail"].cancelled is False
+        assert logs["test/slow-pass"].cancelled is True
+        assert logs["test/slow-pass"].validation_result is None
+        assert logs["test/slow-pass"].end_time is not None
+
+    @pytest.mark.asyncio
+    async def test_exception_cancels_pending_validators(self):
+        iteration = new_iteration()
+        service = AsyncValidatorService(short_circuit=True)
+        validator_map = {"$": [AlwaysFail(on_fail="exception"), SlowPass()]}
+
+        start = time.perf_counter()
+        with pytest.raises(ValidationError):
+            await service.async_validate(
+                "Hello", {}, validator_map, iteration, "$", "$"
+            )
+
+        assert time.perf_counter() - start < 2
+        logs = {log.registered_name: log for log in iteration.validator_logs}
+        assert logs["test/slow-pass"].cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_refrain_cancels_sibling_children(self):
+        iteration = new_iteration()
+        service = AsyncValidatorService(short_circuit=True)
+        validator_map = {
+            "$.a": [AlwaysFail(on_fail="refrain")],
+            "$.b": [SlowPass()],
+        }
+
+        value, _ = await service.async_validate(
+            {"a": "Hello", "b": "World"}, {}, validator_map, iteration, "$", "$"
+        )
+
+        assert isinstance(value["a"], Refrain)
+        logs = {log.registered_name: log for log in iteration.validator_logs}
+        assert logs["test/slow-pass"].cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_collects_all_results_by_default(self, mocker):
+        mocker.patch.object(SlowPass, "async_validate", return_value=PassResult())
+        iteration = new_iteration()
+        service = AsyncValidatorService()
+        validator_map = {"$": [AlwaysFail(on_fail="refrain"), SlowPass()]}
+
+        value, _ = await service.async_validate(
+            "Hello", {}, validator_map, iteration, "$", "$"
+        )
+
+        assert isinstance(value, Refrain)
+        assert all(log.cancelled is False for log in iteration.validator_logs)
+        assert all(log.validation_result for log in iteration.validator_logs)
+
+
+class TestSequentialShortCircuit:
+    def test_refrain_skips_remaining_validators(self):
+        iteration = new_iteration()
+        service = SequentialValidatorService(short_circuit=True)
+        validator_map = {"$": [AlwaysFail(on_fail="refrain"), SlowPass()]}
+
+        value, _ = service.validate("Hello", {}, validator_map, iteration, "$", "$")
+
+        assert isinstance(value, Refrain)
+        logs = {log.registered_name: log for log in iteration.validator_logs}
+        assert logs["test/slow-pass"].cancelled is True
+        assert logs["test/slow-pass"].value_before_validation == "Hello"
+
+    def test_refrain_skips_remaining_children(self):
+        iteration = new_iteration()
+        service = SequentialValidatorService(short_circuit=True)
+        validator_map = {
+            "$.a": [AlwaysFail(on_fail="refrain")],
+            "$.b": [SlowPass()],
+        }
+
+        service.validate(
+            {"a": "Hello", "b": "World"}, {}, validator_map, iteration, "$", "$"
+        )
+
+        assert [log.registered_name for log in iteration.validator_logs] == [
+            "test/always-fail"
+        ]
+
+    def test_validates_all_children_by_default(self):
+        iteration = new_iteration()
+        service = SequentialValidatorService()
+        validator_map = {
+            "$.a": [AlwaysFail(on_fail="refrain")],
+            "$.b": [SlowPass()],
+        }
+
+        service.validate(
+            {"a": "Hello", "b": "World"}, {}, validator_map, iteration, "$", "$"
+        )
+
+        assert [log.registered_name for log in iteration.validator_logs] == [
+            "test/always-fail",
+            "test/slow-pass",
+        ]
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.errors import ValidationError
+from guardrails.validator_base import Validator, register_validator
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@register_validator("test/slow-sentence", data_type="string")
+class SlowSentence(Validator):
+    def validate(self, value, metadata):
+        time.sleep(0.2)
+        return PassResult()
+
+
+@register_validator("test/no-bad-words", data_type="string")
+class NoBadWords(Validator):
+    def validate(self, value, metadata):
+        if "bad" in value:
+            return FailResult(error_message="Bad word.", fix_value="")
+        return PassResult()
+
+
+def sentence_stream():
+    chunks = ["This is fine. ", "This is bad. ", "Done."]
+    for index, chunk in enumerate(chunks):
+        yield chunk, index == len(chunks) - 1
+
+
+def validate_stream(validators):
+    iteration = Iteration(call_id="mock-call", index=0)
+    results = list(
+        SequentialValidatorService().validate_stream(
+            sentence_stream(), {}, {"$": validators}, iteration, "$", "$"
+        )
+    )
+    return results, iteration
+
+
+class TestConcurrentStreamValidators:
+    def test_noop_validators_run_concurrently(self):
+        validators = [SlowSentence(on_fail="noop") for _ in range(3)]
+
+        start = time.perf_counter()
+        results, iteration = validate_stream(validators)
+
+        # One slow validation per sentence, not one per validator per sentence.
+        assert time.perf_counter() - start < 0.2 * 3 * 2
+        assert (
+            "".join(res.chunk for res in results) == "This is fine. This is bad. Done."
+        )
+        assert [log.registered_name for log in iteration.validator_logs] == [
+            "test/slow-sentence"
+        ] * len(iteration.validator_logs)
+
+    def test_fix_validators_keep_results_in_order(self):
+        validators = [SlowSentence(on_fail="noop"), NoBadWords(on_fail="fix")]
+
+        results, iteration = validate_stream(validators)
+
+        validated = [res.chunk for res in results if res.chunk]
+        assert "bad" not in "".join(validated)
+        assert [log.registered_name for log in iteration.validator_logs][:2] == [
+            "test/slow-sentence",
+            "test/no-bad-words",
+        ]
+
+    def test_exception_discards_pending_runs(self):
+        validators = [NoBadWords(on_fail="exception"), SlowSentence(on_fail="noop")]
+
+        with pytest.raises(ValidationError):
+            validate_stream(validators)
+
+    def test_value_changing_validators_run_in_order(self, mocker):
+        start_spy = mocker.spy(SequentialValidatorService, "start_validator_runs")
+        validators = [NoBadWords(on_fail="custom"), SlowSentence(on_fail="noop")]
+        validators[0].on_fail_method = lambda value, fail_result: "redacted"
+
+        validate_stream(validators)
+
+        assert start_spy.call_count == 0
+
+
+class TestRefrainStopsStream:
+    @pytest.mark.parametrize(
+        "validators",
+        [
+            [NoBadWords(on_fail="refrain")],
+            [NoBadWords(on_fail="refrain"), SlowSentence(on_fail="fix")],
+        ],
+    )
+    def test_refrain_closes_value_stream(self, validators):
+        stream = sentence_stream()
+        iteration = Iteration(call_id="mock-call", index=0)
+
+        results = list(
+            SequentialValidatorService().validate_stream(
+                stream, {}, {"$": validators}, iteration, "$", "$"
+            )
+        )
+
+        assert results[-1].chunk == ""
+        assert stream.gi_frame is None
+        # The sentence after the refrain is never validated.
+        assert all(
+            "Done." not in log.value_before_validation
+            for log in iteration.validator_logs
+        )
@@ -0,0 +1,146 @@
+import asyncio
+import time
+
+import pytest
+
+import guardrails.validator_service as vs
+from guardrails.actions.refrain import Refrain
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.errors import ValidationError
+from guardrails.validator_base import Validator, register_validator
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+from guardrails.validator_service.thread_pool_validator_service import (
+    ThreadPoolValidatorService,
+)
+
+
+@register_validator("test/slow-upper", data_type="string")
+class SlowUpper(Validator):
+    def validate(self, value, metadata):
+        time.sleep(0.3)
+        if value.isupper():
+            return PassResult()
+        return FailResult(error_message="Not upper case.", fix_value=value.upper())
+
+
+@register_validator("test/short", data_type="string")
+class Short(Validator):
+    def validate(self, value, metadata):
+        if len(value) <= 5:
+            return PassResult()
+        return FailResult(error_message="Too long.", fix_value=value[:5])
+
+
+def new_iteration() -> Iteration:
+    return Iteration(call_id="mock-call", index=0)
+
+
+def new_value():
+    return {
+        "name": "alfred",
+        "tags": ["butler", "ok"],
+        "address": {"city": "gotham"},
+    }
+
+
+validator_map = {
+    "$.name": [SlowUpper(on_fail="fix")],
+    "$.tags.*": [SlowUpper(on_fail="fix"), Short(on_fail="noop")],
+    "$.address.city": [SlowUpper(on_fail="fix")],
+}
+
+
+class TestThreadPoolValidatorService:
+    def test_runs_validators_concurrently(self):
+        iteration = new_iteration()
+        service = ThreadPoolValidatorService()
+
+        start = time.perf_counter()
+        value, _ = service.validate(new_value(), {}, validator_map, iteration, "$", "$")
+
+        # Four slow validators run at once instead of back to back.
+        assert time.perf_counter() - start < 0.3 * 4
+        assert len(iteration.validator_logs) == 6
+
+    def test_shares_executors_with_sequential_service(self):
+        executor = ThreadPoolValidatorService().get_executor()
+        timeout_executor = ThreadPoolValidatorService().get_timeout_executor()
+
+        assert SequentialValidatorService().get_executor() is executor
+        assert SequentialValidatorService().get_timeout_executor() is timeout_executor
+        assert "_executor" not in vars(ThreadPoolValidatorService)
+        assert "_timeout_executor" not in vars(ThreadPoolValidatorService)
+
+    def test_matches_sequential_results(self):
+        sequential_value, _ = SequentialValidatorService().validate(
+            new_value(), {}, validator_map, new_iteration(), "$", "$"
+        )
+        value, _ = ThreadPoolValidatorService().validate(
+            new_value(), {}, validator_map, new_iteration(), "$", "$"
+        )
+
+        assert value == sequential_value
+        assert value == {
+            "name": "ALFRED",
+            "tags": ["BUTLER", "OK"],
+            "address": {"city": "GOTHAM"},
+        }
+
+    def test_children_are_validated_before_parents(self):
+        iteration = new_iteration()
+        value, _ = ThreadPoolValidatorService().validate(
+            {"name": "alfred"},
+            {},
+            {"$.name": [SlowUpper(on_fail="fix")], "$": [Short(on_fail="noop")]},
+            iteration,
+            "$",
+            "$",
+        )
+
+        assert value == {"name": "ALFRED"}
+        assert [log.property_path for log in iteration.validator_logs] == [
+            "$.name",
+            "$",
+        ]
+        assert iteration.validator_logs[1].value_before_validation == value
+
+    def test_raises_validation_errors(self):
+        with pytest.raises(ValidationError):
+            ThreadPoolValidatorService().validate(
+                "alfred",
+                {},
+                {"$": [Short(on_fail="exception")]},
+                new_iteration(),
+                "$",
+                "$",
+            )
+
+    def test_refrain(self):
+        value, _ = ThreadPoolValidatorService(short_circuit=True).validate(
+            new_value(),
+            {},
+            {
+                "$.tags.*": [Short(on_fail="refrain")],
+                "$": [SlowUpper(on_fail="noop")],
+            },
+            new_iteration(),
+            "$",
+            "$",
+        )
+
+        assert isinstance(value["tags"][0], Refrain)
+
+    @pytest.mark.asyncio
+    async def test_validates_inside_running_event_loop(self, mocker):
+        mocker.patch("guardrails.validator_service.settings.use_thread_pool", True)
+        validate_spy = mocker.spy(ThreadPoolValidatorService, "validate")
+
+        value, _ = vs.validate(new_value(), {}, validator_map, new_iteration())
+
+        assert validate_spy.call_count == 1
+        assert value["name"] == "ALFRED"
+        # The running loop is left usable.
+        await asyncio.sleep(0)
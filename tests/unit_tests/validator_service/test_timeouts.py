@@ -0,0 +1,212 @@
+import asyncio
+import time
+
+import pytest
+
+from guardrails import Guard
+from guardrails.classes.execution import ValidationTimeouts
+from guardrails.classes.history.iteration import Iteration
+from guardrails.classes.validation.validation_result import FailResult, PassResult
+from guardrails.errors import ValidatorTimeoutError
+from guardrails.settings import settings
+from guardrails.types import OnTimeoutAction
+from guardrails.validator_base import Validator, register_validator
+from guardrails.validator_service.async_validator_service import (
+    AsyncValidatorService,
+)
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+
+
+@register_validator("test/sleepy", data_type="string")
+class Sleepy(Validator):
+    def __init__(self, seconds: float = 5, **kwargs):
+        super().__init__(seconds=seconds, **kwargs)
+        self.seconds = seconds
+
+    def validate(self, value, metadata):
+        time.sleep(self.seconds)
+        return PassResult()
+
+    async def async_validate(self, value, metadata):
+        await asyncio.sleep(self.seconds)
+        return PassResult()
+
+
+@register_validator("test/remote", data_type="string")
+class Remote(Validator):
+    def validate(self, value, metadata):
+        self._hub_inference_request("{}", "https://validator.example.com")
+        return PassResult()
+
+
+def mock_post(mocker):
+    response = mocker.Mock(ok=True)
+    response.json.return_value = {}
+    return mocker.patch("requests.post", return_value=response)
+
+
+def new_iteration() -> Iteration:
+    return Iteration(call_id="mock-call", index=0)
+
+
+class TestValidationTimeouts:
+    def test_validator_timeout_overrides_default(self):
+        timeouts = ValidationTimeouts(timeout=10)
+
+        assert timeouts.timeout_for(Sleepy()) == 10
+        assert timeouts.timeout_for(Sleepy(timeout=1)) == 1
+
+    def test_deadline_bounds_timeout(self):
+        timeouts = ValidationTimeouts(timeout=10).with_deadline(1)
+
+        assert 0 < timeouts.timeout_for(Sleepy()) <= 1
+        assert (
+            ValidationTimeouts(deadline=time.monotonic() - 1).timeout_for(Sleepy()) == 0
+        )
+
+    def test_on_timeout(self):
+        timeouts = ValidationTimeouts(on_timeout=OnTimeoutAction.FAIL)
+
+        assert timeouts.on_timeout_for(Sleepy()) == OnTimeoutAction.FAIL
+        assert timeouts.on_timeout_for(Sleepy(on_timeout="pass")) == (
+            OnTimeoutAction.PASS
+        )
+
+
+class TestSequentialTimeouts:
+    def test_timeout_as_failure(self):
+        iteration = new_iteration()
+        service = SequentialValidatorService()
+        validator = Sleepy(timeout=0.1, on_timeout="fail", on_fail="noop")
+
+        start = time.perf_counter()
+        value, _ = service.validate(
+            "Hello", {}, {"$": [validator]}, iteration, "$", "$"
+        )
+
+        assert time.perf_counter() - start < 2
+        assert value == "Hello"
+        log = iteration.validator_logs[0]
+        assert log.timed_out is True
+        assert isinstance(log.validation_result, FailResult)
+
+    def test_timeout_as_exception(self):
+        iteration = new_iteration()
+        service = SequentialValidatorService(timeouts=ValidationTimeouts(timeout=0.1))
+
+        with pytest.raises(ValidatorTimeoutError):
+            service.validate("Hello", {}, {"$": [Sleepy()]}, iteration, "$", "$")
+
+        log = iteration.validator_logs[0]
+        assert log.timed_out is True
+        assert log.validation_result is None
+        assert log.end_time is not None
+
+    def test_queued_validator_is_cancelled_on_timeout(self, mocker, monkeypatch):
+        monkeypatch.setattr(settings, "thread_pool_size", 1)
+        monkeypatch.setattr(SequentialValidatorService, "_timeout_executor", None)
+        validate_spy = mocker.spy(Sleepy, "validate")
+        iteration = new_iteration()
+        service = SequentialValidatorService()
+        stuck = Sleepy(seconds=0.5, timeout=0.1, on_timeout="fail", on_fail="noop")
+        queued = Sleepy(seconds=0, timeout=0.1, on_timeout="fail", on_fail="noop")
+
+        service.validate("Hello", {}, {"$": [stuck, queued]}, iteration, "$", "$")
+        executor = service.get_timeout_executor()
+        # Wait for the stuck validator to finish, freeing the only worker.
+        executor.submit(lambda: None).result()
+        executor.shutdown()
+
+        assert executor._max_workers == 1
+        assert [log.timed_out for log in iteration.validator_logs] == [True, True]
+        assert validate_spy.call_count == 1
+
+    def test_expired_deadline_skips_validator(self, mocker):
+        validate_spy = mocker.spy(Sleepy, "validate")
+        iteration = new_iteration()
+        service = SequentialValidatorService(
+            timeouts=ValidationTimeouts(
+                on_timeout=OnTimeoutAction.PASS, deadline=time.monotonic()
+            )
+        )
+
+        service.validate("Hello", {}, {"$": [Sleepy()]}, iteration, "$", "$")
+
+        assert validate_spy.call_count == 0
+        assert isinstance(iteration.validator_logs[0].validation_result, PassResult)
+
+
+class TestAsyncTimeouts:
+    @pytest.mark.asyncio
+    async def test_timeout_as_pass(self):
+        iteration = new_iteration()
+        service = AsyncValidatorService(
+            timeouts=ValidationTimeouts(timeout=0.1, on_timeout=OnTimeoutAction.PASS)
+        )
+
+        start = time.perf_counter()
+        value, _ = await service.async_validate(
+            "Hello", {}, {"$": [Sleepy()]}, iteration, "$", "$"
+        )
+
+        assert time.perf_counter() - start < 2
+        assert value == "Hello"
+        log = iteration.validator_logs[0]
+        assert log.timed_out is True
+        assert isinstance(log.validation_result, PassResult)
+
+    @pytest.mark.asyncio
+    async def test_remote_inference_timeout(self, mocker):
+        post = mock_post(mocker)
+        service = AsyncValidatorService(timeouts=ValidationTimeouts(timeout=5))
+
+        await service.async_validate(
+            "Hello", {}, {"$": [Remote()]}, new_iteration(), "$", "$"
+        )
+
+        assert 0 < post.call_args.kwargs["timeout"] <= 5
+
+    @pytest.mark.asyncio
+    async def test_timeout_as_exception(self):
+        iteration = new_iteration()
+        service = AsyncValidatorService()
+
+        with pytest.raises(ValidatorTimeoutError):
+            await service.async_validate(
+                "Hello", {}, {"$": [Sleepy(timeout=0.1)]}, iteration, "$", "$"
+            )
+
+        assert iteration.validator_logs[0].timed_out is True
+
+
+class TestGuardTimeouts:
+    def test_call_deadline(self):
+        guard = Guard().use(Sleepy(on_fail="noop"))
+        guard.configure(on_timeout="fail")
+
+        start = time.perf_counter()
+        outcome = guard.parse("Hello", validation_timeout=0.1)
+
+        assert time.perf_counter() - start < 2
+        assert outcome.validation_passed is False
+        assert guard.history.last.validator_logs[0].timed_out is True
+
+    def test_configured_validator_timeout(self):
+        guard = Guard().use(Sleepy())
+        guard.configure(validator_timeout=0.1)
+
+        with pytest.raises(ValidatorTimeoutError):
+            guard.validate("Hello")
+
+    def test_remote_inference_timeout(self, mocker):
+        post = mock_post(mocker)
+        guard = Guard().use(Remote(timeout=10))
+        guard.configure(validator_timeout=60)
+
+        guard.validate("Hello", validation_timeout=1)
+        assert 0 < post.call_args.kwargs["timeout"] <= 1
+
+        guard.validate("Hello")
+        assert 1 < post.call_args.kwargs["timeout"] <= 10
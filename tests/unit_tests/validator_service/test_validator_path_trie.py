@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from guardrails.classes.history.iteration import Iteration
+from guardrails.validator_base import Validator
+from guardrails.validator_service.async_validator_service import (
+    AsyncValidatorService,
+)
+from guardrails.validator_service.sequential_validator_service import (
+    SequentialValidatorService,
+)
+from guardrails.validator_service.validator_path_trie import ValidatorPathTrie
+
+
+def test_from_validator_map():
+    trie = ValidatorPathTrie.from_validator_map(
+        {
+            "$.name": [MagicMock(spec=Validator)],
+            "$.items.*": [MagicMock(spec=Validator)],
+            "$.unused": [],
+        }
+    )
+
+    root = trie.find("$")
+    assert root is not None
+    assert set(root.children) == {"name", "items"}
+    assert root.find("items").has_item_validators is True
+    assert root.find("name").has_item_validators is False
+    assert trie.find("$.unused") is None
+    assert trie.find("$.name.nested") is None
+
+
+# A large list with a single validator on a top-level field.
+validator_map = {"$.name": [MagicMock(spec=Validator)]}
+value = {"name": "Alfred", "items": [{"id": i} for i in range(10_000)]}
+
+
+def test_sequential_skips_unvalidated_subtrees(mocker):
+    service = SequentialValidatorService()
+    validate_spy = mocker.spy(service, "validate")
+    mocker.patch.object(
+        service, "run_validators", side_effect=lambda *args, **kwargs: (args[2], {})
+    )
+
+    service.validate(
+        value,
+        {},
+        validator_map,
+        Iteration(call_id="mock-call", index=0),
+        "$",
+        "$",
+    )
+
+    visited = [call.args[4] for call in validate_spy.call_args_list]
+    assert visited == ["$", "$.name"]
+
+
+@pytest.mark.asyncio
+async def test_async_skips_unvalidated_subtrees(mocker):
+    service = AsyncValidatorService()
+    validate_spy = mocker.spy(service, "async_validate")
+    mocker.patch.object(
+        service, "run_validators", side_effect=lambda *args, **kwargs: (args[2], {})
+    )
+
+    await service.async_validate(
+        value,
+        {},
+        validator_map,
+        Iteration(call_id="mock-call", index=0),
+        "$",
+        "$",
+    )
+
+    visited = [call.args[4] for call in validate_spy.call_args_list]
+    assert visited == ["$", "$.name"]
@@ -31,6 +31,29 @@ class TestShouldRunSync:
         assert vs.should_run_sync() is False
 
 
+class TestShouldUseThreadPool:
+    def test_set_in_settings(self, mocker):
+        mocker.patch("guardrails.validator_service.settings.use_thread_pool", True)
+        mock_get_env = mocker.patch("guardrails.validator_service.os.environ.get")
+
+        assert vs.should_use_thread_pool() is True
+        mock_get_env.assert_not_called()
+
+    def test_set_in_env(self, mocker):
+        mocker.patch("guardrails.validator_service.settings.use_thread_pool", None)
+        mocker.patch(
+            "guardrails.validator_service.os.environ.get", side_effect=["True"]
+        )
+        assert vs.should_use_thread_pool() is True
+
+    def test_default(self, mocker):
+        mocker.patch("guardrails.validator_service.settings.use_thread_pool", None)
+        mocker.patch(
+            "guardrails.validator_service.os.environ.get", side_effect=["false"]
+        )
+        assert vs.should_use_thread_pool() is False
+
+
 class TestGetLoop:
     def test_get_loop_with_running_loop(self, mocker):
         mocker.patch(
@@ -89,7 +112,9 @@ class TestValidate:
             iteration=iteration,
         )
 
-        vs.SequentialValidatorService.assert_called_once_with(True)
+        vs.SequentialValidatorService.assert_called_once_with(
+            True, short_circuit=False, timeouts=None
+        )
         vs.SequentialValidatorService.return_value.validate.assert_called_once_with(
             True,
             {},
@@ -100,6 +125,35 @@ class TestValidate:
             loop=None,
         )
 
+    def test_validate_with_thread_pool(self, mocker):
+        mocker.patch("guardrails.validator_service.should_run_sync", return_value=False)
+        mocker.patch(
+            "guardrails.validator_service.should_use_thread_pool", return_value=True
+        )
+        mocker.patch("guardrails.validator_service.ThreadPoolValidatorService")
+        mock_get_loop = mocker.patch("guardrails.validator_service.get_loop")
+
+        vs.validate(
+            value=True,
+            metadata={},
+            validator_map={},
+            iteration=iteration,
+        )
+
+        mock_get_loop.assert_not_called()
+        vs.ThreadPoolValidatorService.assert_called_once_with(
+            True, short_circuit=False, timeouts=None
+        )
+        vs.ThreadPoolValidatorService.return_value.validate.assert_called_once_with(
+            True,
+            {},
+            {},
+            iteration,
+            "$",
+            "$",
+            loop=None,
+        )
+
     def test_validate_with_async(self, mocker):
         mocker.patch("guardrails.validator_service.should_run_sync", return_value=False)
         mocker.patch("guardrails.validator_service.SequentialValidatorService")
@@ -114,7 +168,9 @@ class TestValidate:
             iteration=iteration,
         )
 
-        vs.AsyncValidatorService.assert_called_once_with(True)
+        vs.AsyncValidatorService.assert_called_once_with(
+            True, short_circuit=False, timeouts=None
+        )
         vs.AsyncValidatorService.return_value.validate.assert_called_once_with(
             True,
             {},
@@ -143,7 +199,9 @@ class TestValidate:
             "Could not obtain an event loop. Falling back to synchronous validation."
         )
 
-        vs.SequentialValidatorService.assert_called_once_with(True)
+        vs.SequentialValidatorService.assert_called_once_with(
+            True, short_circuit=False, timeouts=None
+        )
         vs.SequentialValidatorService.return_value.validate.assert_called_once_with(
             True,
             {},
@@ -167,7 +225,9 @@ async def test_async_validate(mocker):
         iteration=iteration,
     )
 
-    vs.AsyncValidatorService.assert_called_once_with(True)
+    vs.AsyncValidatorService.assert_called_once_with(
+        True, short_circuit=False, timeouts=None
+    )
     vs.AsyncValidatorService.return_value.async_validate.assert_called_once_with(
         True, {}, {}, iteration, "$", "$", False
     )